@@ -7,13 +7,25 @@ Includes progress tracking, error handling, and resume capability.
 """
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import hashlib
+import heapq
 import json
+import os
+import queue
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
 
 try:
     import pandas as pd
@@ -22,27 +34,169 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
-from lead_enrichment import generate_enrichment_plan
-from lead_qualification import qualify_lead
+try:
+    import openpyxl
 
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
 
-def load_leads_csv(file_path: str) -> list[dict[str, Any]]:
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from checkpoint_log import (
+    CheckpointLog,
+    compact_checkpoint,
+    iter_compacted,
+    read_checkpoint,
+)
+from enrichment_cache import CachedMCPClient, EnrichmentCache, parse_ttl_overrides
+from lead_enrichment import generate_enrichment_plan
+from lead_records import EnrichmentPlan, ICPFit, LeadResult, Scores, as_record
+from lead_table import LEAD_FIELDS, LeadTable, read_table_meta
+from lead_qualification import (
+    DEFAULT_ICP_CRITERIA,
+    CompiledICP,
+    MemoizedICP,
+    MultiICPScorer,
+    compile_icp,
+    load_icp_profiles,
+    qualify_lead,
+)
+from mcp_client import (
+    LocalMCPServer,
+    SingleFlightMCPClient,
+    build_enriched_data,
+    execute_plan,
+    execute_plan_async,
+)
+from quantile_sketch import KLLSketch
+from rescore import parse_percentiles, percentile_thresholds, rescore, tier_counts
+from result_writer import OUTPUT_FORMATS, ResultWriter, infer_format
+from scorer_codegen import GeneratedICP
+from subscore_store import SubscoreWriter
+
+
+# Spreadsheet-style column headers and the lead fields they map to
+COLUMN_ALIASES = {
+    "Company Name": "company_name",
+    "Company": "company_name",
+    "Website": "website",
+    "URL": "website",
+    "LinkedIn": "linkedin_url",
+    "LinkedIn URL": "linkedin_url",
+    "Industry": "industry",
+    "Vertical": "industry",
+    "Contact Name": "contact_name",
+    "Name": "contact_name",
+    "Contact Title": "contact_title",
+    "Title": "contact_title",
+    "Job Title": "contact_title",
+    "Contact LinkedIn": "contact_linkedin",
+    "Notes": "notes",
+}
+
+# Lead fields read from input files; ids are derived from them
+INPUT_FIELDS = tuple(field for field in LEAD_FIELDS if field != "id")
+
+EXCEL_SUFFIXES = (".xlsx", ".xlsm", ".xls")
+
+# Bump when Excel cleaning changes so stale columnar caches are rebuilt
+EXCEL_CACHE_VERSION = 2
+
+# Columnar input formats read with pyarrow
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_IPC_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Lead fields that identify a lead and affect how it is processed.
+# Notes are excluded so annotating a row does not force re-processing.
+FINGERPRINT_FIELDS = (
+    "company_name",
+    "website",
+    "linkedin_url",
+    "industry",
+    "contact_name",
+    "contact_title",
+    "contact_linkedin",
+)
+
+
+def lead_id(lead: dict[str, Any], occurrence: int = 0) -> str:
     """
-    Load leads from CSV file.
+    Build a stable lead ID from a content hash of the lead's fields.
+
+    Unlike row positions, the ID survives rows being inserted, removed or
+    reordered, so checkpoints can be matched across edits to the input.
 
     Args:
-        file_path: Path to CSV file
+        lead: Lead data dictionary
+        occurrence: How many earlier rows of the same input had the same
+            fingerprint (see ``LeadIds``); 0 for the first
 
     Returns:
-        List of lead dictionaries
+        ID of the form ``lead_<16 hex chars>``
+    """
+    parts = [
+        (lead.get(field) or "").strip().lower() for field in FINGERPRINT_FIELDS
+    ]
+    if occurrence:
+        parts.append(f"#{occurrence}")
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"lead_{digest[:16]}"
+
+
+class LeadIds:
+    """
+    Assigns lead IDs that are unique within one input file.
+
+    Rows with the same fingerprint (exact duplicates, or rows that differ
+    only in their notes) are numbered in file order, so each gets its own
+    checkpoint record; the first keeps the plain content-hash ID.
     """
-    leads = []
 
-    with open(file_path, encoding="utf-8") as f:
+    def __init__(self):
+        self._seen: dict[str, int] = {}
+
+    def assign(self, lead: dict[str, Any]) -> str:
+        """
+        Set and return the ID of the next lead read from the input.
+
+        Args:
+            lead: Lead data dictionary
+
+        Returns:
+            ID of the form ``lead_<16 hex chars>``
+        """
+        base = lead_id(lead)
+        occurrence = self._seen.get(base, 0)
+        self._seen[base] = occurrence + 1
+        lead["id"] = lead_id(lead, occurrence) if occurrence else base
+        return lead["id"]
+
+
+def iter_leads_csv(file_path: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream leads from a CSV file one row at a time.
+
+    Rows are parsed lazily, so memory use does not depend on file size.
+
+    Args:
+        file_path: Path to CSV file
+
+    Yields:
+        Lead dictionaries
+    """
+    ids = LeadIds()
+    with open(file_path, encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
-        for idx, row in enumerate(reader):
+        for row in reader:
             lead = {
-                "id": f"lead_{idx + 1}",
+                "id": None,
                 "company_name": row.get("company_name", "").strip(),
                 "website": row.get("website", "").strip() or None,
                 "linkedin_url": row.get("linkedin_url", "").strip() or None,
@@ -53,303 +207,1364 @@ def load_leads_csv(file_path: str) -> list[dict[str, Any]]:
                 "notes": row.get("notes", "").strip() or None,
             }
 
-            # Only add if company name exists
+            # Only yield if company name exists
             if lead["company_name"]:
-                leads.append(lead)
+                ids.assign(lead)
+                yield lead
 
-    return leads
+
+def load_leads_csv(file_path: str) -> LeadTable:
+    """
+    Load leads from CSV file.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        LeadTable of leads (iterating it yields lead dictionaries)
+    """
+    return LeadTable.from_leads(iter_leads_csv(file_path))
 
 
-def load_leads_excel(file_path: str) -> list[dict[str, Any]]:
+def resolve_columns(names: Iterable[Any]) -> dict[str, int]:
     """
-    Load leads from Excel file using pandas.
+    Map input columns to lead fields, once per file.
 
     Args:
-        file_path: Path to Excel file
+        names: Column headers in file order (spreadsheet-style headers
+            such as "Company Name" are accepted, see ``COLUMN_ALIASES``)
+
+    Returns:
+        Lead field -> index of the first column that maps to it
+    """
+    columns: dict[str, int] = {}
+    for i, name in enumerate(names):
+        name = str(name).strip() if name is not None else ""
+        field = COLUMN_ALIASES.get(name, name)
+        if field in INPUT_FIELDS and field not in columns:
+            columns[field] = i
+    return columns
+
+
+def clean_lead(values: Iterable[Any], ids: Optional[LeadIds] = None) -> Optional[dict[str, Any]]:
+    """
+    Build a lead from raw cell values, cleaned the same way as CSV rows.
+
+    Args:
+        values: One value per field in ``INPUT_FIELDS`` order
+        ids: ID assigner of the input file the row comes from (default:
+            plain content-hash IDs)
 
     Returns:
-        List of lead dictionaries
+        Lead dictionary with its id, or None if it has no company name
+    """
+    lead = {"id": None}
+    for field, value in zip(INPUT_FIELDS, values):
+        lead[field] = (str(value).strip() if value is not None else "") or None
+    if not lead["company_name"]:
+        return None
+    if ids is None:
+        lead["id"] = lead_id(lead)
+    else:
+        ids.assign(lead)
+    return lead
+
+
+def iter_leads_excel(file_path: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream leads from the first sheet of an Excel workbook.
+
+    ``.xlsx``/``.xlsm`` files are read row by row with openpyxl's
+    read-only mode, so memory use does not depend on sheet size; legacy
+    ``.xls`` files go through pandas.
+
+    Args:
+        file_path: Path to Excel file
+
+    Yields:
+        Lead dictionaries
     """
+    if Path(file_path).suffix.lower() == ".xls":
+        yield from _iter_leads_dataframe(file_path)
+        return
+
+    if not HAS_OPENPYXL:
+        raise ImportError(
+            "openpyxl is required to read Excel files. Install with: pip install openpyxl"
+        )
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        columns = resolve_columns(next(rows, ()))
+        indexes = [columns.get(field) for field in INPUT_FIELDS]
+        ids = LeadIds()
+        for row in rows:
+            width = len(row)
+            lead = clean_lead(
+                (row[i] if i is not None and i < width else None for i in indexes), ids
+            )
+            if lead:
+                yield lead
+    finally:
+        workbook.close()
+
+
+def _iter_leads_dataframe(file_path: str) -> Iterator[dict[str, Any]]:
+    # Legacy .xls: whole-sheet DataFrame, converted column by column
     if not HAS_PANDAS:
         raise ImportError(
-            "pandas is required to read Excel files. Install with: pip install pandas openpyxl"
+            "pandas is required to read .xls files. Install with: pip install pandas xlrd"
         )
 
     df = pd.read_excel(file_path)
+    df = df.astype(object).where(df.notna(), None)
+    names = list(df.columns)
+    columns = resolve_columns(names)
+    values = [
+        df[names[columns[field]]].tolist() if field in columns else [None] * len(df)
+        for field in INPUT_FIELDS
+    ]
+    ids = LeadIds()
+    for row in zip(*values):
+        lead = clean_lead(row, ids)
+        if lead:
+            yield lead
 
-    # Rename columns to standard format if needed
-    column_mapping = {
-        "Company Name": "company_name",
-        "Company": "company_name",
-        "Website": "website",
-        "URL": "website",
-        "LinkedIn": "linkedin_url",
-        "LinkedIn URL": "linkedin_url",
-        "Industry": "industry",
-        "Vertical": "industry",
-        "Contact Name": "contact_name",
-        "Name": "contact_name",
-        "Contact Title": "contact_title",
-        "Title": "contact_title",
-        "Job Title": "contact_title",
-        "Contact LinkedIn": "contact_linkedin",
-        "Notes": "notes",
-    }
 
-    df = df.rename(columns=column_mapping)
-
-    leads = []
-    for idx, row in df.iterrows():
-        lead = {
-            "id": f"lead_{idx + 1}",
-            "company_name": str(row.get("company_name", "")).strip(),
-            "website": str(row.get("website", "")).strip() or None,
-            "linkedin_url": str(row.get("linkedin_url", "")).strip() or None,
-            "industry": str(row.get("industry", "")).strip() or None,
-            "contact_name": str(row.get("contact_name", "")).strip() or None,
-            "contact_title": str(row.get("contact_title", "")).strip() or None,
-            "contact_linkedin": str(row.get("contact_linkedin", "")).strip() or None,
-            "notes": str(row.get("notes", "")).strip() or None,
-        }
+def excel_cache_path(file_path: str) -> str:
+    """Path of the columnar lead cache kept next to an Excel file."""
+    return f"{file_path}.leadtable"
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_leads_excel(file_path: str, use_cache: bool = True) -> LeadTable:
+    """
+    Load leads from Excel file.
 
-        # Clean up 'nan' strings from pandas
-        for key in lead:
-            if lead[key] == "nan":
-                lead[key] = None
+    The first load converts the workbook into a columnar LeadTable file
+    next to it (``excel_cache_path``). Later loads read that file instead
+    of parsing the workbook, as long as the workbook's mtime and size, or
+    failing that its content hash, still match.
 
-        # Only add if company name exists
-        if lead["company_name"] and lead["company_name"] != "nan":
-            leads.append(lead)
+    Args:
+        file_path: Path to Excel file
+        use_cache: Read and write the columnar cache
+
+    Returns:
+        LeadTable of leads (iterating it yields lead dictionaries)
+    """
+    cache_path = excel_cache_path(file_path)
+    stat = os.stat(file_path)
+    source = {
+        "version": EXCEL_CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+    digest = None
 
+    if use_cache and os.path.exists(cache_path):
+        try:
+            meta = read_table_meta(cache_path)
+            if all(meta.get(key) == value for key, value in source.items()):
+                return LeadTable.load(cache_path)
+            if meta.get("version") == EXCEL_CACHE_VERSION and meta.get("size") == stat.st_size:
+                # Touched but possibly unchanged: compare contents
+                digest = file_digest(file_path)
+                if meta.get("sha256") == digest:
+                    leads = LeadTable.load(cache_path)
+                    leads.save(cache_path, {**source, "sha256": digest})
+                    return leads
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable Excel cache {cache_path} ({e})")
+
+    if use_cache and digest is None:
+        digest = file_digest(file_path)
+    leads = LeadTable.from_leads(iter_leads_excel(file_path))
+    if use_cache:
+        try:
+            leads.save(cache_path, {**source, "sha256": digest})
+        except OSError as e:
+            print(f"Warning: Could not write Excel cache {cache_path} ({e})")
     return leads
 
 
-def validate_leads(leads: list[dict[str, Any]]) -> dict[str, Any]:
+def iter_record_batches(file_path: str, batch_size: int = 65_536) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream record batches from a Parquet or Arrow IPC file.
+
+    Files are memory-mapped; Arrow IPC batches are read without copying.
+    Only columns that map to lead fields are decoded.
+
+    Args:
+        file_path: Path to a ``.parquet`` or ``.arrow``/``.feather`` file
+        batch_size: Rows per Parquet batch (IPC files keep their own batches)
+
+    Yields:
+        Record batches with columns renamed to lead fields
+    """
+    if not HAS_PYARROW:
+        raise ImportError(
+            "pyarrow is required to read Parquet/Arrow files. Install with: pip install pyarrow"
+        )
+
+    if Path(file_path).suffix.lower() in PARQUET_SUFFIXES:
+        parquet = pq.ParquetFile(file_path, memory_map=True)
+        names = parquet.schema_arrow.names
+        columns = resolve_columns(names)
+        for batch in parquet.iter_batches(
+            batch_size, columns=[names[i] for i in columns.values()]
+        ):
+            yield batch.rename_columns(list(columns))
+        return
+
+    source = pa.memory_map(file_path)
+    try:
+        reader = pa.ipc.open_file(source)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        # Not the IPC file format; fall back to the streaming format
+        source.seek(0)
+        reader = pa.ipc.open_stream(source)
+        batches = iter(reader)
+    columns = resolve_columns(reader.schema.names)
+    for batch in batches:
+        yield batch.select(list(columns.values())).rename_columns(list(columns))
+
+
+def iter_leads_arrow(file_path: str, batch_size: int = 65_536) -> Iterator[dict[str, Any]]:
+    """
+    Stream leads from a Parquet or Arrow IPC file one record batch at a time.
+
+    Each batch is converted column by column; values are cleaned the same
+    way as CSV rows.
+
+    Args:
+        file_path: Path to a ``.parquet`` or ``.arrow``/``.feather`` file
+        batch_size: Rows per Parquet batch
+
+    Yields:
+        Lead dictionaries
+    """
+    ids = LeadIds()
+    for batch in iter_record_batches(file_path, batch_size):
+        names = batch.schema.names
+        columns = [
+            batch.column(names.index(field)).to_pylist()
+            if field in names
+            else [None] * batch.num_rows
+            for field in INPUT_FIELDS
+        ]
+        for values in zip(*columns):
+            lead = clean_lead(values, ids)
+            if lead:
+                yield lead
+
+
+def load_leads_arrow(file_path: str) -> LeadTable:
+    """
+    Load leads from a Parquet or Arrow IPC file.
+
+    Args:
+        file_path: Path to a ``.parquet`` or ``.arrow``/``.feather`` file
+
+    Returns:
+        LeadTable of leads (iterating it yields lead dictionaries)
+    """
+    return LeadTable.from_leads(iter_leads_arrow(file_path))
+
+
+def validate_leads(leads: Union[LeadTable, Iterable[dict[str, Any]]]) -> dict[str, Any]:
     """
     Validate lead data quality.
 
+    Completeness is counted column by column on a LeadTable; other
+    iterables of lead dictionaries are converted first.
+
     Args:
-        leads: List of lead dictionaries
+        leads: LeadTable or list of lead dictionaries
 
     Returns:
         Validation report
     """
-    report = {
-        "total_leads": len(leads),
-        "valid_leads": 0,
-        "issues": [],
-        "data_quality": {},
-    }
+    if not isinstance(leads, LeadTable):
+        leads = LeadTable.from_leads(leads)
 
-    has_website = 0
-    has_linkedin = 0
-    has_industry = 0
-    has_contact = 0
+    total = len(leads)
+    ids = leads.column("id")
+    missing_name = [
+        i for i, present in enumerate(leads.column("company_name").present()) if not present
+    ]
+    has_contact = sum(
+        map(
+            bool.__or__,
+            leads.column("contact_name").present(),
+            leads.column("contact_title").present(),
+        )
+    )
 
-    for lead in leads:
-        is_valid = True
+    # Calculate data quality percentages
+    return {
+        "total_leads": total,
+        "valid_leads": total - len(missing_name),
+        "issues": [
+            f"Lead {ids[i] if ids[i] is not None else 'unknown'}: Missing company name"
+            for i in missing_name
+        ],
+        "data_quality": {
+            "has_website": f"{(leads.non_null('website') / total * 100):.1f}%",
+            "has_linkedin": f"{(leads.non_null('linkedin_url') / total * 100):.1f}%",
+            "has_industry": f"{(leads.non_null('industry') / total * 100):.1f}%",
+            "has_contact_info": f"{(has_contact / total * 100):.1f}%",
+        },
+    }
 
-        # Check required field
-        if not lead.get("company_name"):
-            report["issues"].append(
-                f"Lead {lead.get('id', 'unknown')}: Missing company name"
-            )
-            is_valid = False
 
-        # Track data completeness
-        if lead.get("website"):
-            has_website += 1
-        if lead.get("linkedin_url"):
-            has_linkedin += 1
-        if lead.get("industry"):
-            has_industry += 1
-        if lead.get("contact_name") or lead.get("contact_title"):
-            has_contact += 1
+def mock_enriched_data(lead: dict[str, Any]) -> dict[str, Any]:
+    """
+    Simulated enrichment result used when no MCP client is configured.
 
-        if is_valid:
-            report["valid_leads"] += 1
+    Args:
+        lead: Lead data dictionary
 
-    # Calculate data quality percentages
-    total = len(leads)
-    report["data_quality"] = {
-        "has_website": f"{(has_website / total * 100):.1f}%",
-        "has_linkedin": f"{(has_linkedin / total * 100):.1f}%",
-        "has_industry": f"{(has_industry / total * 100):.1f}%",
-        "has_contact_info": f"{(has_contact / total * 100):.1f}%",
+    Returns:
+        Company data dictionary for qualify_lead
+    """
+    return {
+        "company_name": lead["company_name"],
+        "employee_count": 150,  # Mock data
+        "revenue": 5_000_000,  # Mock data
+        "industry": lead.get("industry", "Technology"),
+        "location": "North America",
+        "technologies": ["AWS", "React", "Python"],
+        "has_api": True,
+        "uses_cloud": True,
+        "growth_signals": {"hiring_actively": True, "recent_funding": False},
+        "buying_intent": {"job_postings_relevant": True},
+        "engagement": {"active_social_media": True},
+        "deal_factors": {"authority_access": True},
+        "competitive": {"weak_incumbent": True},
     }
 
-    return report
+
+def _qualify_into(
+    result: LeadResult,
+    enriched_data: dict[str, Any],
+    icp_criteria: Optional[Union[dict, CompiledICP, MultiICPScorer]],
+) -> None:
+    """Store the qualification (and best-fit ICP when multi-profile) in result."""
+    if isinstance(icp_criteria, MultiICPScorer):
+        qualification, fit = icp_criteria.qualify(enriched_data)
+        result.icp_fit = ICPFit.from_dict(fit, icp_criteria.names)
+    else:
+        qualification = qualify_lead(enriched_data, icp_criteria)
+    result.qualification = Scores.from_dict(qualification)
+
+
+def _processed_at() -> str:
+    # Leads finished in the same second share one string
+    return sys.intern(time.strftime("%Y-%m-%d %H:%M:%S"))
 
 
 def process_single_lead(
-    lead: dict[str, Any], icp_criteria: Optional[dict] = None
-) -> dict[str, Any]:
+    lead: dict[str, Any],
+    icp_criteria: Optional[Union[dict, CompiledICP, MultiICPScorer]] = None,
+    mcp_client: Optional[Any] = None,
+) -> LeadResult:
     """
     Process a single lead: generate enrichment plan and qualify.
 
     Args:
         lead: Lead data dictionary
-        icp_criteria: Optional ICP criteria for qualification
+        icp_criteria: Optional ICP criteria (dict, CompiledICP or
+            MultiICPScorer)
+        mcp_client: Optional blocking MCP client (``call_tool``) used to
+            execute the enrichment plan; mock data is used when omitted
 
     Returns:
-        Processed lead with enrichment plan and scores
+        Processed lead with enrichment plan and scores, as a compact
+        LeadResult (readable like the result dict, e.g. ``result["status"]``;
+        ``to_dict()`` gives the output JSON shape)
     """
-    result = lead.copy()
+    result = LeadResult(lead)
 
     try:
         # Generate enrichment plan
         enrichment_plan = generate_enrichment_plan(lead)
-        result["enrichment_plan"] = enrichment_plan
-
-        # Simulate enriched data for qualification
-        # In production, this would call actual Bright Data MCP tools
-        mock_enriched_data = {
-            "company_name": lead["company_name"],
-            "employee_count": 150,  # Mock data
-            "revenue": 5_000_000,  # Mock data
-            "industry": lead.get("industry", "Technology"),
-            "location": "North America",
-            "technologies": ["AWS", "React", "Python"],
-            "has_api": True,
-            "uses_cloud": True,
-            "growth_signals": {"hiring_actively": True, "recent_funding": False},
-            "buying_intent": {"job_postings_relevant": True},
-            "engagement": {"active_social_media": True},
-            "deal_factors": {"authority_access": True},
-            "competitive": {"weak_incumbent": True},
-        }
+        result.plan = EnrichmentPlan.from_dict(enrichment_plan)
+
+        if mcp_client is not None:
+            responses = execute_plan(enrichment_plan, mcp_client)
+            enriched_data = build_enriched_data(lead, responses)
+        else:
+            # In production, this would call actual Bright Data MCP tools
+            enriched_data = mock_enriched_data(lead)
 
         # Qualify the lead
-        scores = qualify_lead(mock_enriched_data, icp_criteria)
-        result["qualification"] = scores
+        _qualify_into(result, enriched_data, icp_criteria)
 
-        result["status"] = "success"
-        result["processed_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        result.status = "success"
+        result.processed_at = _processed_at()
 
     except Exception as e:
-        result["status"] = "error"
-        result["error"] = str(e)
-        result["processed_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        result.status = "error"
+        result.error = str(e)
+        result.processed_at = _processed_at()
 
     return result
 
 
+async def process_single_lead_async(
+    lead: dict[str, Any],
+    icp_criteria: Optional[Union[dict, CompiledICP, MultiICPScorer]] = None,
+    mcp_client: Optional[Any] = None,
+    slot: Optional[Callable[[], Any]] = None,
+) -> LeadResult:
+    """
+    Async variant of process_single_lead for I/O-bound MCP enrichment.
+
+    The plan's tool calls run concurrently; ``slot`` caps how many calls
+    are outstanding across the whole batch.
+
+    Args:
+        lead: Lead data dictionary
+        icp_criteria: Optional ICP criteria (dict, CompiledICP or
+            MultiICPScorer)
+        mcp_client: Optional async MCP client (``acall_tool``); mock data is
+            used when omitted
+        slot: Optional factory for the concurrency-limiting context manager
+
+    Returns:
+        Processed lead as a LeadResult
+    """
+    result = LeadResult(lead)
+
+    try:
+        enrichment_plan = generate_enrichment_plan(lead)
+        result.plan = EnrichmentPlan.from_dict(enrichment_plan)
+
+        if mcp_client is not None:
+            responses = await execute_plan_async(enrichment_plan, mcp_client, slot)
+            enriched_data = build_enriched_data(lead, responses)
+        else:
+            enriched_data = mock_enriched_data(lead)
+
+        _qualify_into(result, enriched_data, icp_criteria)
+        result.status = "success"
+        result.processed_at = _processed_at()
+
+    except Exception as e:
+        result.status = "error"
+        result.error = str(e)
+        result.processed_at = _processed_at()
+
+    return result
+
+
+EXECUTOR_KINDS = ("thread", "process", "async")
+
+
+class SubmissionWindow:
+    """
+    Sliding-window scheduler that applies backpressure to an executor.
+
+    Only ``max_in_flight`` tasks are outstanding at any time (default:
+    ``window_factor`` x workers). Input is pulled lazily and the window is
+    refilled as tasks complete, so neither futures nor input items pile up.
+    Counters are exposed through :meth:`stats` to show saturation.
+
+    With ``executor="process"`` tasks run in a ProcessPoolExecutor. Worker
+    start times are not visible across processes there, so in-flight is
+    estimated as ``min(outstanding, workers)``.
+    """
+
+    def __init__(
+        self,
+        workers: int = 3,
+        window_factor: int = 4,
+        max_in_flight: Optional[int] = None,
+        executor: str = "thread",
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: tuple = (),
+    ):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor: {executor}")
+
+        self.workers = max(workers, 1)
+        if max_in_flight is None:
+            max_in_flight = self.workers * window_factor
+        self.max_in_flight = max(max_in_flight, 1)
+        self.executor = executor
+        self.initializer = initializer
+        self.initargs = initargs
+
+        self._lock = threading.Lock()
+        self._running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.peak_running = 0
+        self.peak_queued = 0
+
+    def _track(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+            self.peak_running = max(self.peak_running, self._running)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of the window state.
+
+        Returns:
+            Dictionary with in_flight (executing), queued (submitted but
+            waiting for a worker), completed, submitted, window size and
+            observed peaks
+        """
+        with self._lock:
+            outstanding = self.submitted - self.completed
+            running = (
+                min(outstanding, self.workers)
+                if self.executor == "process"
+                else self._running
+            )
+            return {
+                "in_flight": running,
+                "queued": max(outstanding - running, 0),
+                "completed": self.completed,
+                "submitted": self.submitted,
+                "window": self.max_in_flight,
+                "peak_in_flight": self.peak_running,
+                "peak_queued": self.peak_queued,
+            }
+
+    def map(
+        self, fn: Callable[..., Any], items: Iterable[Any], *args: Any
+    ) -> Iterator[Any]:
+        """
+        Apply ``fn(item, *args)`` to every item, yielding in completion order.
+
+        Args:
+            fn: Function to run in the worker pool
+            items: Iterable of inputs (may be a generator)
+            *args: Extra positional arguments passed to every call
+
+        Yields:
+            Results of ``fn`` as tasks complete
+        """
+        item_iter = iter(items)
+        exhausted = False
+
+        if self.executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        else:
+            pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+
+        with pool as executor:
+            pending = set()
+
+            def refill() -> None:
+                nonlocal exhausted
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        item = next(item_iter)
+                    except StopIteration:
+                        exhausted = True
+                        return
+                    if self.executor == "process":
+                        pending.add(executor.submit(fn, item, *args))
+                    else:
+                        pending.add(executor.submit(self._track, fn, item, *args))
+                    with self._lock:
+                        self.submitted += 1
+                        outstanding = self.submitted - self.completed
+                        if self.executor == "process":
+                            self.peak_running = max(
+                                self.peak_running, min(outstanding, self.workers)
+                            )
+                            queued = outstanding - min(outstanding, self.workers)
+                        else:
+                            queued = outstanding - self._running
+                        self.peak_queued = max(self.peak_queued, queued)
+
+            refill()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                with self._lock:
+                    self.completed += len(done)
+                # Top up before yielding so workers stay busy while the
+                # caller handles results
+                refill()
+                for future in done:
+                    yield future.result()
+
+
+class AsyncSubmissionWindow:
+    """
+    Asyncio counterpart of SubmissionWindow for I/O-bound enrichment.
+
+    Coroutines run on an event loop in a background thread. Up to
+    ``max_in_flight`` lead coroutines are alive at once, and a semaphore of
+    ``workers`` slots caps concurrent MCP tool calls across all of them.
+    Results come back through a bounded queue, so callers get the same
+    iterator interface as the thread and process executors. In
+    :meth:`stats`, in_flight counts tool calls holding a slot and queued
+    counts calls waiting for one.
+    """
+
+    executor = "async"
+
+    def __init__(
+        self,
+        workers: int = 100,
+        window_factor: int = 4,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.workers = max(workers, 1)
+        if max_in_flight is None:
+            max_in_flight = self.workers * window_factor
+        self.max_in_flight = max(max_in_flight, 1)
+
+        self._lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._running = 0
+        self._waiting = 0
+        self.submitted = 0
+        self.completed = 0
+        self.peak_running = 0
+        self.peak_queued = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the window's concurrency slots."""
+        with self._lock:
+            self._waiting += 1
+            self.peak_queued = max(self.peak_queued, self._waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        with self._lock:
+            self._running += 1
+            self.peak_running = max(self.peak_running, self._running)
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of the window state.
+
+        Returns:
+            Dictionary with in_flight, queued, completed, submitted, window
+            size and observed peaks
+        """
+        with self._lock:
+            return {
+                "in_flight": self._running,
+                "queued": self._waiting,
+                "completed": self.completed,
+                "submitted": self.submitted,
+                "window": self.max_in_flight,
+                "peak_in_flight": self.peak_running,
+                "peak_queued": self.peak_queued,
+            }
+
+    def map(
+        self, fn: Callable[..., Any], items: Iterable[Any], *args: Any
+    ) -> Iterator[Any]:
+        """
+        Run ``fn(item, *args, slot)`` coroutines, yielding in completion order.
+
+        Args:
+            fn: Coroutine function; receives :meth:`slot` as its last argument
+            items: Iterable of inputs (may be a generator)
+            *args: Extra positional arguments passed to every call
+
+        Yields:
+            Results of ``fn`` as coroutines complete
+        """
+        results: queue.Queue = queue.Queue(maxsize=self.max_in_flight)
+        stop = threading.Event()
+
+        def put_blocking(entry: tuple[str, Any]) -> None:
+            while not stop.is_set():
+                try:
+                    results.put(entry, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        async def put(entry: tuple[str, Any]) -> None:
+            while not stop.is_set():
+                try:
+                    results.put_nowait(entry)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(0.001)
+
+        async def produce() -> None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+            item_iter = iter(items)
+            exhausted = False
+            pending = set()
+
+            try:
+                while True:
+                    while (
+                        not exhausted
+                        and not stop.is_set()
+                        and len(pending) < self.max_in_flight
+                    ):
+                        try:
+                            item = next(item_iter)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        pending.add(asyncio.ensure_future(fn(item, *args, self.slot)))
+                        with self._lock:
+                            self.submitted += 1
+
+                    if not pending or stop.is_set():
+                        return
+
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    with self._lock:
+                        self.completed += len(done)
+                    for task in done:
+                        await put(("result", task.result()))
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        def run() -> None:
+            try:
+                asyncio.run(produce())
+            except BaseException as e:
+                put_blocking(("error", e))
+            else:
+                put_blocking(("done", None))
+
+        thread = threading.Thread(target=run, name="async-enrichment", daemon=True)
+        thread.start()
+        try:
+            while True:
+                kind, value = results.get()
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            stop.set()
+            thread.join()
+
+
+# Per-process compiled ICP, set once by _init_process_worker
+_WORKER_ICP_CRITERIA: Optional[CompiledICP] = None
+
+
+def _init_process_worker(icp_criteria: Optional[CompiledICP]) -> None:
+    """Initialize a worker process with the ICP criteria for the run."""
+    global _WORKER_ICP_CRITERIA
+    _WORKER_ICP_CRITERIA = icp_criteria
+
+
+def _process_chunk(chunk: Union[LeadTable, list[dict[str, Any]]]) -> list[LeadResult]:
+    """Process a chunk of leads inside a worker process."""
+    return [process_single_lead(lead, _WORKER_ICP_CRITERIA) for lead in chunk]
+
+
+def _chunked(
+    items: Iterable[dict[str, Any]], size: int
+) -> Iterator[Union[LeadTable, list[dict[str, Any]]]]:
+    """
+    Group an iterable into lists of at most ``size`` items.
+
+    A LeadTable is split into row slices instead, which pickle as a few
+    column buffers rather than one dict per lead.
+    """
+    if isinstance(items, LeadTable):
+        for start in range(0, len(items), size):
+            yield items.slice(start, start + size)
+        return
+
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def make_window(
+    parallel: int = 3,
+    window_factor: int = 4,
+    max_in_flight: Optional[int] = None,
+    executor: str = "thread",
+    icp_criteria: Optional[dict] = None,
+) -> Any:
+    """
+    Build the submission window for a batch run.
+
+    In process mode, each worker receives the compiled ICP once through
+    its initializer instead of with every task. In async mode ``parallel``
+    is the number of concurrent MCP tool calls.
+
+    Args:
+        parallel: Number of workers (or concurrent calls in async mode)
+        window_factor: Outstanding tasks allowed per worker
+        max_in_flight: Absolute cap on outstanding tasks
+        executor: "thread", "process" or "async"
+        icp_criteria: Optional ICP criteria
+
+    Returns:
+        Configured SubmissionWindow or AsyncSubmissionWindow
+    """
+    if executor == "async":
+        return AsyncSubmissionWindow(parallel, window_factor, max_in_flight)
+    if executor == "process":
+        return SubmissionWindow(
+            parallel,
+            window_factor,
+            max_in_flight,
+            executor="process",
+            initializer=_init_process_worker,
+            initargs=(compile_icp(icp_criteria),),
+        )
+    return SubmissionWindow(parallel, window_factor, max_in_flight)
+
+
+def iter_process_batch(
+    leads: Iterable[dict[str, Any]],
+    parallel: int = 3,
+    icp_criteria: Optional[dict] = None,
+    max_in_flight: Optional[int] = None,
+    window: Optional[Any] = None,
+    executor: str = "thread",
+    chunk_size: int = 64,
+    mcp_client: Optional[Any] = None,
+) -> Iterator[LeadResult]:
+    """
+    Process leads from any iterable, yielding results as they complete.
+
+    At most ``max_in_flight`` tasks are held by the executor at any time;
+    new leads are only read once running tasks finish. Memory therefore
+    stays flat regardless of input size.
+
+    Args:
+        leads: Iterable of lead dictionaries (may be a generator)
+        parallel: Number of parallel workers
+        icp_criteria: Optional ICP criteria
+        max_in_flight: Maximum tasks submitted but not yet yielded
+            (default: 4 x parallel)
+        window: Optional pre-built SubmissionWindow, e.g. to read its stats
+            while iterating (overrides parallel, max_in_flight and executor)
+        executor: "thread"; "process" to run CPU-bound scoring in worker
+            processes, shipping leads in chunks of ``chunk_size``; or
+            "async" to run MCP tool calls on an event loop
+        chunk_size: Leads per task in process mode
+        mcp_client: Optional MCP client used to execute enrichment plans
+            (thread and async modes only)
+
+    Yields:
+        Processed leads (LeadResult records) in completion order
+    """
+    icp_criteria = compile_icp(icp_criteria)
+    if window is None:
+        window = make_window(
+            parallel,
+            max_in_flight=max_in_flight,
+            executor=executor,
+            icp_criteria=icp_criteria,
+        )
+
+    if window.executor == "process":
+        if mcp_client is not None:
+            raise ValueError("MCP clients are not supported with the process executor")
+        for chunk_results in window.map(_process_chunk, _chunked(leads, chunk_size)):
+            yield from chunk_results
+    elif window.executor == "async":
+        yield from window.map(process_single_lead_async, leads, icp_criteria, mcp_client)
+    else:
+        yield from window.map(process_single_lead, leads, icp_criteria, mcp_client)
+
+
+def load_completed_ids(progress_file: str) -> set[str]:
+    """
+    Read a checkpoint log and collect IDs of leads that already succeeded.
+
+    Only the latest record per lead counts, so a lead that failed and was
+    later retried successfully is treated as done, and vice versa.
+
+    Args:
+        progress_file: Path to JSONL checkpoint log
+
+    Returns:
+        Set of lead IDs whose latest record has status "success"
+    """
+    completed = set()
+    for record in read_checkpoint(progress_file):
+        if record.get("status") == "success":
+            completed.add(record.get("id"))
+        else:
+            completed.discard(record.get("id"))
+    return completed
+
+
 def process_batch(
-    leads: list[dict[str, Any]],
+    leads: Iterable[dict[str, Any]],
     parallel: int = 3,
     icp_criteria: Optional[dict] = None,
     progress_file: Optional[str] = None,
-) -> list[dict[str, Any]]:
+    max_in_flight: Optional[int] = None,
+    window_factor: int = 4,
+    resume: bool = False,
+    result_writer: Optional[ResultWriter] = None,
+    accumulator: Optional["SummaryAccumulator"] = None,
+    executor: str = "thread",
+    chunk_size: int = 64,
+    mcp_client: Optional[Any] = None,
+    subscore_writer: Optional[SubscoreWriter] = None,
+    collect_results: bool = True,
+) -> list[LeadResult]:
     """
     Process multiple leads with parallel execution.
 
     Args:
-        leads: List of lead dictionaries
+        leads: LeadTable or list of lead dictionaries, or any iterator of
+            leads for streaming input
         parallel: Number of parallel workers
         icp_criteria: Optional ICP criteria
-        progress_file: Optional file to save progress
+        progress_file: Optional JSONL checkpoint log; one record is appended
+            per completed lead
+        max_in_flight: Maximum leads in flight at once
+            (default: window_factor x parallel)
+        window_factor: Outstanding tasks allowed per worker
+        resume: Append to an existing progress_file and skip leads it
+            already records as successful
+        result_writer: Optional writer that streams each result to the
+            output file. When given, results are not kept in memory.
+        accumulator: Optional SummaryAccumulator updated with each result
+        executor: "thread", "process" (CPU-bound scoring in worker
+            processes; the window then counts chunks of chunk_size leads) or
+            "async" (parallel is then the number of concurrent MCP calls)
+        chunk_size: Leads per task in process mode
+        mcp_client: Optional MCP client used to execute enrichment plans
+        subscore_writer: Optional SubscoreWriter storing each lead's raw
+            sub-scores for later re-scoring
+        collect_results: Keep results in memory and return them. Turn off
+            when the checkpoint log is the record of results (e.g. resumed
+            runs, which compact it into the output afterwards).
 
     Returns:
-        List of processed leads
+        List of LeadResult records processed in this run (skipped leads
+        are not included). Records read like result dicts; convert them
+        with ``to_dict()`` before ``json.dump``.
+        Empty when a result_writer is given or collect_results is off; use
+        an accumulator to summarize such runs.
     """
     results = []
-    total = len(leads)
 
-    print(f"\n🚀 Processing {total} leads with {parallel} parallel workers...")
+    if resume and progress_file and Path(progress_file).exists():
+        done_ids = load_completed_ids(progress_file)
+        print(f"\n↩️  Resuming: {len(done_ids)} leads already completed in {progress_file}")
+        if hasattr(leads, "__len__"):
+            before = len(leads)
+            if isinstance(leads, LeadTable):
+                leads = leads.take(
+                    i for i, value in enumerate(leads.column("id")) if value not in done_ids
+                )
+            else:
+                leads = [lead for lead in leads if lead["id"] not in done_ids]
+            print(f"   Skipping {before - len(leads)} leads")
+        else:
+            leads = (lead for lead in leads if lead["id"] not in done_ids)
+
+    total = len(leads) if hasattr(leads, "__len__") else None
+    total_label = str(total) if total is not None else "?"
+    # Compile criteria once for the whole run rather than per lead
+    icp_criteria = compile_icp(icp_criteria)
+    window = make_window(
+        parallel, window_factor, max_in_flight, executor, icp_criteria
+    )
+
+    if executor == "async":
+        workers_label = f"{parallel} concurrent MCP calls (async)"
+    else:
+        workers_label = f"{parallel} parallel {executor} workers"
+    if total is not None:
+        print(f"\n🚀 Processing {total} leads with {workers_label}...")
+    else:
+        print(f"\n🚀 Streaming leads with {workers_label}...")
+    if executor == "process":
+        print(
+            f"   Submission window: {window.max_in_flight} tasks of {chunk_size} leads"
+        )
+    else:
+        print(f"   Submission window: {window.max_in_flight} tasks")
     print("=" * 70)
 
-    with ThreadPoolExecutor(max_workers=parallel) as executor:
-        # Submit all tasks
-        future_to_lead = {
-            executor.submit(process_single_lead, lead, icp_criteria): lead
-            for lead in leads
-        }
+    checkpoint = (
+        CheckpointLog(progress_file, fresh=not resume) if progress_file else None
+    )
 
-        # Process completed tasks
-        completed = 0
-        for future in as_completed(future_to_lead):
+    completed = 0
+    try:
+        for result in iter_process_batch(
+            leads,
+            icp_criteria=icp_criteria,
+            window=window,
+            chunk_size=chunk_size,
+            mcp_client=mcp_client,
+        ):
             completed += 1
-            result = future.result()
-            results.append(result)
+            serialized = result
+            if checkpoint and result_writer and result_writer.fmt != "parquet":
+                # Both serialize the JSON shape; build it once
+                serialized = result.to_dict()
+            if checkpoint:
+                checkpoint.append(serialized)
+            if accumulator is not None:
+                accumulator.add(result)
+            if subscore_writer is not None:
+                subscore_writer.write(result)
+            if result_writer:
+                result_writer.write(serialized)
+            elif collect_results:
+                results.append(result)
 
             # Show progress
-            status_icon = "✓" if result["status"] == "success" else "✗"
-            tier = result.get("qualification", {}).get("tier", "?")
-            score = result.get("qualification", {}).get("weighted_total", 0)
+            status_icon = "✓" if result.status == "success" else "✗"
+            qualification = result.qualification
+            tier = qualification.tier if qualification else "?"
+            score = qualification.weighted_total if qualification else 0
 
             print(
-                f"{status_icon} [{completed}/{total}] {result['company_name'][:40]:40} | Tier {tier} | Score: {score:.1f}"
+                f"{status_icon} [{completed}/{total_label}] {result.company_name[:40]:40} | Tier {tier} | Score: {score:.1f}"
             )
 
-            # Save progress incrementally if requested
-            if progress_file and completed % 10 == 0:
-                with open(progress_file, "w") as f:
-                    json.dump(results, f, indent=2)
-                print(f"   💾 Progress saved ({completed}/{total} complete)")
-
+            if checkpoint and completed % 10 == 0:
+                stats = window.stats()
+                print(
+                    f"   💾 Progress saved ({completed}/{total_label} complete) | "
+                    f"in-flight: {stats['in_flight']}, queued: {stats['queued']}"
+                )
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+    stats = window.stats()
     print("=" * 70)
-    print(f"✅ Batch processing complete: {completed}/{total} leads processed\n")
+    print(
+        f"✅ Batch processing complete: {completed}/{total if total is not None else completed} leads processed"
+    )
+    print(
+        f"   Window saturation: peak in-flight {stats['peak_in_flight']}/{parallel}, "
+        f"peak queued {stats['peak_queued']}/{stats['window']}\n"
+    )
 
     return results
 
 
-def generate_summary(results: list[dict[str, Any]]) -> dict[str, Any]:
+# Score percentiles reported in batch summaries
+SUMMARY_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+
+class SummaryAccumulator:
+    """
+    Incremental summary statistics over processed leads.
+
+    Tier counts, a running score mean, a KLL quantile sketch of scores and
+    the top-K leads (kept in a bounded min-heap) are updated in O(log K)
+    per result, so summaries of arbitrarily large or streaming batches use
+    constant memory.
+    Accumulators from separate shards combine with :meth:`merge`. Merging
+    shards in input order gives exactly the counts, tier and best-fit
+    distributions and top-K leads of processing the concatenated input;
+    the mean can differ in the last float bits, and score percentiles come
+    from the quantile sketch, so they are estimates (rank error under about
+    1%) that can differ from a single pass.
+    """
+
+    def __init__(self, top_k: int = 10):
+        self.top_k = top_k
+        self.total = 0
+        self.successful = 0
+        self.errors = 0
+        self.tier_distribution = {"A": 0, "B": 0, "C": 0, "D": 0}
+        self.score_sum = 0.0
+        # Best-fit ICP counts, only populated for multi-ICP runs
+        self.best_fit_distribution: dict[str, int] = {}
+        self.score_sketch = KLLSketch()
+        # Heap of (score, -sequence, entry); the root is the weakest lead.
+        # Negated sequence makes earlier leads win ties, matching a stable
+        # descending sort.
+        self._heap: list[tuple[float, int, dict[str, Any]]] = []
+
+    def add(self, result: Union[LeadResult, dict[str, Any]]) -> None:
+        """
+        Fold one processed lead into the summary.
+
+        Args:
+            result: Processed lead (LeadResult, or a serialized result
+                such as a checkpoint record)
+        """
+        result = as_record(result)
+        seq = self.total
+        self.total += 1
+
+        if result.status != "success":
+            self.errors += 1
+            return
+
+        self.successful += 1
+        qual = result.qualification
+        tier = qual.tier if qual else "D"
+        score = qual.weighted_total if qual else 0
+
+        self.tier_distribution[tier] = self.tier_distribution.get(tier, 0) + 1
+        self.score_sum += score
+        self.score_sketch.update(score)
+
+        fit = result.icp_fit
+        if fit:
+            best = fit.best_fit
+            self.best_fit_distribution[best] = self.best_fit_distribution.get(best, 0) + 1
+
+        entry = {
+            "company_name": result.company_name,
+            "tier": tier,
+            "score": score,
+        }
+        self._push((score, -seq, entry))
+
+    def add_table(self, table: LeadTable) -> None:
+        """
+        Fold a results table into the summary with column operations.
+
+        Equivalent to calling :meth:`add` on each row in order, but counts
+        come from the categorical columns and only the table's own top-K
+        rows are materialized as entries.
+
+        Args:
+            table: LeadTable built with ``LeadTable.from_results``
+        """
+        offset = self.total
+        ok = table.rows_where("status", "success")
+        self.total += len(table)
+        self.errors += len(table) - len(ok)
+        self.successful += len(ok)
+
+        # A successful lead without scores counts as D-tier with score 0
+        weighted_total = table.column("weighted_total")
+        scores = [0 if score != score else score for score in map(weighted_total.__getitem__, ok)]
+        for tier, count in table.column("tier").value_counts(ok).items():
+            tier = tier or "D"
+            self.tier_distribution[tier] = self.tier_distribution.get(tier, 0) + count
+        self.score_sum = sum(scores, self.score_sum)
+        self.score_sketch.update_all(scores)
+
+        for best, count in table.column("best_fit").value_counts(ok).items():
+            if best is not None:
+                self.best_fit_distribution[best] = self.best_fit_distribution.get(best, 0) + count
+
+        if self.top_k <= 0:
+            return
+        names = table.column("company_name")
+        tiers = table.column("tier")
+        top = heapq.nlargest(self.top_k, range(len(ok)), key=lambda j: (scores[j], -j))
+        for j in top:
+            i = ok[j]
+            entry = {"company_name": names[i], "tier": tiers[i] or "D", "score": scores[j]}
+            self._push((scores[j], -(offset + i), entry))
+
+    def _push(self, item: tuple[float, int, dict[str, Any]]) -> None:
+        if self.top_k <= 0:
+            return
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        """
+        Merge another shard's accumulator into this one.
+
+        ``other`` is treated as the shard that follows this one in input
+        order.
+
+        Args:
+            other: Accumulator for the next shard
+
+        Returns:
+            This accumulator, for chaining
+        """
+        offset = self.total
+        self.total += other.total
+        self.successful += other.successful
+        self.errors += other.errors
+        self.score_sum += other.score_sum
+        for tier, count in other.tier_distribution.items():
+            self.tier_distribution[tier] = self.tier_distribution.get(tier, 0) + count
+        for name, count in other.best_fit_distribution.items():
+            self.best_fit_distribution[name] = self.best_fit_distribution.get(name, 0) + count
+        self.score_sketch.merge(other.score_sketch)
+        for score, neg_seq, entry in other._heap:
+            self._push((score, neg_seq - offset, entry))
+        return self
+
+    @property
+    def avg_score(self) -> float:
+        """Mean weighted_total over successful leads."""
+        return self.score_sum / self.successful if self.successful else 0
+
+    def to_summary(self) -> dict[str, Any]:
+        """
+        Build the summary dictionary written to batch output.
+
+        Returns:
+            Summary dictionary
+        """
+        top = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        summary = {
+            "total_processed": self.total,
+            "successful": self.successful,
+            "errors": self.errors,
+            "tier_distribution": dict(self.tier_distribution),
+            "avg_score": round(self.avg_score, 2) if self.successful else 0,
+            "top_leads": [dict(entry) for _, _, entry in top],
+        }
+        if self.successful:
+            summary["score_percentiles"] = {
+                f"p{pct}": round(value, 2)
+                for pct, value in zip(
+                    SUMMARY_PERCENTILES,
+                    self.score_sketch.quantiles([pct / 100 for pct in SUMMARY_PERCENTILES]),
+                )
+            }
+        if self.best_fit_distribution:
+            summary["best_fit_distribution"] = dict(
+                sorted(self.best_fit_distribution.items(), key=lambda kv: (-kv[1], kv[0]))
+            )
+        return summary
+
+    def to_state(self) -> dict[str, Any]:
+        """Serialize the accumulator, e.g. to ship it between shard workers."""
+        return {
+            "top_k": self.top_k,
+            "total": self.total,
+            "successful": self.successful,
+            "errors": self.errors,
+            "tier_distribution": dict(self.tier_distribution),
+            "score_sum": self.score_sum,
+            "best_fit_distribution": dict(self.best_fit_distribution),
+            "score_sketch": self.score_sketch.to_state(),
+            "heap": [list(item) for item in self._heap],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "SummaryAccumulator":
+        """Rebuild an accumulator serialized with :meth:`to_state`."""
+        acc = cls(state["top_k"])
+        acc.total = state["total"]
+        acc.successful = state["successful"]
+        acc.errors = state["errors"]
+        acc.tier_distribution = dict(state["tier_distribution"])
+        acc.score_sum = state["score_sum"]
+        acc.best_fit_distribution = dict(state.get("best_fit_distribution", {}))
+        if "score_sketch" in state:
+            acc.score_sketch = KLLSketch.from_state(state["score_sketch"])
+        acc._heap = [tuple(item) for item in state["heap"]]
+        heapq.heapify(acc._heap)
+        return acc
+
+
+def generate_summary(
+    results: Union[LeadTable, Iterable[Union[LeadResult, dict[str, Any]]]]
+) -> dict[str, Any]:
     """
     Generate summary statistics from processed leads.
 
     Args:
-        results: List of processed lead results
+        results: Results table (LeadTable.from_results), or processed lead
+            results (any iterable, consumed once)
 
     Returns:
         Summary dictionary
     """
-    summary = {
-        "total_processed": len(results),
-        "successful": 0,
-        "errors": 0,
-        "tier_distribution": {"A": 0, "B": 0, "C": 0, "D": 0},
-        "avg_score": 0,
-        "top_leads": [],
-    }
-
-    scores = []
+    accumulator = SummaryAccumulator()
+    if isinstance(results, LeadTable):
+        accumulator.add_table(results)
+    else:
+        for result in results:
+            accumulator.add(result)
+    return accumulator.to_summary()
 
-    for result in results:
-        if result["status"] == "success":
-            summary["successful"] += 1
 
-            qual = result.get("qualification", {})
-            tier = qual.get("tier", "D")
-            score = qual.get("weighted_total", 0)
-
-            summary["tier_distribution"][tier] += 1
-            scores.append(score)
-
-        else:
-            summary["errors"] += 1
+def print_summary(summary: dict[str, Any]) -> None:
+    """Print summary statistics to the console."""
+    print("📈 Processing Summary:")
+    print(f"   Successful: {summary['successful']}/{summary['total_processed']}")
+    print(f"   Errors: {summary['errors']}")
+    print(f"   Average score: {summary['avg_score']:.1f}")
+    print("\n   Tier Distribution:")
+    print(f"      A-tier: {summary['tier_distribution']['A']} leads")
+    print(f"      B-tier: {summary['tier_distribution']['B']} leads")
+    print(f"      C-tier: {summary['tier_distribution']['C']} leads")
+    print(f"      D-tier: {summary['tier_distribution']['D']} leads")
 
-    # Calculate average score
-    if scores:
-        summary["avg_score"] = round(sum(scores) / len(scores), 2)
+    if summary["top_leads"]:
+        print("\n   🏆 Top 10 Leads:")
+        for i, lead in enumerate(summary["top_leads"], 1):
+            print(
+                f"      {i}. {lead['company_name'][:35]:35} | Tier {lead['tier']} | {lead['score']:.1f}"
+            )
 
-    # Get top 10 leads
-    successful_results = [r for r in results if r["status"] == "success"]
-    sorted_results = sorted(
-        successful_results,
-        key=lambda x: x.get("qualification", {}).get("weighted_total", 0),
-        reverse=True,
-    )
+    if summary.get("score_percentiles"):
+        print(
+            "\n   Score percentiles: "
+            + ", ".join(f"{name} {value:.1f}" for name, value in summary["score_percentiles"].items())
+        )
 
-    summary["top_leads"] = [
-        {
-            "company_name": r["company_name"],
-            "tier": r["qualification"]["tier"],
-            "score": r["qualification"]["weighted_total"],
-        }
-        for r in sorted_results[:10]
-    ]
+    if summary.get("tier_calibration"):
+        calibration = summary["tier_calibration"]
+        print("\n   Percentile tier cutoffs:")
+        for tier, cutoff in calibration["thresholds"].items():
+            print(f"      {tier}-tier: >= {cutoff:.2f} ({calibration['percentiles'][tier]:g}th percentile)")
 
-    return summary
+    if summary.get("best_fit_distribution"):
+        print("\n   Best-fit ICP:")
+        for name, count in summary["best_fit_distribution"].items():
+            print(f"      {name}: {count} leads")
 
 
 def main():
@@ -358,22 +1573,116 @@ def main():
         description="Process multiple leads from CSV/Excel files"
     )
     parser.add_argument(
-        "--input", type=str, required=True, help="Path to input CSV or Excel file"
+        "--input",
+        type=str,
+        help="Path to input CSV, Excel, Parquet or Arrow IPC (.arrow/.feather) file "
+        "(required unless --compact-only)",
     )
     parser.add_argument(
         "--output",
         type=str,
         default="enriched_leads.json",
-        help="Output JSON file path (default: enriched_leads.json)",
+        help="Output file path (default: enriched_leads.json)",
+    )
+    parser.add_argument(
+        "--output-format",
+        type=str,
+        choices=OUTPUT_FORMATS,
+        help="Output format: json (leads array, summary trailer), jsonl "
+        "(one lead per line, summary sidecar) or parquet (flattened score columns, "
+        "summary sidecar; needs pyarrow). Default: from --output extension",
+    )
+    parser.add_argument(
+        "--no-subscores",
+        action="store_true",
+        help="Do not store raw sub-scores next to the output (used by rescore.py)",
+    )
+    parser.add_argument(
+        "--icp-config",
+        type=str,
+        nargs="+",
+        help=(
+            "Path to ICP criteria JSON file. Give several (optionally as name=path) "
+            "to score each lead against every ICP and keep its best fit"
+        ),
     )
     parser.add_argument(
-        "--icp-config", type=str, help="Path to ICP criteria JSON file"
+        "--tier-percentiles",
+        type=float,
+        nargs=3,
+        metavar=("A", "B", "C"),
+        help="Calibrate tier cutoffs to score percentiles (e.g. 90 70 40 puts the top "
+        "10%% in A); cutoffs come from a streaming sketch and are applied to the "
+        "stored sub-scores in a second pass",
+    )
+    parser.add_argument(
+        "--memo-size",
+        type=int,
+        default=0,
+        help="Memoize qualification results for up to this many distinct feature "
+        "fingerprints, so duplicate leads are scored once; pays off only when many "
+        "leads are duplicates, otherwise it slows scoring (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "--codegen",
+        action="store_true",
+        help="Score with a scorer generated for the ICP config (cached on disk by config hash)",
     )
     parser.add_argument(
         "--parallel",
         type=int,
         default=3,
-        help="Number of parallel workers (default: 3, max: 10)",
+        help="Number of parallel workers (default: 3, max: 10 threads or CPU count processes)",
+    )
+    parser.add_argument(
+        "--executor",
+        type=str,
+        choices=EXECUTOR_KINDS,
+        default="thread",
+        help="Worker type: thread, process for CPU-bound scoring, or async for "
+        "high-concurrency MCP calls (default: thread)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=100,
+        help="Concurrent MCP tool calls with --executor async (default: 100, max: 5000)",
+    )
+    parser.add_argument(
+        "--mcp-stub-latency",
+        type=float,
+        help="Execute enrichment plans against a local stand-in MCP server "
+        "with this per-call latency in seconds (for testing and benchmarking)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="Leads shipped to a worker per task with --executor process (default: 64)",
+    )
+    parser.add_argument(
+        "--no-single-flight",
+        action="store_true",
+        help="Do not coalesce concurrent duplicate MCP calls for the same company or query",
+    )
+    parser.add_argument(
+        "--cache-db",
+        type=str,
+        help="SQLite enrichment cache; MCP tool calls already cached are skipped",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=100_000,
+        help="Maximum cached tool responses before LRU eviction (default: 100000)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=str,
+        action="append",
+        default=[],
+        metavar="TOOL=HOURS",
+        help="Override a tool's cache TTL in hours (repeatable)",
     )
     parser.add_argument(
         "--validate-only",
@@ -383,111 +1692,369 @@ def main():
     parser.add_argument(
         "--progress-file",
         type=str,
-        help="Save progress incrementally to this file",
+        help="Append each completed lead to this JSONL checkpoint log",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run from --progress-file, skipping leads that already succeeded",
+    )
+    parser.add_argument(
+        "--compact-only",
+        action="store_true",
+        help="Compact an existing --progress-file into --output without processing",
+    )
+    parser.add_argument(
+        "--no-excel-cache",
+        action="store_true",
+        help="Always parse Excel input instead of reusing (and writing) its columnar "
+        "<input>.leadtable cache",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream CSV, Excel, Parquet or Arrow input instead of loading it all up front "
+        "(skips validation report)",
+    )
+    parser.add_argument(
+        "--window-factor",
+        type=int,
+        default=4,
+        help="Outstanding tasks allowed per worker (default: 4)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Maximum leads held in flight at once (overrides --window-factor)",
     )
 
     args = parser.parse_args()
 
     # Validate parallel workers
-    if args.parallel < 1 or args.parallel > 10:
-        print("Error: --parallel must be between 1 and 10")
+    if args.executor == "async":
+        if args.concurrency < 1 or args.concurrency > 5000:
+            print("Error: --concurrency must be between 1 and 5000")
+            return 1
+    else:
+        max_parallel = (os.cpu_count() or 1) if args.executor == "process" else 10
+        if args.parallel < 1 or args.parallel > max_parallel:
+            print(
+                f"Error: --parallel must be between 1 and {max_parallel} for {args.executor} workers"
+            )
+            return 1
+
+    if args.mcp_stub_latency is not None and args.executor == "process":
+        print("Error: --mcp-stub-latency is not supported with --executor process")
+        return 1
+
+    if args.chunk_size < 1:
+        print("Error: --chunk-size must be at least 1")
         return 1
 
+    if args.memo_size < 0:
+        print("Error: --memo-size must be at least 0")
+        return 1
+
+    if args.window_factor < 1:
+        print("Error: --window-factor must be at least 1")
+        return 1
+
+    if args.resume and not args.progress_file:
+        print("Error: --resume requires --progress-file")
+        return 1
+
+    tier_percentiles = None
+    if args.tier_percentiles:
+        try:
+            tier_percentiles = parse_percentiles(args.tier_percentiles)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+
+    if (args.output_format or infer_format(args.output)) == "parquet" and not HAS_PYARROW:
+        print("Error: Parquet output requires pyarrow. Install with: pip install pyarrow")
+        return 1
+
+    if args.compact_only:
+        if not args.progress_file or not Path(args.progress_file).exists():
+            print("Error: --compact-only requires an existing --progress-file")
+            return 1
+
+        summary = generate_summary(LeadTable.from_results(iter_compacted(args.progress_file)))
+        print(
+            f"✓ Read {summary['total_processed']} leads from checkpoint {args.progress_file}\n"
+        )
+        print_summary(summary)
+
+        metadata = {
+            "input_file": args.input,
+            "processed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "total_leads": summary["total_processed"],
+            "parallel_workers": args.parallel,
+        }
+        compact_checkpoint(
+            args.progress_file,
+            args.output,
+            summary,
+            metadata,
+            fmt=args.output_format or infer_format(args.output),
+        )
+        print(f"\n✅ Results saved to {args.output}")
+        return 0
+
     # Load leads
+    if not args.input:
+        print("Error: --input is required unless --compact-only is given")
+        return 1
+
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Error: Input file not found: {args.input}")
         return 1
 
-    print(f"📁 Loading leads from {args.input}...")
+    if args.stream and args.validate_only:
+        print("Error: --stream cannot be combined with --validate-only")
+        return 1
 
-    try:
-        if input_path.suffix.lower() == ".csv":
-            leads = load_leads_csv(args.input)
-        elif input_path.suffix.lower() in [".xlsx", ".xls"]:
-            leads = load_leads_excel(args.input)
+    suffix = input_path.suffix.lower()
+    arrow_input = suffix in PARQUET_SUFFIXES + ARROW_IPC_SUFFIXES
+    if args.stream and (suffix == ".csv" or suffix in EXCEL_SUFFIXES or arrow_input):
+        print(f"📁 Streaming leads from {args.input}...")
+        if arrow_input:
+            leads = iter_leads_arrow(args.input)
+        elif suffix in EXCEL_SUFFIXES:
+            leads = iter_leads_excel(args.input)
         else:
-            print(
-                f"Error: Unsupported file format: {input_path.suffix}. Use .csv or .xlsx"
-            )
+            leads = iter_leads_csv(args.input)
+    else:
+        print(f"📁 Loading leads from {args.input}...")
+
+        try:
+            if suffix == ".csv":
+                leads = load_leads_csv(args.input)
+            elif suffix in EXCEL_SUFFIXES:
+                leads = load_leads_excel(args.input, use_cache=not args.no_excel_cache)
+            elif arrow_input:
+                leads = load_leads_arrow(args.input)
+            else:
+                print(
+                    f"Error: Unsupported file format: {input_path.suffix}. "
+                    "Use .csv, .xlsx, .parquet or .arrow"
+                )
+                return 1
+        except Exception as e:
+            print(f"Error loading file: {e}")
             return 1
-    except Exception as e:
-        print(f"Error loading file: {e}")
-        return 1
 
-    print(f"✓ Loaded {len(leads)} leads")
+        print(f"✓ Loaded {len(leads)} leads")
 
-    # Validate leads
-    validation = validate_leads(leads)
+        # Validate leads
+        validation = validate_leads(leads)
 
-    print("\n📊 Data Quality Report:")
-    print(f"   Total leads: {validation['total_leads']}")
-    print(f"   Valid leads: {validation['valid_leads']}")
-    print(
-        f"   With website: {validation['data_quality']['has_website']}"
-    )
-    print(
-        f"   With LinkedIn: {validation['data_quality']['has_linkedin']}"
-    )
-    print(
-        f"   With industry: {validation['data_quality']['has_industry']}"
-    )
-    print(
-        f"   With contact info: {validation['data_quality']['has_contact_info']}"
-    )
+        print("\n📊 Data Quality Report:")
+        print(f"   Total leads: {validation['total_leads']}")
+        print(f"   Valid leads: {validation['valid_leads']}")
+        print(
+            f"   With website: {validation['data_quality']['has_website']}"
+        )
+        print(
+            f"   With LinkedIn: {validation['data_quality']['has_linkedin']}"
+        )
+        print(
+            f"   With industry: {validation['data_quality']['has_industry']}"
+        )
+        print(
+            f"   With contact info: {validation['data_quality']['has_contact_info']}"
+        )
 
-    if validation["issues"]:
-        print(f"\n⚠️  Found {len(validation['issues'])} validation issues:")
-        for issue in validation["issues"][:5]:  # Show first 5
-            print(f"   - {issue}")
-        if len(validation["issues"]) > 5:
-            print(f"   ... and {len(validation['issues']) - 5} more")
+        if validation["issues"]:
+            print(f"\n⚠️  Found {len(validation['issues'])} validation issues:")
+            for issue in validation["issues"][:5]:  # Show first 5
+                print(f"   - {issue}")
+            if len(validation["issues"]) > 5:
+                print(f"   ... and {len(validation['issues']) - 5} more")
 
-    if args.validate_only:
-        print("\n✓ Validation complete (no processing performed)")
-        return 0
+        if args.validate_only:
+            print("\n✓ Validation complete (no processing performed)")
+            return 0
 
     # Load ICP criteria if provided
     icp_criteria = None
     if args.icp_config:
         try:
-            with open(args.icp_config) as f:
-                icp_criteria = json.load(f)
-            print(f"✓ Loaded custom ICP criteria from {args.icp_config}")
+            profiles = load_icp_profiles(args.icp_config)
+            if len(profiles) == 1:
+                icp_criteria = next(iter(profiles.values()))
+                print(f"✓ Loaded custom ICP criteria from {args.icp_config[0]}")
+            else:
+                icp_criteria = MultiICPScorer(profiles)
+                print(f"✓ Loaded {len(profiles)} ICP profiles: {', '.join(profiles)}")
         except Exception as e:
             print(f"Warning: Could not load ICP config: {e}")
             print("Using default ICP criteria")
 
-    # Process leads
-    results = process_batch(
-        leads, args.parallel, icp_criteria, args.progress_file
-    )
+    scorer = icp_criteria
+    if args.codegen:
+        if isinstance(icp_criteria, MultiICPScorer):
+            print("   Note: --codegen applies to a single ICP; scoring profiles as usual")
+        else:
+            try:
+                scorer = GeneratedICP(icp_criteria)
+                print("✓ Using generated scorer for the ICP config")
+            except (KeyError, TypeError, OSError) as e:
+                print(f"Warning: Could not generate scorer ({e!r}); using compiled ICP")
+
+    memo = None
+    if args.memo_size and not isinstance(scorer, MultiICPScorer):
+        try:
+            scorer = memo = MemoizedICP(scorer, args.memo_size)
+        except (KeyError, TypeError) as e:
+            print(f"Warning: Could not compile ICP for memoization ({e!r})")
+
+    # Process leads. Results stream straight to --output unless resuming,
+    # in which case the checkpoint log holds earlier runs' results and is
+    # compacted into the output afterwards; either way nothing is kept in
+    # memory.
+    output_format = args.output_format or infer_format(args.output)
+    writer = None if args.resume else ResultWriter(args.output, output_format)
+
+    # Raw sub-scores for rescore.py; they only make sense for a single ICP
+    store_subscores = not args.no_subscores and not isinstance(icp_criteria, MultiICPScorer)
+    subscores = None
+    if store_subscores and writer:
+        subscores = SubscoreWriter(args.output, icp_criteria or DEFAULT_ICP_CRITERIA)
+    accumulator = SummaryAccumulator()
+    workers = args.concurrency if args.executor == "async" else args.parallel
+    mcp_client = None
+    if args.mcp_stub_latency is not None:
+        mcp_client = LocalMCPServer(latency=args.mcp_stub_latency)
+        print(f"✓ Using local MCP stand-in ({args.mcp_stub_latency}s per call)")
+
+    cache = None
+    if args.cache_db:
+        try:
+            tool_ttls = parse_ttl_overrides(args.cache_ttl)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        cache = EnrichmentCache(args.cache_db, args.cache_max_entries, tool_ttls)
+        print(f"✓ Using enrichment cache {args.cache_db} ({cache.stats()['entries']} entries)")
+        if mcp_client is None:
+            print("   Note: no MCP client configured; the cache is not consulted")
+        else:
+            mcp_client = CachedMCPClient(mcp_client, cache)
 
-    # Generate summary
-    summary = generate_summary(results)
+    single_flight = None
+    if mcp_client is not None and not args.no_single_flight:
+        # Outermost, so concurrent cache misses for one company share a call
+        mcp_client = single_flight = SingleFlightMCPClient(mcp_client)
 
-    print("📈 Processing Summary:")
-    print(f"   Successful: {summary['successful']}/{summary['total_processed']}")
-    print(f"   Errors: {summary['errors']}")
-    print(f"   Average score: {summary['avg_score']:.1f}")
-    print("\n   Tier Distribution:")
-    print(f"      A-tier: {summary['tier_distribution']['A']} leads")
-    print(f"      B-tier: {summary['tier_distribution']['B']} leads")
-    print(f"      C-tier: {summary['tier_distribution']['C']} leads")
-    print(f"      D-tier: {summary['tier_distribution']['D']} leads")
+    try:
+        process_batch(
+            leads,
+            workers,
+            scorer,
+            args.progress_file,
+            args.max_in_flight,
+            args.window_factor,
+            args.resume,
+            writer,
+            accumulator,
+            args.executor,
+            args.chunk_size,
+            mcp_client,
+            subscores,
+            collect_results=False,
+        )
+    except BaseException:
+        if writer:
+            writer.abort()
+        if subscores:
+            subscores.abort()
+        raise
+
+    if single_flight:
+        flight_stats = single_flight.stats()
+        print(
+            f"🔗 Single-flight: {flight_stats['coalesced']} duplicate MCP calls saved "
+            f"({flight_stats['calls']} issued)\n"
+        )
 
-    if summary["top_leads"]:
-        print("\n   🏆 Top 10 Leads:")
-        for i, lead in enumerate(summary["top_leads"], 1):
-            print(
-                f"      {i}. {lead['company_name'][:35]:35} | Tier {lead['tier']} | {lead['score']:.1f}"
+    if memo and args.executor != "process":
+        # Process workers each keep their own memo in the child processes
+        memo_stats = memo.stats()
+        print(
+            f"🧠 Qualification memo: {memo_stats['hits']} hits, {memo_stats['misses']} misses "
+            f"({memo_stats['hit_rate'] * 100:.1f}% hit rate), "
+            f"{memo_stats['evictions']} evicted\n"
+        )
+
+    if cache:
+        cache_stats = cache.stats()
+        print(
+            f"🗄️  Enrichment cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate'] * 100:.1f}% hit rate), "
+            f"{cache_stats['evictions']} evicted, {cache_stats['entries']} entries\n"
+        )
+        cache.close()
+
+    # Generate summary
+    if args.resume:
+        # Include leads completed by earlier runs in the summary
+        accumulator = SummaryAccumulator()
+        accumulator.add_table(LeadTable.from_results(iter_compacted(args.progress_file)))
+    summary = accumulator.to_summary()
+
+    calibrated_thresholds = None
+    if tier_percentiles:
+        if accumulator.successful:
+            calibrated_thresholds = percentile_thresholds(
+                accumulator.score_sketch, tier_percentiles
             )
+            summary["tier_calibration"] = {
+                "percentiles": dict(tier_percentiles),
+                "thresholds": {tier: round(cutoff, 2) for tier, cutoff in calibrated_thresholds},
+            }
+        else:
+            print("Note: no successful leads; tier calibration skipped")
 
-    # Save results
-    output_data = {"summary": summary, "leads": results, "metadata": {"input_file": args.input, "processed_at": time.strftime("%Y-%m-%d %H:%M:%S"), "total_leads": len(leads), "parallel_workers": args.parallel}}
+    print_summary(summary)
 
-    with open(args.output, "w") as f:
-        json.dump(output_data, f, indent=2)
+    # Save results
+    metadata = {
+        "input_file": args.input,
+        "processed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_leads": summary["total_processed"],
+        "parallel_workers": workers,
+        "executor": args.executor,
+    }
+    if isinstance(icp_criteria, MultiICPScorer):
+        metadata["icp_profiles"] = icp_criteria.names
+
+    if writer:
+        writer.close(summary, metadata)
+    else:
+        compact_checkpoint(
+            args.progress_file, args.output, summary, metadata, fmt=output_format
+        )
+        if store_subscores:
+            subscores = SubscoreWriter(args.output, icp_criteria or DEFAULT_ICP_CRITERIA)
+            subscores.write_all(iter_compacted(args.progress_file))
+    if subscores:
+        subscores.close()
+
+    # Second pass: apply the percentile cutoffs to the stored sub-scores
+    if calibrated_thresholds and store_subscores:
+        calibrated = rescore(args.output, None, calibrated_thresholds, reported=True)
+        print("\n🎯 Calibrated tier distribution (stored sub-scores):")
+        for tier, count in tier_counts(calibrated["tiers"]).items():
+            print(f"      {tier}-tier: {count} leads")
+        print(
+            "   Write per-lead calibrated tiers with: python scripts/rescore.py "
+            f"--input {args.output} --tier-percentiles "
+            + " ".join(f"{pct:g}" for _, pct in tier_percentiles)
+            + " --output calibrated.jsonl"
+        )
 
     print(f"\n✅ Results saved to {args.output}")
     print(
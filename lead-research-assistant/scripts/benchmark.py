@@ -0,0 +1,894 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmarks
+
+Measures throughput of the lead processing pipeline on synthetic leads.
+Each benchmark is a subcommand; results are printed as a table with the
+speedup relative to the first (baseline) row.
+"""
+
+import argparse
+import copy
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+from batch_processor import (
+    HAS_OPENPYXL,
+    HAS_PANDAS,
+    HAS_PYARROW,
+    excel_cache_path,
+    generate_summary,
+    iter_leads_arrow,
+    iter_leads_csv,
+    iter_leads_excel,
+    iter_process_batch,
+    lead_id,
+    load_leads_excel,
+    mock_enriched_data,
+    process_single_lead,
+    validate_leads,
+)
+from lead_table import LeadTable
+from lead_qualification import (
+    DEFAULT_ICP_CRITERIA,
+    CompiledICP,
+    MemoizedICP,
+    MultiICPScorer,
+    qualify_lead,
+)
+from rescore import rescore, rescore_totals, tier_codes, top_indices
+from scorer_codegen import GeneratedICP, load_scorer
+from subscore_store import SubscoreWriter, subscore_row
+from vector_scoring import (
+    HAS_NUMPY,
+    batch_to_qualifications,
+    encode_companies,
+    qualify_leads_batch,
+)
+from mcp_client import LocalMCPServer
+from result_writer import ResultWriter, load_results
+from whatif import CATEGORIES, WeightModel, evaluate
+
+if HAS_NUMPY:
+    import numpy as np
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+if HAS_OPENPYXL:
+    import openpyxl
+
+if HAS_PANDAS:
+    import pandas as pd
+
+INDUSTRIES = ["SaaS", "Fintech", "AI", "Healthcare", "Retail", "Data & Analytics"]
+
+
+def synthetic_leads(count: int) -> Iterator[dict[str, Any]]:
+    """
+    Generate synthetic leads with varied fields.
+
+    Args:
+        count: Number of leads to generate
+
+    Yields:
+        Lead dictionaries
+    """
+    for i in range(count):
+        name = f"Company {i}"
+        yield {
+            "id": f"lead_{i}",
+            "company_name": name,
+            "website": f"company{i}.com" if i % 3 else None,
+            "linkedin_url": f"linkedin.com/company/company{i}" if i % 2 else None,
+            "industry": INDUSTRIES[i % len(INDUSTRIES)],
+            "contact_name": f"Contact {i}" if i % 4 else None,
+            "contact_title": "VP Sales",
+            "contact_linkedin": None,
+            "notes": None,
+        }
+
+
+def synthetic_companies(count: int, distinct: int = 1_000, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Build varied enriched company records for scoring benchmarks.
+
+    ``distinct`` random companies are generated and repeated up to
+    ``count`` rows, so large benchmarks do not need gigabytes of dicts.
+
+    Args:
+        count: Number of rows
+        distinct: Number of distinct companies
+        seed: Random seed
+
+    Returns:
+        List of company data dictionaries (qualify_lead input)
+    """
+    rng = random.Random(seed)
+    behavioral = DEFAULT_ICP_CRITERIA["behavioral"]["criteria"]
+    strategic = DEFAULT_ICP_CRITERIA["strategic"]["criteria"]
+    signal_groups = {
+        "growth_signals": behavioral["growth_signals"]["signals"],
+        "buying_intent": behavioral["buying_intent"]["signals"],
+        "engagement": behavioral["engagement_potential"]["signals"],
+        "deal_factors": strategic["deal_potential"]["factors"],
+        "competitive": strategic["competitive_position"]["factors"],
+    }
+    technologies = ["AWS", "Azure", "GCP", "React", "Python", "Java", "Oracle", "PHP"]
+    locations = ["San Francisco, North America", "London, Europe", "Singapore, APAC", "Lagos"]
+
+    pool = []
+    for i in range(max(distinct, 1)):
+        company = {
+            "company_name": f"Company {i}",
+            "employee_count": rng.choice([0, 8, 35, 150, 600, 5_000]),
+            "revenue": rng.choice([0, 500_000, 5_000_000, 50_000_000, 500_000_000]),
+            "industry": rng.choice(INDUSTRIES + ["Manufacturing", "Software Services"]),
+            "location": rng.choice(locations),
+            "technologies": rng.sample(technologies, rng.randint(0, 4)),
+            "has_api": rng.random() < 0.5,
+            "has_mobile_app": rng.random() < 0.3,
+            "uses_cloud": rng.random() < 0.6,
+            "modern_stack": rng.random() < 0.4,
+        }
+        for field, signals in signal_groups.items():
+            company[field] = {signal: rng.random() < 0.35 for signal in signals}
+        pool.append(company)
+
+    return [pool[i % len(pool)] for i in range(count)]
+
+
+def time_run(fn: Callable[[], int]) -> tuple[float, int]:
+    """Run ``fn`` once and return (elapsed seconds, items processed)."""
+    start = time.perf_counter()
+    count = fn()
+    return time.perf_counter() - start, count
+
+
+def print_table(title: str, rows: list[tuple[str, float, int]]) -> None:
+    """Print benchmark rows with throughput and speedup vs the first row."""
+    print("\n" + "=" * 76)
+    print(title)
+    print("=" * 76)
+    print(f"{'Mode':38} {'Time (s)':>10} {'Items/s':>12} {'Speedup':>10}")
+    print("-" * 76)
+
+    baseline = rows[0][1] if rows else 0
+    for label, elapsed, count in rows:
+        rate = count / elapsed if elapsed else 0
+        speedup = baseline / elapsed if elapsed else 0
+        print(f"{label:38} {elapsed:>10.3f} {rate:>12,.0f} {speedup:>9.2f}x")
+    print("=" * 76 + "\n")
+
+
+def bench_executors(args: argparse.Namespace) -> None:
+    """Compare thread and process executors for CPU-bound qualification."""
+    worker_counts = sorted({1, args.workers or os.cpu_count() or 1})
+    rows = []
+
+    def run(executor: str, workers: int) -> int:
+        return sum(
+            1
+            for _ in iter_process_batch(
+                synthetic_leads(args.leads),
+                workers,
+                executor=executor,
+                chunk_size=args.chunk_size,
+            )
+        )
+
+    for workers in worker_counts:
+        elapsed, count = time_run(lambda: run("thread", workers))
+        rows.append((f"thread x{workers}", elapsed, count))
+    for workers in worker_counts:
+        elapsed, count = time_run(lambda: run("process", workers))
+        rows.append((f"process x{workers} (chunk {args.chunk_size})", elapsed, count))
+
+    print_table(f"Executor throughput ({args.leads:,} leads)", rows)
+
+
+def bench_mcp(args: argparse.Namespace) -> None:
+    """Compare threads and asyncio for I/O-bound MCP enrichment."""
+    rows = []
+
+    def run(executor: str, workers: int) -> int:
+        server = LocalMCPServer(latency=args.latency, jitter=args.latency / 4, seed=0)
+        return sum(
+            1
+            for _ in iter_process_batch(
+                synthetic_leads(args.leads),
+                workers,
+                executor=executor,
+                mcp_client=server,
+            )
+        )
+
+    elapsed, count = time_run(lambda: run("thread", args.threads))
+    rows.append((f"thread x{args.threads}", elapsed, count))
+    for concurrency in args.concurrency:
+        elapsed, count = time_run(lambda: run("async", concurrency))
+        rows.append((f"async x{concurrency}", elapsed, count))
+
+    print_table(
+        f"MCP enrichment throughput ({args.leads:,} leads, {args.latency * 1000:.0f}ms/call)",
+        rows,
+    )
+
+
+def bench_qualify(args: argparse.Namespace) -> None:
+    """Compare per-call criteria walking with a precompiled ICP."""
+    companies = [mock_enriched_data(lead) for lead in synthetic_leads(args.leads)]
+    rows = []
+
+    def run_dict() -> int:
+        for company in companies:
+            qualify_lead(company)
+        return len(companies)
+
+    def run_compiled() -> int:
+        icp = CompiledICP()
+        for company in companies:
+            icp.score(company)
+        return len(companies)
+
+    elapsed, count = time_run(run_dict)
+    rows.append(("qualify_lead (dict criteria)", elapsed, count))
+    elapsed, count = time_run(run_compiled)
+    rows.append(("CompiledICP.score", elapsed, count))
+
+    print_table(f"Qualification throughput ({args.leads:,} companies)", rows)
+
+
+def bench_codegen(args: argparse.Namespace) -> None:
+    """Compare interpreted scoring with a generated, ICP-specialized scorer."""
+    companies = synthetic_companies(args.leads)
+    rows = []
+
+    def run_dict() -> int:
+        for company in companies:
+            qualify_lead(company)
+        return len(companies)
+
+    def run_compiled() -> int:
+        icp = CompiledICP()
+        for company in companies:
+            icp.score(company)
+        return len(companies)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        load_scorer(DEFAULT_ICP_CRITERIA, cache_dir)
+        generate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        icp = GeneratedICP(DEFAULT_ICP_CRITERIA, cache_dir)
+        cached_time = time.perf_counter() - start
+
+        def run_generated() -> int:
+            for company in companies:
+                icp.score(company)
+            return len(companies)
+
+        elapsed, count = time_run(run_dict)
+        rows.append(("qualify_lead (dict criteria)", elapsed, count))
+        elapsed, count = time_run(run_compiled)
+        rows.append(("CompiledICP.score", elapsed, count))
+        elapsed, count = time_run(run_generated)
+        rows.append(("GeneratedICP.score (generated code)", elapsed, count))
+
+        mismatches = sum(1 for company in companies if icp.score(company) != qualify_lead(company))
+
+    print_table(f"Generated scorer throughput ({args.leads:,} companies)", rows)
+    print(
+        f"Scorer generated in {generate_time * 1000:.1f} ms, built from the cache in "
+        f"{cached_time * 1000:.1f} ms; {mismatches} mismatches vs qualify_lead\n"
+    )
+
+
+def bench_memo(args: argparse.Namespace) -> None:
+    """Compare plain and memoized scoring as the share of duplicate leads varies."""
+    rows = []
+    notes = []
+    for distinct in args.distinct:
+        companies = synthetic_companies(args.leads, distinct)
+
+        def run_compiled() -> int:
+            icp = CompiledICP()
+            for company in companies:
+                icp.score(company)
+            return len(companies)
+
+        memo = MemoizedICP(None, args.memo_size)
+
+        def run_memoized() -> int:
+            for company in companies:
+                memo.score(company)
+            return len(companies)
+
+        elapsed, count = time_run(run_compiled)
+        rows.append((f"CompiledICP.score ({distinct:,} distinct)", elapsed, count))
+        elapsed, count = time_run(run_memoized)
+        rows.append((f"MemoizedICP.score ({distinct:,} distinct)", elapsed, count))
+
+        stats = memo.stats()
+        notes.append(
+            f"{distinct:,} distinct: {stats['hit_rate'] * 100:.1f}% hit rate, "
+            f"{stats['entries']:,} memo entries for {len(companies):,} leads"
+        )
+
+    print_table(
+        f"Memoized qualification ({args.leads:,} companies, memo size {args.memo_size:,})", rows
+    )
+    for note in notes:
+        print(f"   {note}")
+    print()
+
+
+def bench_records(args: argparse.Namespace) -> None:
+    """Compare memory held by slotted result records and by result dicts."""
+    icp = CompiledICP()
+    leads = list(synthetic_leads(args.leads))
+
+    tracemalloc.start()
+    try:
+        records = [process_single_lead(lead, icp) for lead in leads]
+        record_bytes = tracemalloc.get_traced_memory()[0]
+        dicts = [record.to_dict() for record in records]
+        dict_bytes = tracemalloc.get_traced_memory()[0] - record_bytes
+    finally:
+        tracemalloc.stop()
+    del dicts
+
+    # Each lead is written to the checkpoint log and to the output, as in
+    # process_batch; records are converted with to_dict() once for both
+    def run_dumps_dicts() -> int:
+        for result in plain:
+            json.dumps(result, separators=(",", ":"))
+            json.dumps(result)
+        return len(plain)
+
+    def run_dumps_records() -> int:
+        for record in records:
+            result = record.to_dict()
+            json.dumps(result, separators=(",", ":"))
+            json.dumps(result)
+        return len(records)
+
+    plain = [record.to_dict() for record in records]
+    rows = []
+    elapsed, count = time_run(run_dumps_dicts)
+    rows.append(("checkpoint + output (result dicts)", elapsed, count))
+    elapsed, count = time_run(run_dumps_records)
+    rows.append(("checkpoint + output (LeadResult)", elapsed, count))
+
+    print_table(f"Result serialization ({args.leads:,} leads)", rows)
+    print(
+        f"Held in memory: {dict_bytes / len(leads):,.0f} bytes/lead as dicts, "
+        f"{record_bytes / len(leads):,.0f} bytes/lead as records "
+        f"({dict_bytes / record_bytes:.1f}x smaller)\n"
+    )
+
+
+def bench_table(args: argparse.Namespace) -> None:
+    """Compare a list of lead dicts with a columnar LeadTable."""
+    tracemalloc.start()
+    try:
+        leads = []
+        for lead in synthetic_leads(args.leads):
+            lead["id"] = lead_id(lead)
+            leads.append(lead)
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        table = LeadTable.from_leads(leads)
+        table_bytes = tracemalloc.get_traced_memory()[0] - dict_bytes
+    finally:
+        tracemalloc.stop()
+
+    icp = CompiledICP()
+    results = [process_single_lead(lead, icp) for lead in leads]
+    result_table = LeadTable.from_results(results)
+
+    rows = []
+    elapsed, _ = time_run(lambda: len(validate_leads(leads)))
+    rows.append(("validate_leads (lead dicts)", elapsed, len(leads)))
+    elapsed, _ = time_run(lambda: len(validate_leads(table)))
+    rows.append(("validate_leads (LeadTable)", elapsed, len(leads)))
+    print_table(f"Lead validation ({args.leads:,} leads)", rows)
+
+    rows = []
+    elapsed, _ = time_run(lambda: len(generate_summary(results)))
+    rows.append(("generate_summary (records)", elapsed, len(results)))
+    elapsed, _ = time_run(lambda: len(generate_summary(result_table)))
+    rows.append(("generate_summary (LeadTable)", elapsed, len(results)))
+    print_table(f"Result summary ({args.leads:,} leads)", rows)
+
+    print(
+        f"Held in memory: {dict_bytes / len(leads):,.0f} bytes/lead as dicts, "
+        f"{table_bytes / len(leads):,.0f} bytes/lead as a LeadTable "
+        f"({dict_bytes / table_bytes:.1f}x smaller)\n"
+    )
+
+
+def bench_arrow(args: argparse.Namespace) -> None:
+    """Compare CSV/JSON with Parquet and Arrow IPC for lead input and result output."""
+    if not HAS_PYARROW:
+        print("Error: pyarrow is required. Install with: pip install pyarrow")
+        return
+
+    leads = list(synthetic_leads(args.leads))
+    fields = list(leads[0])
+    icp = CompiledICP()
+    results = [process_single_lead(lead, icp) for lead in leads]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            name: os.path.join(tmp, name)
+            for name in ("leads.csv", "leads.parquet", "leads.arrow")
+        }
+        with open(paths["leads.csv"], "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(leads)
+        table = pa.Table.from_pylist(leads)
+        pq.write_table(table, paths["leads.parquet"])
+        with pa.OSFile(paths["leads.arrow"], "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as ipc:
+                ipc.write_table(table, max_chunksize=65_536)
+
+        def read(fn: Callable[[str], Iterator[dict[str, Any]]], path: str) -> Callable[[], int]:
+            return lambda: sum(1 for _ in fn(path))
+
+        rows = []
+        for label, fn, name in (
+            ("iter_leads_csv (.csv)", iter_leads_csv, "leads.csv"),
+            ("iter_leads_arrow (.parquet)", iter_leads_arrow, "leads.parquet"),
+            ("iter_leads_arrow (.arrow)", iter_leads_arrow, "leads.arrow"),
+        ):
+            elapsed, count = time_run(read(fn, paths[name]))
+            rows.append((label, elapsed, count))
+        print_table(f"Lead input ({args.leads:,} leads)", rows)
+
+        def write(path: str) -> Callable[[], int]:
+            def run() -> int:
+                writer = ResultWriter(path)
+                for result in results:
+                    writer.write(result)
+                writer.close()
+                return len(results)
+
+            return run
+
+        rows = []
+        sizes = []
+        for label, name in (
+            ("ResultWriter (.json)", "results.json"),
+            ("ResultWriter (.jsonl)", "results.jsonl"),
+            ("ResultWriter (.parquet)", "results.parquet"),
+        ):
+            path = os.path.join(tmp, name)
+            elapsed, count = time_run(write(path))
+            rows.append((label, elapsed, count))
+            sizes.append((name, os.path.getsize(path)))
+        print_table(f"Result output ({args.leads:,} leads)", rows)
+
+        rows = []
+        for label, name in (
+            ("load_results (.json)", "results.json"),
+            ("load_results (.jsonl)", "results.jsonl"),
+            ("load_results (.parquet)", "results.parquet"),
+        ):
+            path = os.path.join(tmp, name)
+            elapsed, _ = time_run(lambda: len(load_results(path)["leads"]))
+            rows.append((label, elapsed, len(results)))
+        print_table(f"Result loading ({args.leads:,} leads)", rows)
+
+    print("Output size: " + ", ".join(f"{name} {size / 2**20:,.1f} MiB" for name, size in sizes))
+    print()
+
+
+def bench_excel(args: argparse.Namespace) -> None:
+    """Compare Excel ingestion paths and the columnar Excel cache."""
+    if not HAS_OPENPYXL:
+        print("Error: openpyxl is required. Install with: pip install openpyxl")
+        return
+
+    leads = list(synthetic_leads(args.leads))
+    headers = ["Company Name", "Website", "LinkedIn URL", "Industry", "Contact Name", "Title"]
+    fields = ["company_name", "website", "linkedin_url", "industry", "contact_name", "contact_title"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "leads.xlsx")
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(headers)
+        for lead in leads:
+            sheet.append([lead[field] for field in fields])
+        workbook.save(path)
+
+        def run_pandas() -> int:
+            # The previous loader: whole-sheet DataFrame walked with iterrows
+            df = pd.read_excel(path).rename(columns=dict(zip(headers, fields)))
+            count = 0
+            for _, row in df.iterrows():
+                if str(row.get("company_name", "")).strip() not in ("", "nan"):
+                    count += 1
+            return count
+
+        def run_stream() -> int:
+            return sum(1 for _ in iter_leads_excel(path))
+
+        def run_load() -> int:
+            return len(load_leads_excel(path))
+
+        rows = []
+        if HAS_PANDAS:
+            elapsed, count = time_run(run_pandas)
+            rows.append(("pandas read_excel + iterrows", elapsed, count))
+        elapsed, count = time_run(run_stream)
+        rows.append(("iter_leads_excel (read-only stream)", elapsed, count))
+        elapsed, count = time_run(run_load)
+        rows.append(("load_leads_excel (parse + cache)", elapsed, count))
+        elapsed, count = time_run(run_load)
+        rows.append(("load_leads_excel (cached)", elapsed, count))
+        os.utime(path)
+        elapsed, count = time_run(run_load)
+        rows.append(("load_leads_excel (touched, hash hit)", elapsed, count))
+
+        print_table(f"Excel ingestion ({args.leads:,} leads)", rows)
+        print(
+            f"Workbook {os.path.getsize(path) / 2**20:,.1f} MiB, "
+            f"cache {os.path.getsize(excel_cache_path(path)) / 2**20:,.1f} MiB\n"
+        )
+
+
+def bench_matcher(args: argparse.Namespace) -> None:
+    """Compare scanning target lists with the SubstringMatcher index."""
+    rng = random.Random(0)
+    words = [
+        "software", "saas", "fintech", "health", "retail", "logistics", "analytics",
+        "cloud", "security", "media", "energy", "biotech", "gaming", "insurance",
+    ]
+    criteria = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    firm_criteria = criteria["firmographic"]["criteria"]
+    firm_criteria["industry_match"]["target_industries"] = [
+        f"{rng.choice(words)} {rng.choice(words)} {i}" for i in range(args.targets)
+    ]
+    firm_criteria["geographic_match"]["target_regions"] = [
+        f"region {i}" for i in range(args.targets)
+    ]
+    industries = [f"{rng.choice(words)} {rng.choice(words)}" for _ in range(args.leads)]
+    locations = [f"city {i % 97}, region {rng.randrange(args.targets * 2)}" for i in range(args.leads)]
+
+    icp = CompiledICP(criteria)
+    targets, regions = icp.target_industries, icp.target_regions
+
+    def run_scan() -> int:
+        for industry, location in zip(industries, locations):
+            industry_lower, location_lower = industry.lower(), location.lower()
+            if industry_lower not in icp.target_industry_set:
+                any(t in industry_lower or industry_lower in t for t in targets)
+            any(r in location_lower for r in regions)
+        return len(industries)
+
+    def run_index() -> int:
+        for industry, location in zip(industries, locations):
+            icp.score_industry(industry)
+            icp.score_geography(location)
+        return len(industries)
+
+    rows = []
+    elapsed, count = time_run(run_scan)
+    rows.append((f"linear scan ({args.targets} targets)", elapsed, count))
+    elapsed, count = time_run(run_index)
+    rows.append(("SubstringMatcher", elapsed, count))
+    print_table(f"Industry/geography matching ({args.leads:,} companies)", rows)
+
+
+def icp_variants(count: int) -> dict[str, dict]:
+    """Build ``count`` ICP variants with shifted category weights."""
+    variants = {}
+    categories = ["firmographic", "technographic", "behavioral", "strategic"]
+    for i in range(count):
+        criteria = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+        boosted = categories[i % len(categories)]
+        for category in categories:
+            share = 0.4 if category == boosted else 0.2
+            criteria[category]["weight"] = share
+        criteria["firmographic"]["criteria"]["company_size"]["ranges"]["smb"]["score"] = 40 + i
+        variants[f"icp_{i}"] = criteria
+    return variants
+
+
+def bench_multi_icp(args: argparse.Namespace) -> None:
+    """Compare one run per ICP with multi-profile scoring in one pass."""
+    companies = synthetic_companies(args.leads)
+    profiles = icp_variants(args.profiles)
+    rows = []
+
+    def run_separate() -> int:
+        for criteria in profiles.values():
+            for company in companies:
+                qualify_lead(company, criteria)
+        return len(companies)
+
+    def run_multi() -> int:
+        scorer = MultiICPScorer(profiles)
+        for company in companies:
+            scorer.qualify(company)
+        return len(companies)
+
+    elapsed, count = time_run(run_separate)
+    rows.append((f"qualify_lead x {args.profiles} ICPs", elapsed, count))
+    elapsed, count = time_run(run_multi)
+    rows.append((f"MultiICPScorer ({args.profiles} ICPs)", elapsed, count))
+
+    print_table(
+        f"Multi-ICP scoring throughput ({args.leads:,} leads x {args.profiles} ICPs)", rows
+    )
+
+
+def bench_vectorized(args: argparse.Namespace) -> None:
+    """Compare scalar scoring with NumPy batch scoring."""
+    if not HAS_NUMPY:
+        print("Error: numpy is required. Install with: pip install numpy")
+        return
+
+    companies = synthetic_companies(args.leads)
+    icp = CompiledICP()
+    rows = []
+    batch = {}
+
+    def run_scalar() -> int:
+        for company in companies:
+            icp.score(company)
+        return len(companies)
+
+    def run_encode() -> int:
+        batch["columns"] = encode_companies(companies, icp)
+        return len(companies)
+
+    def run_batch() -> int:
+        batch["result"] = qualify_leads_batch(batch["columns"], icp)
+        return len(companies)
+
+    elapsed, count = time_run(run_scalar)
+    rows.append(("CompiledICP.score (scalar)", elapsed, count))
+    elapsed, count = time_run(run_encode)
+    rows.append(("encode_companies", elapsed, count))
+    elapsed, count = time_run(run_batch)
+    rows.append(("qualify_leads_batch (scoring only)", elapsed, count))
+
+    sample = range(0, len(companies), max(len(companies) // 10_000, 1))
+    mismatches = sum(
+        1
+        for i, qualification in zip(sample, batch_to_qualifications(batch["result"], sample))
+        if qualification != qualify_lead(companies[i])
+    )
+
+    print_table(f"Vectorized scoring throughput ({args.leads:,} companies)", rows)
+    print(f"Verified {len(sample):,} rows against qualify_lead: {mismatches} mismatches\n")
+
+
+def bench_rescore(args: argparse.Namespace) -> None:
+    """Time re-scoring a stored sub-score matrix with new weights."""
+    pool = synthetic_companies(1_000)
+    icp = CompiledICP()
+    rows = [subscore_row(icp.score(company)) for company in pool]
+    new_weights = icp_variants(2)["icp_1"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "leads.json")
+        writer = SubscoreWriter(output_path, DEFAULT_ICP_CRITERIA)
+        for i in range(args.leads):
+            writer.write_row(f"lead_{i}", f"Company {i % len(rows)}", rows[i % len(rows)])
+        writer.close()
+
+        elapsed, count = time_run(lambda: len(rescore(output_path, new_weights)["tiers"]))
+
+    print_table(
+        f"Re-scoring throughput ({args.leads:,} stored leads)",
+        [("rescore (new weights)", elapsed, count)],
+    )
+
+
+def bench_whatif(args: argparse.Namespace) -> None:
+    """Time evaluating many weightings: one rescore per weighting vs whatif."""
+    if not HAS_NUMPY:
+        print("numpy is not installed; skipping the what-if benchmark")
+        return
+
+    pool = synthetic_companies(1_000)
+    icp = CompiledICP()
+    pool_rows = [subscore_row(icp.score(company)) for company in pool]
+    matrix = np.asarray([pool_rows[i % len(pool_rows)] for i in range(args.leads)])
+
+    model = WeightModel(DEFAULT_ICP_CRITERIA)
+    categories, criteria, _ = model.random_categories(args.weightings)
+    weights = model.effective(categories, criteria)
+    baseline = model.effective(model.category_weights[None, :], model.criterion_weights[None, :])[0]
+
+    def run_rescore() -> int:
+        for mix in categories.tolist():
+            variant = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+            for category, weight in zip(CATEGORIES, mix):
+                variant[category]["weight"] = weight
+            totals = rescore_totals(matrix, variant)
+            tier_codes(totals)
+            top_indices(totals, 100)
+        return args.weightings
+
+    rows = []
+    elapsed, count = time_run(run_rescore)
+    rows.append(("rescore per weighting", elapsed, count))
+    elapsed, count = time_run(lambda: len(evaluate(matrix, weights, baseline)["tier_changes"]))
+    rows.append(("whatif.evaluate (distinct rows)", elapsed, count))
+
+    print_table(
+        f"What-if throughput ({args.weightings:,} weightings x {args.leads:,} leads)", rows
+    )
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark the lead pipeline")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    executors = subparsers.add_parser(
+        "executors", help="Thread vs process executor throughput"
+    )
+    executors.add_argument(
+        "--leads", type=int, default=20_000, help="Number of synthetic leads"
+    )
+    executors.add_argument(
+        "--workers", type=int, help="Worker count to compare against 1 (default: CPU count)"
+    )
+    executors.add_argument(
+        "--chunk-size", type=int, default=256, help="Leads per process task"
+    )
+    executors.set_defaults(func=bench_executors)
+
+    mcp = subparsers.add_parser(
+        "mcp", help="Thread vs asyncio enrichment against a local MCP stand-in"
+    )
+    mcp.add_argument("--leads", type=int, default=1_000, help="Number of synthetic leads")
+    mcp.add_argument(
+        "--latency", type=float, default=0.05, help="Injected seconds per tool call"
+    )
+    mcp.add_argument(
+        "--threads", type=int, default=10, help="Thread workers for the baseline"
+    )
+    mcp.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[100, 500],
+        help="Async concurrency levels to compare",
+    )
+    mcp.set_defaults(func=bench_mcp)
+
+    qualify = subparsers.add_parser(
+        "qualify", help="Dict-criteria scoring vs compiled ICP scoring"
+    )
+    qualify.add_argument(
+        "--leads", type=int, default=100_000, help="Number of synthetic companies"
+    )
+    qualify.set_defaults(func=bench_qualify)
+
+    codegen = subparsers.add_parser(
+        "codegen", help="Interpreted scoring vs a generated ICP-specialized scorer"
+    )
+    codegen.add_argument(
+        "--leads", type=int, default=100_000, help="Number of synthetic companies"
+    )
+    codegen.set_defaults(func=bench_codegen)
+
+    memo = subparsers.add_parser(
+        "memo", help="Plain vs fingerprint-memoized qualification by duplicate share"
+    )
+    memo.add_argument(
+        "--leads", type=int, default=100_000, help="Number of synthetic companies"
+    )
+    memo.add_argument(
+        "--distinct",
+        type=int,
+        nargs="+",
+        default=[1_000, 100_000],
+        help="Distinct companies among the leads (one run per value)",
+    )
+    memo.add_argument(
+        "--memo-size", type=int, default=10_000, help="Memo entries (default: 10000)"
+    )
+    memo.set_defaults(func=bench_memo)
+
+    records = subparsers.add_parser(
+        "records", help="Memory of slotted result records vs result dicts"
+    )
+    records.add_argument(
+        "--leads", type=int, default=100_000, help="Number of synthetic leads"
+    )
+    records.set_defaults(func=bench_records)
+
+    table = subparsers.add_parser(
+        "table", help="Memory and aggregates of lead dicts vs a columnar LeadTable"
+    )
+    table.add_argument(
+        "--leads", type=int, default=200_000, help="Number of synthetic leads"
+    )
+    table.set_defaults(func=bench_table)
+
+    arrow = subparsers.add_parser(
+        "arrow", help="CSV/JSON vs Parquet and Arrow IPC input and output"
+    )
+    arrow.add_argument(
+        "--leads", type=int, default=200_000, help="Number of synthetic leads"
+    )
+    arrow.set_defaults(func=bench_arrow)
+
+    excel = subparsers.add_parser(
+        "excel", help="Excel ingestion: streaming reader and columnar cache"
+    )
+    excel.add_argument(
+        "--leads", type=int, default=100_000, help="Number of synthetic leads"
+    )
+    excel.set_defaults(func=bench_excel)
+
+    matcher = subparsers.add_parser(
+        "matcher", help="Target-list scans vs the substring index for large ICPs"
+    )
+    matcher.add_argument("--leads", type=int, default=50_000, help="Number of companies")
+    matcher.add_argument(
+        "--targets", type=int, default=500, help="Target industries and regions in the ICP"
+    )
+    matcher.set_defaults(func=bench_matcher)
+
+    vectorized = subparsers.add_parser(
+        "vectorized", help="Scalar scoring vs NumPy batch scoring"
+    )
+    vectorized.add_argument(
+        "--leads", type=int, default=1_000_000, help="Number of synthetic companies"
+    )
+    vectorized.set_defaults(func=bench_vectorized)
+
+    multi_icp = subparsers.add_parser(
+        "multi-icp", help="Separate per-ICP runs vs multi-profile scoring"
+    )
+    multi_icp.add_argument(
+        "--leads", type=int, default=20_000, help="Number of synthetic companies"
+    )
+    multi_icp.add_argument(
+        "--profiles", type=int, default=20, help="Number of ICP variants"
+    )
+    multi_icp.set_defaults(func=bench_multi_icp)
+
+    rescore_parser = subparsers.add_parser(
+        "rescore", help="Re-score stored sub-scores with new weights"
+    )
+    rescore_parser.add_argument(
+        "--leads", type=int, default=5_000_000, help="Number of stored leads"
+    )
+    rescore_parser.set_defaults(func=bench_rescore)
+
+    whatif = subparsers.add_parser(
+        "whatif", help="Per-weighting rescoring vs the what-if engine"
+    )
+    whatif.add_argument("--leads", type=int, default=200_000, help="Number of stored leads")
+    whatif.add_argument(
+        "--weightings", type=int, default=1_000, help="Number of weightings to evaluate"
+    )
+    whatif.set_defaults(func=bench_whatif)
+
+    args = parser.parse_args()
+    args.func(args)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Checkpoint Log
+
+Append-only JSONL log of processed leads used by the batch processor.
+Each completed lead is written as a single line, so saving progress costs
+O(1) per lead instead of re-serializing every result. Writes are flushed
+and fsync'd in batches, and a compaction step turns the log into the final
+deduplicated lead list.
+"""
+
+import json
+import os
+import time
+from typing import Any, Iterator, Optional
+
+from result_writer import ResultWriter, to_jsonable
+
+
+class CheckpointLog:
+    """
+    Append-only JSONL writer with batched fsync.
+
+    Records are flushed to the OS after every append and fsync'd to disk
+    once ``fsync_every`` records or ``fsync_interval`` seconds have
+    accumulated, whichever comes first. A torn final line left behind by a
+    crash is trimmed when the log is reopened. Pass ``fresh=True`` to
+    discard any existing log instead of appending to it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync_every: int = 100,
+        fsync_interval: float = 1.0,
+        fresh: bool = False,
+    ):
+        self.path = path
+        self.fsync_every = max(fsync_every, 1)
+        self.fsync_interval = fsync_interval
+        self.records_written = 0
+
+        if fresh:
+            self._file = open(path, "w", encoding="utf-8")
+        else:
+            _trim_torn_tail(path)
+            self._file = open(path, "a", encoding="utf-8")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record: dict[str, Any]) -> None:
+        """
+        Append one record to the log.
+
+        Args:
+            record: JSON-serializable lead result or record
+        """
+        self._file.write(json.dumps(record, separators=(",", ":"), default=to_jsonable) + "\n")
+        self._file.flush()
+        self.records_written += 1
+        self._unsynced += 1
+
+        if (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        """Force buffered records to disk."""
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the log."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> "CheckpointLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _trim_torn_tail(path: str) -> None:
+    """Drop a partially written last line so new appends start cleanly."""
+    if not os.path.exists(path):
+        return
+
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # Walk back to the previous newline
+        pos = size - 1
+        chunk = 4096
+        while pos > 0:
+            start = max(pos - chunk, 0)
+            f.seek(start)
+            data = f.read(pos - start)
+            idx = data.rfind(b"\n")
+            if idx != -1:
+                f.truncate(start + idx + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+def _iter_lines(path: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (byte offset, record) pairs, skipping torn or invalid lines."""
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                yield line_offset, json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def read_checkpoint(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Read every record from a checkpoint log in write order.
+
+    Args:
+        path: Path to JSONL checkpoint log
+
+    Yields:
+        Lead result records (including superseded duplicates)
+    """
+    for _, record in _iter_lines(path):
+        yield record
+
+
+def iter_compacted(path: str, key: str = "id") -> Iterator[dict[str, Any]]:
+    """
+    Yield the latest record for each key from a checkpoint log.
+
+    Uses two passes over the file so that only keys and byte offsets are
+    held in memory, not the records themselves.
+
+    Args:
+        path: Path to JSONL checkpoint log
+        key: Record field identifying a lead
+
+    Yields:
+        One record per key, in the order the surviving records were written
+    """
+    latest: dict[Any, int] = {}
+    for offset, record in _iter_lines(path):
+        latest[record.get(key)] = offset
+
+    keep = set(latest.values())
+    del latest
+
+    for offset, record in _iter_lines(path):
+        if offset in keep:
+            yield record
+
+
+def compact_checkpoint(
+    path: str,
+    output_path: str,
+    summary: Optional[dict[str, Any]] = None,
+    metadata: Optional[dict[str, Any]] = None,
+    key: str = "id",
+    fmt: Optional[str] = None,
+) -> int:
+    """
+    Compact a checkpoint log into the final batch output.
+
+    The output has the same shape as a normal batch run and is written
+    atomically through ``ResultWriter``.
+
+    Args:
+        path: Path to JSONL checkpoint log
+        output_path: Destination file
+        summary: Optional summary block to include
+        metadata: Optional metadata block to include
+        key: Record field identifying a lead
+        fmt: Output format, "json", "jsonl" or "parquet" (default: from extension)
+
+    Returns:
+        Number of leads written
+    """
+    writer = ResultWriter(output_path, fmt, atomic=True)
+    try:
+        for record in iter_compacted(path, key):
+            writer.write(record)
+    except BaseException:
+        writer.abort()
+        raise
+
+    writer.close(summary, metadata)
+    return writer.count
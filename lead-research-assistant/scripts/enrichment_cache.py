@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Enrichment Cache
+
+Persistent SQLite cache for Bright Data MCP tool responses. Company tools
+are keyed by the company's normalized website domain, LinkedIn URL or
+name, so overlapping lead lists reuse earlier enrichment instead of paying
+for the same calls again. Entries expire per tool (news goes stale faster
+than company profiles) and the least recently used entries are evicted
+once the cache exceeds its size limit.
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Optional
+
+from lead_enrichment import (
+    company_cache_key,
+    normalize_linkedin_url,
+)
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Default time-to-live per MCP tool, in seconds
+DEFAULT_TOOL_TTLS = {
+    "web_data_linkedin_company_profile": 30 * DAY,
+    "web_data_crunchbase_company": 30 * DAY,
+    "web_data_zoominfo_company_profile": 30 * DAY,
+    "web_data_linkedin_person_profile": 30 * DAY,
+    "web_data_linkedin_people_search": 14 * DAY,
+    "web_data_reuter_news": 1 * DAY,
+    "web_data_x_posts": 1 * DAY,
+    "search_engine": 7 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+
+
+def tool_cache_key(tool: str, params: dict[str, Any]) -> Optional[str]:
+    """
+    Build the cache key for a tool call.
+
+    Company-level calls share one key per company regardless of which
+    identifying fields a lead happened to carry; searches are keyed by the
+    normalized query; person calls by name plus the employer's company key
+    (the same name at two companies is two people); anything else by its
+    canonical parameters.
+
+    Args:
+        tool: MCP tool name
+        params: Tool parameters
+
+    Returns:
+        Cache key string, or None for a person call without both a name
+        and a company, which must be neither cached nor coalesced
+    """
+    if "query" in params:
+        return "query:" + " ".join(str(params["query"]).lower().split())
+
+    if "first_name" in params or "name" in params:
+        name = params.get("name") or (
+            f"{params.get('first_name') or ''} {params.get('last_name') or ''}"
+        )
+        name = " ".join(name.lower().split())
+        company = company_cache_key(params.get("company"), params.get("website"))
+        if not name or not company:
+            return None
+        return f"person:{name}|{company}"
+
+    company_key = company_cache_key(
+        params.get("company_name"), params.get("website"), params.get("linkedin_url")
+    )
+    if company_key:
+        return company_key
+
+    if params.get("url"):
+        return f"linkedin:{normalize_linkedin_url(params['url'])}"
+
+    return "params:" + json.dumps(params, sort_keys=True)
+
+
+class EnrichmentCache:
+    """
+    SQLite-backed LRU cache of MCP tool responses with per-tool TTLs.
+
+    Safe to share between threads. Hit, miss, expiry and eviction counts
+    are kept in memory for reporting; see :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        tool_ttls: Optional[dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+    ):
+        self.path = path
+        self.max_entries = max(max_entries, 1)
+        self.tool_ttls = {**DEFAULT_TOOL_TTLS, **(tool_ttls or {})}
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                tool TEXT NOT NULL,
+                key TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (tool, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.stores = 0
+        self.tool_stats: dict[str, dict[str, int]] = {}
+
+    def ttl_for(self, tool: str) -> float:
+        """Time-to-live in seconds for a tool's responses."""
+        return self.tool_ttls.get(tool, self.default_ttl)
+
+    def _count(self, tool: str, outcome: str) -> None:
+        per_tool = self.tool_stats.setdefault(tool, {"hits": 0, "misses": 0})
+        per_tool[outcome] += 1
+
+    def get(self, tool: str, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            tool: MCP tool name
+            key: Cache key from tool_cache_key
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM entries WHERE tool = ? AND key = ?",
+                (tool, key),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                self._count(tool, "misses")
+                return None
+
+            response, created_at = row
+            if now - created_at > self.ttl_for(tool):
+                self._conn.execute(
+                    "DELETE FROM entries WHERE tool = ? AND key = ?", (tool, key)
+                )
+                self._size -= 1
+                self.expired += 1
+                self.misses += 1
+                self._count(tool, "misses")
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE tool = ? AND key = ?",
+                (now, tool, key),
+            )
+            self.hits += 1
+            self._count(tool, "hits")
+            return json.loads(response)
+
+    def set(self, tool: str, key: str, response: dict[str, Any]) -> None:
+        """
+        Store a response, evicting least recently used entries if full.
+
+        Args:
+            tool: MCP tool name
+            key: Cache key from tool_cache_key
+            response: Tool response to cache
+        """
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM entries WHERE tool = ? AND key = ?", (tool, key)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (tool, key, json.dumps(response), now, now),
+            )
+            if not exists:
+                self._size += 1
+            self.stores += 1
+
+            if self._size > self.max_entries:
+                # Evict down to 90% of capacity so eviction is amortized
+                target = int(self.max_entries * 0.9)
+                excess = self._size - target
+                self._conn.execute(
+                    """
+                    DELETE FROM entries WHERE rowid IN (
+                        SELECT rowid FROM entries ORDER BY last_access LIMIT ?
+                    )
+                    """,
+                    (excess,),
+                )
+                self._size -= excess
+                self.evictions += excess
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Cache counters.
+
+        Returns:
+            Dictionary with entries, hits, misses, hit_rate, expired,
+            evictions, stores and per-tool hit/miss counts
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "stores": self.stores,
+                "per_tool": {tool: dict(c) for tool, c in self.tool_stats.items()},
+            }
+
+    def tool_counts(self) -> dict[str, int]:
+        """Number of cached entries per tool."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT tool, COUNT(*) FROM entries GROUP BY tool ORDER BY tool"
+            ).fetchall()
+        return dict(rows)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedMCPClient:
+    """
+    MCP client wrapper that serves tool calls from an EnrichmentCache.
+
+    Cache hits return without touching the wrapped client; only successful
+    responses are stored. Calls without a cache key (ambiguous person
+    lookups) always go to the client. Supports both ``call_tool`` and
+    ``acall_tool``; the async path runs SQLite reads and writes in a worker
+    thread so they never block the event loop.
+    """
+
+    def __init__(self, client: Any, cache: EnrichmentCache):
+        self.client = client
+        self.cache = cache
+
+    def call_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Blocking tool call, served from cache when possible."""
+        key = tool_cache_key(tool, params)
+        if key is None:
+            return self.client.call_tool(tool, params)
+        cached = self.cache.get(tool, key)
+        if cached is not None:
+            return cached
+
+        response = self.client.call_tool(tool, params)
+        self.cache.set(tool, key, response)
+        return response
+
+    async def acall_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Non-blocking tool call, served from cache when possible."""
+        key = tool_cache_key(tool, params)
+        if key is None:
+            return await self.client.acall_tool(tool, params)
+        cached = await asyncio.to_thread(self.cache.get, tool, key)
+        if cached is not None:
+            return cached
+
+        response = await self.client.acall_tool(tool, params)
+        await asyncio.to_thread(self.cache.set, tool, key, response)
+        return response
+
+
+def parse_ttl_overrides(values: list[str]) -> dict[str, float]:
+    """
+    Parse ``tool=hours`` TTL overrides from the command line.
+
+    Args:
+        values: Strings such as "web_data_reuter_news=6"
+
+    Returns:
+        Mapping of tool name to TTL in seconds
+    """
+    ttls = {}
+    for value in values:
+        tool, sep, hours = value.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid TTL override (expected tool=hours): {value}")
+        ttls[tool.strip()] = float(hours) * HOUR
+    return ttls
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Inspect or clear the enrichment cache")
+    parser.add_argument("--cache-db", type=str, required=True, help="Path to cache database")
+    parser.add_argument("--clear", action="store_true", help="Remove every entry")
+
+    args = parser.parse_args()
+
+    cache = EnrichmentCache(args.cache_db)
+    if args.clear:
+        cache.clear()
+        print(f"✓ Cleared enrichment cache {args.cache_db}")
+    else:
+        print(f"\nEnrichment cache: {args.cache_db} ({cache.stats()['entries']} entries)")
+        for tool, count in cache.tool_counts().items():
+            ttl_hours = cache.ttl_for(tool) / HOUR
+            print(f"   {tool:40} {count:>8} entries | TTL {ttl_hours:.0f}h")
+        print()
+    cache.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
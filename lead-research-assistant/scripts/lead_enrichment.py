@@ -8,8 +8,122 @@ Implements intelligent tool selection based on available information.
 
 import argparse
 import json
+import re
 import sys
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Legal suffixes ignored when comparing company names
+COMPANY_SUFFIXES = {
+    "inc",
+    "incorporated",
+    "llc",
+    "ltd",
+    "limited",
+    "corp",
+    "corporation",
+    "co",
+    "gmbh",
+    "plc",
+    "sa",
+    "ag",
+}
+
+
+def normalize_domain(website: Optional[str]) -> Optional[str]:
+    """
+    Reduce a website URL to its bare domain.
+
+    Args:
+        website: URL or domain, e.g. "https://www.Acme.com/about"
+
+    Returns:
+        Lowercased domain without scheme, "www." or path (e.g. "acme.com"),
+        or None if empty
+    """
+    if not website:
+        return None
+
+    value = website.strip().lower()
+    if "://" not in value:
+        value = f"//{value}"
+    host = urlparse(value).hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def normalize_linkedin_url(linkedin_url: Optional[str]) -> Optional[str]:
+    """
+    Canonicalize a LinkedIn company or profile URL.
+
+    Args:
+        linkedin_url: URL such as "https://www.linkedin.com/company/acme/"
+
+    Returns:
+        "linkedin.com/<path>" lowercased without query or trailing slash,
+        or None if empty
+    """
+    if not linkedin_url:
+        return None
+
+    value = linkedin_url.strip().lower()
+    if "://" not in value:
+        value = f"//{value}"
+    parsed = urlparse(value)
+    host = (parsed.hostname or "").split(".")
+    path = parsed.path.rstrip("/")
+    return f"{'.'.join(host[-2:])}{path}" if host else None
+
+
+def normalize_company_name(company_name: Optional[str]) -> Optional[str]:
+    """
+    Normalize a company name for matching.
+
+    Args:
+        company_name: Company name, e.g. "Acme, Inc."
+
+    Returns:
+        Lowercased name with punctuation and legal suffixes removed
+        (e.g. "acme"), or None if empty
+    """
+    if not company_name:
+        return None
+
+    words = re.sub(r"[^a-z0-9&]+", " ", company_name.lower()).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words) or None
+
+
+def company_cache_key(
+    company_name: Optional[str] = None,
+    website: Optional[str] = None,
+    linkedin_url: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Stable identity for a company, used to cache enrichment results.
+
+    Prefers the website domain, then the LinkedIn URL, then the name.
+
+    Args:
+        company_name: Company name
+        website: Company website URL
+        linkedin_url: LinkedIn company URL
+
+    Returns:
+        Key such as "domain:acme.com", or None if nothing identifies the company
+    """
+    domain = normalize_domain(website)
+    if domain:
+        return f"domain:{domain}"
+    linkedin = normalize_linkedin_url(linkedin_url)
+    if linkedin:
+        return f"linkedin:{linkedin}"
+    name = normalize_company_name(company_name)
+    if name:
+        return f"name:{name}"
+    return None
 
 
 def enrich_company(
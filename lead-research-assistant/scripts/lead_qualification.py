@@ -8,8 +8,16 @@ Supports configurable scoring weights and thresholds.
 
 import argparse
 import json
+import os
 import sys
-from typing import Any
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Union
 
 
 # Default ICP criteria with scoring weights
@@ -144,6 +152,17 @@ DEFAULT_ICP_CRITERIA = {
 }
 
 
+# Tier thresholds on the unrounded weighted total, checked in order
+TIER_THRESHOLDS = (("A", 80), ("B", 60), ("C", 40))
+
+TIER_RECOMMENDATIONS = {
+    "A": "High priority - Excellent fit. Pursue aggressively with personalized outreach.",
+    "B": "Good fit - Worth pursuing. Develop tailored messaging and multi-touch cadence.",
+    "C": "Moderate fit - Consider for nurture campaigns. Monitor for positive signals.",
+    "D": "Low priority - Poor fit. Deprioritize unless specific trigger events occur.",
+}
+
+
 def score_company_size(employee_count: int, criteria: dict) -> float:
     """Score based on company size."""
     for range_name, range_data in criteria["ranges"].items():
@@ -234,77 +253,72 @@ def score_digital_maturity(company_data: dict, criteria: dict) -> float:
     return min(score, 100)
 
 
-def score_growth_signals(signals_data: dict, criteria: dict) -> float:
-    """Score based on growth signals."""
-    score = 0
-    signal_scores = criteria["signals"]
+# SignalTables for the criteria dicts passed to the score_* functions,
+# keyed by their (signal, points) pairs
+_SIGNAL_TABLES: dict[tuple, "SignalTable"] = {}
+_SIGNAL_TABLES_MAX = 64
 
-    for signal, points in signal_scores.items():
-        if signals_data.get(signal):
-            score += points
 
-    return min(score, 100)
+def _signal_table(signals: dict[str, float]) -> "SignalTable":
+    key = tuple(signals.items())
+    table = _SIGNAL_TABLES.get(key)
+    if table is None:
+        if len(_SIGNAL_TABLES) >= _SIGNAL_TABLES_MAX:
+            _SIGNAL_TABLES.clear()
+        table = _SIGNAL_TABLES[key] = SignalTable(signals)
+    return table
 
 
-def score_buying_intent(intent_data: dict, criteria: dict) -> float:
-    """Score based on buying intent signals."""
-    score = 0
-    signal_scores = criteria["signals"]
+def score_growth_signals(signals_data: dict, criteria: dict) -> float:
+    """Score based on growth signals."""
+    return _signal_table(criteria["signals"]).score(signals_data)
 
-    for signal, points in signal_scores.items():
-        if intent_data.get(signal):
-            score += points
 
-    return min(score, 100)
+def score_buying_intent(intent_data: dict, criteria: dict) -> float:
+    """Score based on buying intent signals."""
+    return _signal_table(criteria["signals"]).score(intent_data)
 
 
 def score_engagement_potential(engagement_data: dict, criteria: dict) -> float:
     """Score based on engagement potential."""
-    score = 0
-    signal_scores = criteria["signals"]
-
-    for signal, points in signal_scores.items():
-        if engagement_data.get(signal):
-            score += points
-
-    return min(score, 100)
+    return _signal_table(criteria["signals"]).score(engagement_data)
 
 
 def score_deal_potential(deal_data: dict, criteria: dict) -> float:
     """Score based on deal potential factors."""
-    score = 0
-    factor_scores = criteria["factors"]
-
-    for factor, points in factor_scores.items():
-        if deal_data.get(factor):
-            score += points
-
-    return min(score, 100)
+    return _signal_table(criteria["factors"]).score(deal_data)
 
 
 def score_competitive_position(competitive_data: dict, criteria: dict) -> float:
     """Score based on competitive position."""
-    score = 0
-    factor_scores = criteria["factors"]
+    return _signal_table(criteria["factors"]).score(competitive_data)
 
-    for factor, points in factor_scores.items():
-        if competitive_data.get(factor):
-            score += points
 
-    return min(score, 100)
+def assign_tier(total_weighted: float, thresholds: tuple = TIER_THRESHOLDS) -> str:
+    """Map an unrounded weighted total to tier A-D."""
+    for tier, threshold in thresholds:
+        if total_weighted >= threshold:
+            return tier
+    return "D"
 
 
-def qualify_lead(company_data: dict, icp_criteria: dict = None) -> dict[str, Any]:
+def qualify_lead(
+    company_data: dict, icp_criteria: Union[dict, "CompiledICP", None] = None
+) -> dict[str, Any]:
     """
     Calculate comprehensive lead qualification score.
 
     Args:
         company_data: Dictionary with company information
-        icp_criteria: Custom ICP criteria (uses default if None)
+        icp_criteria: Custom ICP criteria (uses default if None), or a
+            CompiledICP (or MemoizedICP) to score with precomputed criteria
 
     Returns:
         Dictionary with scores and qualification tier
     """
+    if isinstance(icp_criteria, (CompiledICP, MemoizedICP)):
+        return icp_criteria.score(company_data)
+
     if icp_criteria is None:
         icp_criteria = DEFAULT_ICP_CRITERIA
 
@@ -461,47 +475,1055 @@ def qualify_lead(company_data: dict, icp_criteria: dict = None) -> dict[str, Any
     scores["weighted_total"] = round(total_weighted, 2)
 
     # 6. ASSIGN TIER AND RECOMMENDATION
-    if total_weighted >= 80:
-        scores["tier"] = "A"
-        scores["recommendation"] = (
-            "High priority - Excellent fit. Pursue aggressively with personalized outreach."
+    scores["tier"] = assign_tier(total_weighted)
+    scores["recommendation"] = TIER_RECOMMENDATIONS[scores["tier"]]
+
+    return scores
+
+
+class _RangeTable:
+    """
+    Range criterion (company size, revenue) prepared for lookup.
+
+    When ranges do not overlap, the matching range is found by binary
+    search over sorted lower bounds. Overlapping ranges fall back to a scan
+    in definition order, preserving first-match semantics.
+    """
+
+    __slots__ = ("ordered", "sorted_ranges", "mins", "bisectable")
+
+    def __init__(self, ranges: dict):
+        self.ordered = tuple(
+            (r["min"], r.get("max"), r["score"]) for r in ranges.values()
         )
-    elif total_weighted >= 60:
-        scores["tier"] = "B"
-        scores["recommendation"] = (
-            "Good fit - Worth pursuing. Develop tailored messaging and multi-touch cadence."
+        self.sorted_ranges = tuple(sorted(self.ordered, key=lambda r: r[0]))
+        self.mins = [r[0] for r in self.sorted_ranges]
+        self.bisectable = all(
+            prev[1] is not None and prev[1] < nxt[0]
+            for prev, nxt in zip(self.sorted_ranges, self.sorted_ranges[1:])
         )
-    elif total_weighted >= 40:
-        scores["tier"] = "C"
-        scores["recommendation"] = (
-            "Moderate fit - Consider for nurture campaigns. Monitor for positive signals."
+
+    def lookup(self, value: float) -> float:
+        if self.bisectable:
+            idx = bisect_right(self.mins, value) - 1
+            if idx < 0:
+                return 0
+            min_val, max_val, score = self.sorted_ranges[idx]
+            if min_val <= value and (max_val is None or value <= max_val):
+                return score
+            return 0
+
+        for min_val, max_val, score in self.ordered:
+            if max_val is None:
+                if value >= min_val:
+                    return score
+            elif min_val <= value <= max_val:
+                return score
+        return 0
+
+
+class SignalTable:
+    """
+    Signal group encoded as a fixed-width bitmask.
+
+    Bit ``i`` is set when the group's ``i``-th signal is present. The capped
+    score for every possible bitmask is precomputed into a 2^k lookup table,
+    so scoring an encoded group is a single index. Groups wider than
+    ``MAX_TABLE_BITS`` signals are summed per lookup instead.
+    """
+
+    MAX_TABLE_BITS = 16
+
+    __slots__ = ("signals", "names", "masks", "cap", "table")
+
+    def __init__(self, signals: dict[str, float], cap: float = 100):
+        self.signals = tuple(signals.items())
+        self.names = tuple(signals)
+        self.masks = tuple((signal, 1 << i) for i, signal in enumerate(self.names))
+        self.cap = cap
+        if len(self.signals) <= self.MAX_TABLE_BITS:
+            self.table = [self._sum_bits(bits) for bits in range(1 << len(self.signals))]
+        else:
+            self.table = None
+
+    def _sum_bits(self, bits: int) -> float:
+        # Same summation order as walking the criteria dict
+        score = 0
+        for i, (_, points) in enumerate(self.signals):
+            if bits >> i & 1:
+                score += points
+        return min(score, self.cap)
+
+    def encode(self, data: dict) -> int:
+        """Bitmask of the signals present (truthy) in ``data``."""
+        bits = 0
+        get = data.get
+        for signal, mask in self.masks:
+            if get(signal):
+                bits |= mask
+        return bits
+
+    def score_bits(self, bits: int) -> float:
+        """Capped score of an encoded bitmask."""
+        if self.table is not None:
+            return self.table[bits]
+        return self._sum_bits(bits)
+
+    def score(self, data: dict) -> float:
+        """Capped score of the signals present in ``data``."""
+        bits = self.encode(data)
+        if self.table is not None:
+            return self.table[bits]
+        return self._sum_bits(bits)
+
+
+class SubstringMatcher:
+    """
+    Substring index over a fixed list of (lowercased) patterns.
+
+    ``found_in(text)`` tells whether any pattern occurs in ``text`` using an
+    Aho-Corasick automaton; ``is_substring(text)`` tells whether ``text``
+    occurs in any pattern using a suffix automaton of the patterns. Both
+    take time proportional to ``len(text)`` however many patterns there
+    are. Short lists are faster to scan with ``in``, so the automata are
+    only built for more than ``MIN_INDEXED_PATTERNS`` patterns.
+    """
+
+    MIN_INDEXED_PATTERNS = 32
+
+    # Joins patterns for the suffix automaton; never part of a match
+    SEPARATOR = "\x00"
+
+    __slots__ = ("patterns", "indexed", "_goto", "_fail", "_out", "_suffix_next")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(patterns)
+        self.indexed = len(self.patterns) > self.MIN_INDEXED_PATTERNS
+        if self.indexed:
+            self._build_aho_corasick()
+            self._build_suffix_automaton()
+
+    def _build_aho_corasick(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out = [False]
+        for pattern in self.patterns:
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = goto[node][ch] = len(goto)
+                    goto.append({})
+                    out.append(False)
+                node = nxt
+            out[node] = True
+
+        # Breadth-first failure links; a node matches if any suffix does
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for ch, child in goto[node].items():
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0) if node else 0
+                out[child] = out[child] or out[fail[child]]
+                queue.append(child)
+
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def _build_suffix_automaton(self) -> None:
+        # Standard online construction over the separator-joined patterns
+        nexts: list[dict[str, int]] = [{}]
+        link = [-1]
+        length = [0]
+        last = 0
+        for ch in self.SEPARATOR.join(self.patterns):
+            cur = len(nexts)
+            nexts.append({})
+            link.append(0)
+            length.append(length[last] + 1)
+            state = last
+            while state != -1 and ch not in nexts[state]:
+                nexts[state][ch] = cur
+                state = link[state]
+            if state != -1:
+                nxt = nexts[state][ch]
+                if length[state] + 1 == length[nxt]:
+                    link[cur] = nxt
+                else:
+                    clone = len(nexts)
+                    nexts.append(dict(nexts[nxt]))
+                    link.append(link[nxt])
+                    length.append(length[state] + 1)
+                    while state != -1 and nexts[state].get(ch) == nxt:
+                        nexts[state][ch] = clone
+                        state = link[state]
+                    link[nxt] = link[cur] = clone
+            last = cur
+        self._suffix_next = nexts
+
+    def found_in(self, text: str) -> bool:
+        """True if any pattern is a substring of ``text``."""
+        if not self.indexed:
+            for pattern in self.patterns:
+                if pattern in text:
+                    return True
+            return False
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        if out[0]:
+            return True
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                return True
+        return False
+
+    def is_substring(self, text: str) -> bool:
+        """True if ``text`` is a substring of any pattern."""
+        if not self.indexed or self.SEPARATOR in text:
+            for pattern in self.patterns:
+                if text in pattern:
+                    return True
+            return False
+
+        nexts = self._suffix_next
+        node = 0
+        for ch in text:
+            node = nexts[node].get(ch)
+            if node is None:
+                return False
+        return True
+
+
+def extract_features(company_data: dict) -> dict[str, Any]:
+    """
+    Normalize the ICP-independent inputs of a company once.
+
+    Text fields are lowercased here so several compiled ICPs can score the
+    same company without repeating the work (see MultiICPScorer).
+
+    Args:
+        company_data: Dictionary with company information
+
+    Returns:
+        Feature dictionary for CompiledICP.score_features
+    """
+    industry = company_data.get("industry")
+    location = company_data.get("location")
+    tech_list = company_data.get("technologies", [])
+    return {
+        "company": company_data,
+        "employee_count": company_data.get("employee_count"),
+        "revenue": company_data.get("revenue"),
+        "industry": industry.lower() if industry else "",
+        "location": location.lower() if location else "",
+        "technologies": [tech.lower() for tech in tech_list] if tech_list else [],
+        # Signal bitmasks keyed by (field, signal names), shared by ICPs
+        # that use the same signal groups
+        "bits": {},
+    }
+
+
+class CompiledICP:
+    """
+    ICP criteria compiled once for scoring many companies.
+
+    Target lists are lowercased into sets and substring indexes up front
+    (see SubstringMatcher), range criteria are
+    sorted for binary search, signal groups become SignalTable bitmask
+    lookups and category/criterion weights are flattened, so nothing in
+    the criteria dict is re-walked per lead. ``score`` returns
+    exactly what ``qualify_lead`` returns for the same criteria.
+    """
+
+    def __init__(self, icp_criteria: Optional[dict] = None):
+        if icp_criteria is None:
+            icp_criteria = DEFAULT_ICP_CRITERIA
+        self.criteria = icp_criteria
+
+        # Firmographic
+        firm = icp_criteria["firmographic"]
+        firm_criteria = firm["criteria"]
+        self.firm_weight = firm["weight"]
+        self.size_ranges = _RangeTable(firm_criteria["company_size"]["ranges"])
+        self.revenue_ranges = _RangeTable(firm_criteria["revenue"]["ranges"])
+
+        industry = firm_criteria["industry_match"]
+        self.target_industries = tuple(i.lower() for i in industry["target_industries"])
+        self.target_industry_set = frozenset(self.target_industries)
+        self.industry_matcher = SubstringMatcher(self.target_industries)
+        self.industry_match = industry["score_match"]
+        self.industry_adjacent = industry["score_adjacent"]
+        self.industry_other = industry["score_other"]
+
+        geography = firm_criteria["geographic_match"]
+        self.target_regions = tuple(r.lower() for r in geography["target_regions"])
+        self.region_matcher = SubstringMatcher(self.target_regions)
+        self.geo_match = geography["score_match"]
+        self.geo_other = geography["score_other"]
+
+        # Same criterion-name to score-key mapping as qualify_lead
+        self.firm_weights = tuple(
+            (name.replace("_match", ""), data["weight"])
+            for name, data in firm_criteria.items()
         )
-    else:
-        scores["tier"] = "D"
-        scores["recommendation"] = (
-            "Low priority - Poor fit. Deprioritize unless specific trigger events occur."
+
+        # Technographic
+        tech = icp_criteria["technographic"]
+        tech_criteria = tech["criteria"]
+        self.tech_weight = tech["weight"]
+        stack = tech_criteria["tech_stack_compatibility"]
+        self.compatible_technologies = frozenset(
+            t.lower() for t in stack["compatible_technologies"]
+        )
+        self.score_per_match = stack["score_per_match"]
+        self.max_tech_score = stack["max_score"]
+        self.tech_stack_weight = stack["weight"]
+
+        maturity = tech_criteria["digital_maturity"]
+        indicators = maturity["indicators"]
+        # Indicator names are company fields; see score_digital_maturity
+        self.maturity_indicators = SignalTable(
+            {
+                "has_api": indicators["has_api"],
+                "has_mobile_app": indicators["has_mobile_app"],
+                "uses_cloud": indicators["cloud_infrastructure"],
+                "modern_stack": indicators["modern_tech_stack"],
+            }
+        )
+        self.maturity_weight = maturity["weight"]
+
+        # Behavioral
+        behav = icp_criteria["behavioral"]
+        behav_criteria = behav["criteria"]
+        self.behav_weight = behav["weight"]
+        self.growth_signals = SignalTable(behav_criteria["growth_signals"]["signals"])
+        self.growth_weight = behav_criteria["growth_signals"]["weight"]
+        self.intent_signals = SignalTable(behav_criteria["buying_intent"]["signals"])
+        self.intent_weight = behav_criteria["buying_intent"]["weight"]
+        self.engagement_signals = SignalTable(
+            behav_criteria["engagement_potential"]["signals"]
+        )
+        self.engagement_weight = behav_criteria["engagement_potential"]["weight"]
+
+        # Strategic
+        strat = icp_criteria["strategic"]
+        strat_criteria = strat["criteria"]
+        self.strat_weight = strat["weight"]
+        self.deal_factors = SignalTable(strat_criteria["deal_potential"]["factors"])
+        self.deal_weight = strat_criteria["deal_potential"]["weight"]
+        self.competitive_factors = SignalTable(
+            strat_criteria["competitive_position"]["factors"]
+        )
+        self.competitive_weight = strat_criteria["competitive_position"]["weight"]
+
+    def score_industry(self, industry: str) -> float:
+        """Score an industry string (same semantics as score_industry)."""
+        return self._score_industry_lower(industry.lower() if industry else "")
+
+    def _score_industry_lower(self, industry_lower: str) -> float:
+        if industry_lower in self.target_industry_set:
+            return self.industry_match
+        matcher = self.industry_matcher
+        if matcher.found_in(industry_lower) or matcher.is_substring(industry_lower):
+            return self.industry_adjacent
+        return self.industry_other
+
+    def score_geography(self, location: str) -> float:
+        """Score a location string (same semantics as score_geography)."""
+        return self._score_geography_lower(location.lower() if location else "")
+
+    def _score_geography_lower(self, location_lower: str) -> float:
+        if self.region_matcher.found_in(location_lower):
+            return self.geo_match
+        return self.geo_other
+
+    def score_tech_stack(self, tech_list: list[str]) -> float:
+        """Score a technology list (same semantics as score_tech_stack)."""
+        if not tech_list:
+            return 0
+        return self._score_tech_lower([tech.lower() for tech in tech_list])
+
+    def _score_tech_lower(self, tech_lower: list[str]) -> float:
+        if not tech_lower:
+            return 0
+        compatible = self.compatible_technologies
+        matches = sum(1 for tech in tech_lower if tech in compatible)
+        return min(matches * self.score_per_match, self.max_tech_score)
+
+    def encode_signals(self, company_data: dict) -> dict[str, int]:
+        """
+        Encode a company's indicators and signal groups as bitmasks.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            Mapping of company field ("maturity" for the digital maturity
+            indicators) to bitmask, in the order of this ICP's signals
+        """
+        encoded = {"maturity": self.maturity_indicators.encode(company_data)}
+        for field, table in self.signal_tables():
+            encoded[field] = table.encode(company_data.get(field, {}))
+        return encoded
+
+    def signal_tables(self) -> tuple[tuple[str, SignalTable], ...]:
+        """(company field, SignalTable) pairs for the behavioral/strategic groups."""
+        return (
+            ("growth_signals", self.growth_signals),
+            ("buying_intent", self.intent_signals),
+            ("engagement", self.engagement_signals),
+            ("deal_factors", self.deal_factors),
+            ("competitive", self.competitive_factors),
         )
 
-    return scores
+    @staticmethod
+    def _group_score(features: dict[str, Any], field: Optional[str], table: SignalTable) -> float:
+        # field None means the indicators live on the company itself
+        key = (field, table.names)
+        bits = features["bits"].get(key)
+        if bits is None:
+            company_data = features["company"]
+            data = company_data if field is None else company_data.get(field, {})
+            bits = features["bits"][key] = table.encode(data)
+        return table.score_bits(bits)
+
+    def score(self, company_data: dict) -> dict[str, Any]:
+        """
+        Score a company against the compiled criteria.
+
+        Reads the company directly rather than through extract_features:
+        with one ICP there is nothing to share, and building the feature
+        dictionary costs as much as the scoring it would save.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            Same dictionary qualify_lead returns
+        """
+        get = company_data.get
+        employee_count = get("employee_count")
+        revenue = get("revenue")
+        industry = get("industry")
+        location = get("location")
+        tech_list = get("technologies")
+        return self._assemble(
+            self.size_ranges.lookup(employee_count) if employee_count else 0,
+            self.revenue_ranges.lookup(revenue) if revenue else 0,
+            self._score_industry_lower(industry.lower()) if industry else 0,
+            self._score_geography_lower(location.lower()) if location else 0,
+            self._score_tech_lower([tech.lower() for tech in tech_list]) if tech_list else 0,
+            self.maturity_indicators.score(company_data),
+            self.growth_signals.score(get("growth_signals", {})),
+            self.intent_signals.score(get("buying_intent", {})),
+            self.engagement_signals.score(get("engagement", {})),
+            self.deal_factors.score(get("deal_factors", {})),
+            self.competitive_factors.score(get("competitive", {})),
+        )
+
+    def score_features(self, features: dict[str, Any]) -> dict[str, Any]:
+        """
+        Score features from extract_features against the compiled criteria.
+
+        Args:
+            features: Result of extract_features for one company
+
+        Returns:
+            Same dictionary qualify_lead returns
+        """
+        employee_count = features["employee_count"]
+        revenue = features["revenue"]
+        industry = features["industry"]
+        location = features["location"]
+        return self._assemble(
+            self.size_ranges.lookup(employee_count) if employee_count else 0,
+            self.revenue_ranges.lookup(revenue) if revenue else 0,
+            self._score_industry_lower(industry) if industry else 0,
+            self._score_geography_lower(location) if location else 0,
+            self._score_tech_lower(features["technologies"]),
+            self._group_score(features, None, self.maturity_indicators),
+            self._group_score(features, "growth_signals", self.growth_signals),
+            self._group_score(features, "buying_intent", self.intent_signals),
+            self._group_score(features, "engagement", self.engagement_signals),
+            self._group_score(features, "deal_factors", self.deal_factors),
+            self._group_score(features, "competitive", self.competitive_factors),
+        )
+
+    def _assemble(
+        self,
+        size_score: float,
+        revenue_score: float,
+        industry_score: float,
+        geography_score: float,
+        tech_stack_score: float,
+        maturity_score: float,
+        growth_score: float,
+        intent_score: float,
+        engagement_score: float,
+        deal_score: float,
+        competitive_score: float,
+    ) -> dict[str, Any]:
+        # Weighted totals, tier and the qualify_lead result dict
+        firm = {
+            "company_size": size_score,
+            "revenue": revenue_score,
+            "industry": industry_score,
+            "geography": geography_score,
+        }
+        firm_total = 0
+        for key, weight in self.firm_weights:
+            firm_total += firm.get(key, 0) * weight
+        firm["total"] = firm_total
+        firm_weighted = firm["weighted"] = firm_total * self.firm_weight
+
+        tech_total = (
+            tech_stack_score * self.tech_stack_weight
+            + maturity_score * self.maturity_weight
+        )
+        tech_weighted = tech_total * self.tech_weight
+
+        behav_total = (
+            growth_score * self.growth_weight
+            + intent_score * self.intent_weight
+            + engagement_score * self.engagement_weight
+        )
+        behav_weighted = behav_total * self.behav_weight
+
+        strat_total = (
+            deal_score * self.deal_weight
+            + competitive_score * self.competitive_weight
+        )
+        strat_weighted = strat_total * self.strat_weight
+
+        total_weighted = firm_weighted + tech_weighted + behav_weighted + strat_weighted
+        tier = assign_tier(total_weighted)
+
+        return {
+            "firmographic": firm,
+            "technographic": {
+                "tech_stack": tech_stack_score,
+                "digital_maturity": maturity_score,
+                "total": tech_total,
+                "weighted": tech_weighted,
+            },
+            "behavioral": {
+                "growth_signals": growth_score,
+                "buying_intent": intent_score,
+                "engagement": engagement_score,
+                "total": behav_total,
+                "weighted": behav_weighted,
+            },
+            "strategic": {
+                "deal_potential": deal_score,
+                "competitive": competitive_score,
+                "total": strat_total,
+                "weighted": strat_weighted,
+            },
+            "weighted_total": round(total_weighted, 2),
+            "tier": tier,
+            "recommendation": TIER_RECOMMENDATIONS[tier],
+        }
+
+
+def compile_icp(
+    icp_criteria: Union[dict, CompiledICP, "MemoizedICP", "MultiICPScorer", None] = None
+) -> Union[CompiledICP, "MemoizedICP", "MultiICPScorer"]:
+    """
+    Compile ICP criteria, passing already compiled criteria through.
+
+    Args:
+        icp_criteria: ICP criteria dict, CompiledICP, MemoizedICP,
+            MultiICPScorer, or None for defaults
+
+    Returns:
+        CompiledICP (or the MemoizedICP or MultiICPScorer passed in)
+    """
+    if isinstance(icp_criteria, (CompiledICP, MemoizedICP, MultiICPScorer)):
+        return icp_criteria
+    return CompiledICP(icp_criteria)
+
+
+def _copy_scores(scores: dict[str, Any]) -> dict[str, Any]:
+    # qualify_lead results nest one level of category dicts
+    return {
+        key: dict(value) if isinstance(value, dict) else value for key, value in scores.items()
+    }
+
+
+class MemoizedICP:
+    """
+    Compiled ICP wrapper that memoizes results by feature fingerprint.
+
+    Leads often share every input the ICP reads (size and revenue band,
+    industry, region, technologies, signals) and so score identically.
+    The fingerprint normalizes those inputs the way the wrapped ICP sees
+    them, and results are kept in a bounded LRU memo. Each call returns
+    its own copy of the memoized result, so callers may modify it.
+
+    The wrapped CompiledICP (or GeneratedICP) is ``icp``; ``score`` and
+    ``criteria`` match it, so a MemoizedICP can be passed anywhere ICP
+    criteria are accepted. The memo is per process; pickled copies
+    (worker processes) start empty.
+    """
+
+    def __init__(
+        self,
+        icp_criteria: Union[dict, CompiledICP, "MemoizedICP", None] = None,
+        max_entries: int = 10_000,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if isinstance(icp_criteria, MemoizedICP):
+            icp_criteria = icp_criteria.icp
+        self.icp = compile_icp(icp_criteria)
+        self.max_entries = max_entries
+        self._reset()
+
+    def _reset(self) -> None:
+        # Signal groups in fingerprint order; None reads the company itself
+        self._signal_groups = ((None, self.icp.maturity_indicators),) + tuple(
+            self.icp.signal_tables()
+        )
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def criteria(self) -> dict:
+        """ICP criteria dict of the wrapped ICP."""
+        return self.icp.criteria
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"icp": self.icp, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.icp = state["icp"]
+        self.max_entries = state["max_entries"]
+        self._reset()
+
+    def fingerprint(self, company_data: dict) -> tuple:
+        """
+        Canonical key of the inputs that affect this ICP's score.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            Hashable tuple; companies with equal fingerprints get equal results
+        """
+        icp = self.icp
+        employee_count = company_data.get("employee_count")
+        revenue = company_data.get("revenue")
+        industry = company_data.get("industry")
+        location = company_data.get("location")
+        technologies = company_data.get("technologies")
+        compatible = icp.compatible_technologies
+        key = [
+            icp.size_ranges.lookup(employee_count) if employee_count else 0,
+            icp.revenue_ranges.lookup(revenue) if revenue else 0,
+            industry.lower() if industry else "",
+            location.lower() if location else "",
+            # Tech score depends only on the number of compatible entries
+            sum(1 for tech in technologies if tech.lower() in compatible)
+            if technologies
+            else 0,
+        ]
+        for field, table in self._signal_groups:
+            key.append(table.encode(company_data if field is None else company_data.get(field, {})))
+        return tuple(key)
+
+    def score(self, company_data: dict) -> dict[str, Any]:
+        """
+        Score a company, reusing the result of an earlier identical lead.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            Same dictionary qualify_lead returns (a fresh copy per call)
+        """
+        key = self.fingerprint(company_data)
+        memo = self._memo
+        with self._lock:
+            result = memo.get(key)
+            if result is not None:
+                memo.move_to_end(key)
+                self.hits += 1
+                return _copy_scores(result)
+            self.misses += 1
+
+        result = self.icp.score(company_data)
+        with self._lock:
+            memo[key] = result
+            if len(memo) > self.max_entries:
+                memo.popitem(last=False)
+                self.evictions += 1
+        return _copy_scores(result)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Memo counters.
+
+        Returns:
+            Dictionary with entries, hits, misses, hit_rate and evictions
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._memo),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+class MultiICPScorer:
+    """
+    Scores each company against several named ICPs in one pass.
+
+    Feature extraction (lowercasing industry, location and technologies) is
+    done once per company and shared by every profile. The best-fit ICP is
+    the profile with the highest weighted total; ties go to the profile
+    listed first.
+    """
+
+    def __init__(self, profiles: dict[str, Union[dict, CompiledICP, None]]):
+        if not profiles:
+            raise ValueError("At least one ICP profile is required")
+        self.names = list(profiles)
+        self.profiles = [compile_icp(criteria) for criteria in profiles.values()]
+
+    def score_all(self, company_data: dict) -> list[dict[str, Any]]:
+        """
+        Qualify a company against every profile.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            One qualify_lead result per profile, in profile order
+        """
+        features = extract_features(company_data)
+        return [icp.score_features(features) for icp in self.profiles]
+
+    def qualify(self, company_data: dict) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Qualify a company and pick its best-fit ICP.
+
+        Args:
+            company_data: Dictionary with company information
+
+        Returns:
+            Tuple of (best-fit qualification, fit dictionary with
+            ``best_fit`` profile name and per-profile ``scores``)
+        """
+        qualifications = self.score_all(company_data)
+        best = 0
+        for i, qualification in enumerate(qualifications):
+            if qualification["weighted_total"] > qualifications[best]["weighted_total"]:
+                best = i
+
+        fit = {
+            "best_fit": self.names[best],
+            "scores": {
+                name: qualification["weighted_total"]
+                for name, qualification in zip(self.names, qualifications)
+            },
+        }
+        return qualifications[best], fit
+
+    def score_matrix(self, companies: Iterable[dict]) -> list[list[float]]:
+        """
+        Build the lead x ICP matrix of weighted totals.
+
+        Args:
+            companies: Company data dictionaries
+
+        Returns:
+            One row per company with a column per profile (``names`` order)
+        """
+        return [
+            [qualification["weighted_total"] for qualification in self.score_all(company)]
+            for company in companies
+        ]
+
+
+def load_icp_profiles(paths: list[str]) -> dict[str, dict]:
+    """
+    Load named ICP configs from JSON files.
+
+    Each path may be given as ``name=path``; otherwise the file name
+    without its extension is used as the profile name.
+
+    Args:
+        paths: ICP config paths
+
+    Returns:
+        Mapping of profile name to criteria, in the order given
+    """
+    profiles = {}
+    for value in paths:
+        name, sep, path = value.partition("=")
+        if not sep:
+            path = value
+            name = Path(value).stem
+        if name in profiles:
+            raise ValueError(f"Duplicate ICP profile name: {name}")
+        with open(path) as f:
+            profiles[name] = json.load(f)
+    return profiles
+
+
+def qualification_record(
+    company_data: dict,
+    icp_criteria: Union[dict, CompiledICP, MultiICPScorer, None] = None,
+    qualification_date: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Qualify one company and wrap the scores in the CLI's output record.
+
+    Args:
+        company_data: Dictionary with company information
+        icp_criteria: ICP criteria, CompiledICP or MultiICPScorer
+        qualification_date: ISO date to record (default: today)
+
+    Returns:
+        Dictionary with ``company_name``, ``qualification_date`` and
+        ``scores`` (plus ``icp_fit`` when scoring several ICPs)
+    """
+    icp_fit = None
+    if isinstance(icp_criteria, MultiICPScorer):
+        scores, icp_fit = icp_criteria.qualify(company_data)
+    else:
+        scores = qualify_lead(company_data, icp_criteria)
+
+    record = {
+        "company_name": company_data.get("company_name", "Unknown"),
+        "qualification_date": qualification_date or date.today().isoformat(),
+        "scores": scores,
+    }
+    if icp_fit:
+        record["icp_fit"] = icp_fit
+    return record
+
+
+def qualify_lines(
+    lines: list[tuple[int, str]],
+    icp_criteria: Union[CompiledICP, MultiICPScorer],
+) -> tuple[list[str], dict[str, int]]:
+    """
+    Qualify a chunk of JSONL company records.
+
+    Lines that are not JSON objects, or that fail to score, produce an
+    ``{"line": n, "error": ...}`` record in place so output lines stay
+    aligned with input lines.
+
+    Args:
+        lines: (line number, JSON text) pairs
+        icp_criteria: Compiled ICP criteria or MultiICPScorer
+
+    Returns:
+        Tuple of (output JSON lines, counts per tier plus ``errors``)
+    """
+    qualification_date = date.today().isoformat()
+    counts = {tier: 0 for tier in TIER_RECOMMENDATIONS}
+    counts["errors"] = 0
+    output = []
+    for line_number, text in lines:
+        try:
+            company_data = json.loads(text)
+            if not isinstance(company_data, dict):
+                raise ValueError("record is not a JSON object")
+            record = qualification_record(company_data, icp_criteria, qualification_date)
+        except Exception as e:
+            counts["errors"] += 1
+            output.append(json.dumps({"line": line_number, "error": str(e)}))
+            continue
+        counts[record["scores"]["tier"]] += 1
+        output.append(json.dumps(record))
+    return output, counts
+
+
+# Per-process ICP for streaming workers, set once by _init_stream_worker
+_STREAM_ICP: Optional[Union[CompiledICP, MultiICPScorer]] = None
+
+
+def _init_stream_worker(icp_criteria: Union[CompiledICP, MultiICPScorer]) -> None:
+    global _STREAM_ICP
+    _STREAM_ICP = icp_criteria
+
+
+def _qualify_lines_in_worker(lines: list[tuple[int, str]]) -> tuple[list[str], dict[str, int]]:
+    return qualify_lines(lines, _STREAM_ICP)
+
+
+def _read_chunks(stream: IO[str], chunk_size: int) -> Iterator[tuple[float, list]]:
+    """Group non-blank lines into numbered chunks, with the time each chunk started."""
+    chunk: list[tuple[int, str]] = []
+    started = 0.0
+    for line_number, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        if not chunk:
+            started = time.perf_counter()
+        chunk.append((line_number, text))
+        if len(chunk) >= chunk_size:
+            yield started, chunk
+            chunk = []
+    if chunk:
+        yield started, chunk
+
+
+def qualify_stream(
+    stream: IO[str],
+    icp_criteria: Union[dict, CompiledICP, MultiICPScorer, None] = None,
+    workers: int = 1,
+    chunk_size: int = 256,
+) -> Iterator[tuple[float, list[str], dict[str, int]]]:
+    """
+    Qualify JSONL company records as they are read.
+
+    The ICP is compiled once and kept warm for the whole stream (in every
+    worker process when ``workers`` > 1). Chunks are scored in order with
+    at most four chunks per worker outstanding, so memory stays bounded
+    however long the stream is.
+
+    Args:
+        stream: Text stream with one company JSON object per line
+        icp_criteria: ICP criteria, CompiledICP or MultiICPScorer
+        workers: Worker processes (1 scores in this process)
+        chunk_size: Records per chunk
+
+    Yields:
+        Tuples of (time the chunk's first line was read, output JSON
+        lines, counts per tier plus ``errors``), in input order
+    """
+    icp = compile_icp(icp_criteria)
+    chunks = _read_chunks(stream, max(chunk_size, 1))
+
+    if workers <= 1:
+        for started, chunk in chunks:
+            yield (started, *qualify_lines(chunk, icp))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_stream_worker, initargs=(icp,)
+    ) as pool:
+        pending: deque = deque()
+        for started, chunk in chunks:
+            pending.append((started, pool.submit(_qualify_lines_in_worker, chunk)))
+            if len(pending) >= workers * 4:
+                started, future = pending.popleft()
+                yield (started, *future.result())
+        while pending:
+            started, future = pending.popleft()
+            yield (started, *future.result())
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_stream(
+    input_path: str,
+    output_path: str,
+    icp_criteria: Union[dict, CompiledICP, MultiICPScorer, None] = None,
+    workers: int = 1,
+    chunk_size: int = 256,
+) -> dict[str, Any]:
+    """
+    Stream JSONL records from a file or stdin ("-") to a file or stdout ("-").
+
+    Args:
+        input_path: JSONL input path, or "-" for stdin
+        output_path: JSONL output path, or "-" for stdout
+        icp_criteria: ICP criteria, CompiledICP or MultiICPScorer
+        workers: Worker processes
+        chunk_size: Records per chunk
+
+    Returns:
+        Statistics: ``records``, ``errors``, ``tiers``, ``elapsed``,
+        ``records_per_second`` and chunk ``latency_ms`` percentiles
+        (first line read to chunk written)
+    """
+    source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    sink = sys.stdout if output_path == "-" else open(output_path, "w", encoding="utf-8")
+
+    tiers = {tier: 0 for tier in TIER_RECOMMENDATIONS}
+    errors = 0
+    latencies = []
+    start = time.perf_counter()
+    try:
+        for started, output, counts in qualify_stream(source, icp_criteria, workers, chunk_size):
+            sink.write("\n".join(output) + "\n")
+            sink.flush()
+            latencies.append(time.perf_counter() - started)
+            errors += counts.pop("errors")
+            for tier, count in counts.items():
+                tiers[tier] += count
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - start
+
+    records = sum(tiers.values()) + errors
+    latencies.sort()
+    return {
+        "records": records,
+        "errors": errors,
+        "tiers": tiers,
+        "elapsed": elapsed,
+        "records_per_second": records / elapsed if elapsed else 0,
+        "latency_ms": {
+            name: _percentile(latencies, pct) * 1000
+            for name, pct in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+        },
+    }
 
 
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description="Qualify leads against ICP criteria")
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--company-data",
         type=str,
-        required=True,
         help="Path to JSON file with company data",
     )
+    source.add_argument(
+        "--input",
+        type=str,
+        help="JSONL file with one company per line, or - for stdin (streaming mode)",
+    )
     parser.add_argument(
-        "--icp-criteria", type=str, help="Path to JSON file with custom ICP criteria"
+        "--icp-criteria",
+        type=str,
+        nargs="+",
+        help=(
+            "Path to JSON file with custom ICP criteria. Give several "
+            "(optionally as name=path) to score against each and pick the best fit"
+        ),
     )
     parser.add_argument(
         "--output",
         type=str,
-        default="qualification_scores.json",
-        help="Output file path (default: qualification_scores.json)",
+        help=(
+            "Output file path (default: qualification_scores.json). With --input, "
+            "JSONL output path or - for stdout (default: -)"
+        ),
     )
     parser.add_argument(
         "--format",
@@ -510,47 +1532,133 @@ def main():
         default="json",
         help="Output format (default: json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --input streaming (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Records scored per chunk with --input (default: 256)",
+    )
+    parser.add_argument(
+        "--memo-size",
+        type=int,
+        default=0,
+        help=(
+            "With --input, memoize results for up to this many distinct feature "
+            "fingerprints per worker; pays off when many records are duplicates "
+            "(default: 0, disabled)"
+        ),
+    )
 
     args = parser.parse_args()
 
-    # Load company data
-    try:
-        with open(args.company_data) as f:
-            company_data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: Company data file not found: {args.company_data}")
+    if args.input and args.format == "summary":
+        print("Error: --format summary applies to --company-data only", file=sys.stderr)
         return 1
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in company data file: {args.company_data}")
+    max_workers = os.cpu_count() or 1
+    if not 1 <= args.workers <= max_workers:
+        print(f"Error: --workers must be between 1 and {max_workers}", file=sys.stderr)
+        return 1
+    if args.memo_size < 0:
+        print("Error: --memo-size must be at least 0", file=sys.stderr)
         return 1
 
+    # Load company data
+    company_data = None
+    if args.company_data:
+        try:
+            with open(args.company_data) as f:
+                company_data = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: Company data file not found: {args.company_data}")
+            return 1
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON in company data file: {args.company_data}")
+            return 1
+
     # Load ICP criteria if provided
     icp_criteria = None
     if args.icp_criteria:
         try:
-            with open(args.icp_criteria) as f:
-                icp_criteria = json.load(f)
-        except FileNotFoundError:
-            print(f"Error: ICP criteria file not found: {args.icp_criteria}")
+            profiles = load_icp_profiles(args.icp_criteria)
+            if len(profiles) == 1:
+                icp_criteria = next(iter(profiles.values()))
+            else:
+                icp_criteria = MultiICPScorer(profiles)
+        except FileNotFoundError as e:
+            print(f"Error: ICP criteria file not found: {e.filename}")
             return 1
         except json.JSONDecodeError:
-            print(f"Error: Invalid JSON in ICP criteria file: {args.icp_criteria}")
+            print(f"Error: Invalid JSON in ICP criteria file: {' '.join(args.icp_criteria)}")
+            return 1
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+
+    # Stream JSONL records; progress goes to stderr since stdout may be data
+    if args.input:
+        output_path = args.output or "-"
+        try:
+            if args.memo_size and not isinstance(icp_criteria, MultiICPScorer):
+                icp_criteria = MemoizedICP(icp_criteria, args.memo_size)
+            stats = run_stream(
+                args.input, output_path, icp_criteria, args.workers, args.chunk_size
+            )
+        except FileNotFoundError as e:
+            print(f"Error: File not found: {e.filename}", file=sys.stderr)
+            return 1
+        except (KeyError, TypeError) as e:
+            print(f"Error: Invalid ICP criteria: {e!r}", file=sys.stderr)
+            return 1
+        except BrokenPipeError:
+            # Downstream reader (e.g. head) closed the pipe; silence the
+            # final flush of stdout at exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
             return 1
 
+        latency = stats["latency_ms"]
+        print(
+            f"✓ Qualified {stats['records']:,} records ({stats['errors']:,} errors) in "
+            f"{stats['elapsed']:.2f}s: {stats['records_per_second']:,.0f} records/s",
+            file=sys.stderr,
+        )
+        print(
+            f"   Chunk latency (read to written): p50 {latency['p50']:.1f} ms, "
+            f"p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms, "
+            f"max {latency['max']:.1f} ms",
+            file=sys.stderr,
+        )
+        print(
+            "   Tiers: " + ", ".join(f"{t}={n:,}" for t, n in stats["tiers"].items()),
+            file=sys.stderr,
+        )
+        if isinstance(icp_criteria, MemoizedICP) and args.workers == 1:
+            memo_stats = icp_criteria.stats()
+            print(
+                f"   Memo: {memo_stats['hit_rate'] * 100:.1f}% hit rate "
+                f"({memo_stats['hits']:,} hits, {memo_stats['evictions']:,} evicted)",
+                file=sys.stderr,
+            )
+        if output_path != "-":
+            print(f"✓ Qualification scores saved to {output_path}", file=sys.stderr)
+        return 0
+
     # Qualify the lead
-    scores = qualify_lead(company_data, icp_criteria)
+    output_data = qualification_record(company_data, icp_criteria)
+    scores = output_data["scores"]
+    icp_fit = output_data.get("icp_fit")
 
     # Output results
     if args.format == "json":
-        output_data = {
-            "company_name": company_data.get("company_name", "Unknown"),
-            "qualification_date": "2025-10-18",  # In production, use datetime.now()
-            "scores": scores,
-        }
-
-        with open(args.output, "w") as f:
+        output_path = args.output or "qualification_scores.json"
+        with open(output_path, "w") as f:
             json.dump(output_data, f, indent=2)
-        print(f"✓ Qualification scores saved to {args.output}")
+        print(f"✓ Qualification scores saved to {output_path}")
     else:
         # Print summary to console
         print("\n" + "=" * 70)
@@ -562,6 +1670,11 @@ def main():
         print(f"Tier: {scores['tier']}")
         print(f"\nRecommendation: {scores['recommendation']}")
 
+        if icp_fit:
+            print(f"\n--- ICP Fit (best: {icp_fit['best_fit']}) ---")
+            for name, score in icp_fit["scores"].items():
+                print(f"{name:15} {score:.1f}")
+
         print("\n--- Score Breakdown ---")
         print(
             f"Firmographic:   {scores['firmographic']['total']:.1f} (weighted: {scores['firmographic']['weighted']:.1f})"
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Lead Result Records
+
+Compact in-memory form of processed leads used by the batch processor.
+A processed lead used to be ``lead.copy()`` plus a nested enrichment plan
+and a nested qualification dict repeating the full recommendation
+sentence. ``LeadResult`` instead keeps:
+
+- a reference to the input lead (no copy)
+- the enrichment plan as an ``EnrichmentPlan`` record: one flat tuple of
+  values under a layout shared by every plan of the same shape, with tool
+  and data-source names interned and lead fields referenced, not copied
+- the scores as a ``Scores`` record: one flat tuple of sub-scores plus the
+  tier, with the recommendation looked up from the tier on output
+- the multi-ICP fit as an ``ICPFit`` record sharing the profile names
+
+All records use ``__slots__``. ``to_dict()`` produces exactly the JSON
+shape the batch output has always had; ResultWriter and CheckpointLog
+call it at output time. ``from_dict()`` turns replayed checkpoint
+records back into records.
+"""
+
+import sys
+from typing import Any, Iterator, Optional
+
+from lead_qualification import TIER_RECOMMENDATIONS
+
+# Keys of qualify_lead's category dicts, in output order
+SCORE_LAYOUT = (
+    ("firmographic", ("company_size", "revenue", "industry", "geography", "total", "weighted")),
+    ("technographic", ("tech_stack", "digital_maturity", "total", "weighted")),
+    ("behavioral", ("growth_signals", "buying_intent", "engagement", "total", "weighted")),
+    ("strategic", ("deal_potential", "competitive", "total", "weighted")),
+)
+
+# (category, key) -> index into Scores.values
+SCORE_INDEX = {
+    (category, key): i
+    for i, (category, key) in enumerate(
+        (category, key) for category, keys in SCORE_LAYOUT for key in keys
+    )
+}
+
+# Plan keys whose values come from a small vocabulary (tool names, statuses)
+INTERNED_PLAN_KEYS = frozenset(("enrichment_status", "recommended_mcp_tool", "priority"))
+
+# Plan layouts and tuples of tool names, shared by every plan that has
+# the same one
+_PLAN_TUPLES: dict[tuple, tuple] = {}
+
+# Keys a processed lead adds on top of the input lead's fields
+RESULT_FIELDS = frozenset(
+    ("enrichment_plan", "qualification", "icp_fit", "status", "error", "processed_at")
+)
+
+
+class Scores:
+    """
+    Qualification scores of one lead.
+
+    Sub-scores, category totals and weighted values are stored in one
+    tuple in ``SCORE_LAYOUT`` order (keeping their int/float types, so the
+    JSON output is unchanged). The recommendation is not stored.
+    """
+
+    __slots__ = ("values", "weighted_total", "tier")
+
+    def __init__(self, values: tuple, weighted_total: float, tier: str):
+        self.values = values
+        self.weighted_total = weighted_total
+        self.tier = tier
+
+    @property
+    def recommendation(self) -> str:
+        """Recommendation sentence for the tier."""
+        return TIER_RECOMMENDATIONS[self.tier]
+
+    def get(self, category: str, key: str) -> Any:
+        """One value, e.g. ``get("firmographic", "revenue")``."""
+        return self.values[SCORE_INDEX[(category, key)]]
+
+    @classmethod
+    def from_dict(cls, qualification: dict[str, Any]) -> "Scores":
+        """Build from a qualify_lead result."""
+        return cls(
+            tuple(
+                qualification[category][key] for category, keys in SCORE_LAYOUT for key in keys
+            ),
+            qualification["weighted_total"],
+            sys.intern(qualification["tier"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rebuild the qualify_lead result."""
+        values = iter(self.values)
+        result: dict[str, Any] = {
+            category: {key: next(values) for key in keys} for category, keys in SCORE_LAYOUT
+        }
+        result["weighted_total"] = self.weighted_total
+        result["tier"] = self.tier
+        result["recommendation"] = self.recommendation
+        return result
+
+
+class ICPFit:
+    """
+    Best-fit ICP of one lead scored against several profiles.
+
+    ``names`` is the scorer's profile list, shared by every record.
+    """
+
+    __slots__ = ("names", "scores", "best")
+
+    def __init__(self, names: list[str], scores: tuple, best: int):
+        self.names = names
+        self.scores = scores
+        self.best = best
+
+    @property
+    def best_fit(self) -> str:
+        """Name of the best-fit profile."""
+        return self.names[self.best]
+
+    @classmethod
+    def from_dict(cls, fit: dict[str, Any], names: Optional[list[str]] = None) -> "ICPFit":
+        """Build from a MultiICPScorer.qualify fit dictionary."""
+        if names is None:
+            names = list(fit["scores"])
+        return cls(
+            names,
+            tuple(fit["scores"][name] for name in names),
+            names.index(fit["best_fit"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rebuild the fit dictionary."""
+        return {"best_fit": self.best_fit, "scores": dict(zip(self.names, self.scores))}
+
+
+class EnrichmentPlan:
+    """
+    Enrichment plan of one lead.
+
+    The plan's nested dict structure (keys, and which values are dicts)
+    is a ``layout`` shared by every plan of the same shape; ``values``
+    holds the leaf values in layout order in one flat tuple. Lists of tool
+    or data-source names are shared tuples of interned strings, and
+    strings taken from the lead are the lead's own objects.
+    """
+
+    __slots__ = ("layout", "values")
+
+    def __init__(self, layout: tuple, values: tuple):
+        self.layout = layout
+        self.values = values
+
+    @classmethod
+    def from_dict(cls, plan: dict[str, Any]) -> "EnrichmentPlan":
+        """Build from a generate_enrichment_plan result."""
+        values: list[Any] = []
+        layout = _plan_layout(plan, values)
+        return cls(_PLAN_TUPLES.setdefault(layout, layout), tuple(values))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rebuild the plan dictionary."""
+        return _expand_plan(self.layout, iter(self.values))
+
+
+def _plan_layout(data: dict[str, Any], values: list[Any]) -> tuple:
+    # (key, kind) pairs: kind is a sub-layout for dicts, True for lists
+    # (stored as tuples) and None for other values
+    layout = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            layout.append((key, _plan_layout(value, values)))
+            continue
+        if isinstance(value, list):
+            value = tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+            value = _PLAN_TUPLES.setdefault(value, value)
+            layout.append((key, True))
+        else:
+            if key in INTERNED_PLAN_KEYS and isinstance(value, str):
+                value = sys.intern(value)
+            layout.append((key, None))
+        values.append(value)
+    return tuple(layout)
+
+
+def _expand_plan(layout: tuple, values: Iterator[Any]) -> dict[str, Any]:
+    result = {}
+    for key, kind in layout:
+        if kind is None:
+            result[key] = next(values)
+        elif kind is True:
+            result[key] = list(next(values))
+        else:
+            result[key] = _expand_plan(kind, values)
+    return result
+
+
+class LeadResult:
+    """
+    One processed lead.
+
+    Field access goes through attributes (``status``, ``qualification``,
+    ...); ``id`` and ``company_name`` read the input lead. For code
+    written against the result dicts, ``result["status"]``, ``get``,
+    ``keys`` and ``in`` read the fields of the ``to_dict()`` shape without
+    building the whole dict, and ``as_dict()`` is ``to_dict()`` (use it
+    before ``json.dump``).
+    """
+
+    __slots__ = ("lead", "plan", "qualification", "icp_fit", "status", "error", "processed_at")
+
+    def __init__(
+        self,
+        lead: dict[str, Any],
+        plan: Optional[EnrichmentPlan] = None,
+        qualification: Optional[Scores] = None,
+        icp_fit: Optional[ICPFit] = None,
+        status: Optional[str] = None,
+        error: Optional[str] = None,
+        processed_at: Optional[str] = None,
+    ):
+        self.lead = lead
+        self.plan = plan
+        self.qualification = qualification
+        self.icp_fit = icp_fit
+        self.status = status
+        self.error = error
+        self.processed_at = processed_at
+
+    @property
+    def id(self) -> Any:
+        """Lead id."""
+        return self.lead.get("id")
+
+    @property
+    def company_name(self) -> Any:
+        """Company name of the lead."""
+        return self.lead.get("company_name")
+
+    @property
+    def enrichment_plan(self) -> Optional[dict[str, Any]]:
+        """Enrichment plan dictionary (None if never built)."""
+        return self.plan.to_dict() if self.plan is not None else None
+
+    @classmethod
+    def from_dict(cls, result: dict[str, Any]) -> "LeadResult":
+        """Build from a serialized result, e.g. a checkpoint log record."""
+        plan = result.get("enrichment_plan")
+        qualification = result.get("qualification")
+        icp_fit = result.get("icp_fit")
+        return cls(
+            {key: value for key, value in result.items() if key not in RESULT_FIELDS},
+            EnrichmentPlan.from_dict(plan) if plan is not None else None,
+            Scores.from_dict(qualification) if qualification else None,
+            ICPFit.from_dict(icp_fit) if icp_fit else None,
+            result.get("status"),
+            result.get("error"),
+            result.get("processed_at"),
+        )
+
+    def keys(self) -> list[str]:
+        """Keys of the ``to_dict()`` shape, in the same order."""
+        keys = list(self.lead)
+        for key, present in (
+            ("enrichment_plan", self.plan is not None),
+            ("qualification", self.qualification is not None),
+            ("icp_fit", self.icp_fit is not None),
+            ("status", True),
+            ("error", self.error is not None),
+            ("processed_at", True),
+        ):
+            if present and key not in self.lead:
+                keys.append(key)
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        # Same precedence as to_dict(): set result fields override the lead
+        if key == "enrichment_plan" and self.plan is not None:
+            return self.plan.to_dict()
+        if key == "qualification" and self.qualification is not None:
+            return self.qualification.to_dict()
+        if key == "icp_fit" and self.icp_fit is not None:
+            return self.icp_fit.to_dict()
+        if key in ("status", "processed_at") or (key == "error" and self.error is not None):
+            return getattr(self, key)
+        return self.lead[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """``result[key]``, or ``default`` if the field is absent."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Same as ``to_dict()``."""
+        return self.to_dict()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the batch output's JSON shape."""
+        result = self.lead.copy()
+        if self.plan is not None:
+            result["enrichment_plan"] = self.plan.to_dict()
+        if self.qualification is not None:
+            result["qualification"] = self.qualification.to_dict()
+        if self.icp_fit is not None:
+            result["icp_fit"] = self.icp_fit.to_dict()
+        result["status"] = self.status
+        if self.error is not None:
+            result["error"] = self.error
+        result["processed_at"] = self.processed_at
+        return result
+
+
+def as_record(result: Any) -> LeadResult:
+    """Return a LeadResult, converting a serialized result dict if needed."""
+    if isinstance(result, LeadResult):
+        return result
+    return LeadResult.from_dict(result)
+
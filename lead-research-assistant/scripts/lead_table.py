@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Lead Table
+
+Columnar storage for leads and batch results. A list of lead dicts costs
+a dict plus a string object per field for every lead; a ``LeadTable``
+keeps one column per field instead:
+
+- free-text fields (company name, website, ...) are ``StringColumn``s: all
+  values packed into one UTF-8 buffer with an offsets array
+- low-cardinality fields (industry, contact title, and for results the
+  status, tier and best-fit ICP) are ``CategoricalColumn``s: each distinct
+  value is stored once and rows hold small integer codes
+- scores are ``array("d")`` columns
+
+Per-lead memory drops by roughly an order of magnitude, and validation,
+summary and report aggregates run over whole columns. Iterating a table
+(or indexing a row) yields ordinary lead dicts, materialized on demand, so
+the processing stages see the same leads as before.
+
+Tables save to a single binary file (:meth:`LeadTable.save`): a JSON
+header describing the columns, followed by the raw column buffers, so
+loading one back is a few bulk copies rather than a parse.
+"""
+
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+from lead_records import SCORE_LAYOUT, as_record
+
+# Lead fields in the order the loaders produce them
+LEAD_FIELDS = (
+    "id",
+    "company_name",
+    "website",
+    "linkedin_url",
+    "industry",
+    "contact_name",
+    "contact_title",
+    "contact_linkedin",
+    "notes",
+)
+
+# Lead fields with few distinct values, dictionary-encoded
+CATEGORICAL_FIELDS = frozenset(("industry", "contact_title"))
+
+# Result columns added by LeadTable.from_results
+RESULT_CATEGORICALS = ("status", "tier", "best_fit")
+# weighted_total plus each category's weighted score
+SCORE_FIELDS = ("weighted_total",) + tuple(category for category, _ in SCORE_LAYOUT)
+
+# Saved table files: magic, then the header length as a little-endian u64
+TABLE_MAGIC = b"LEADTBL1"
+
+
+class StringColumn:
+    """
+    Nullable strings packed into one UTF-8 buffer.
+
+    Row ``i`` is ``data[offsets[i]:offsets[i + 1]]``. An empty slice reads
+    back as None, matching the loaders, which store missing fields as None
+    rather than "".
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("I", [0])
+
+    def append(self, value: Optional[str]) -> None:
+        """Append one value (None or "" for missing)."""
+        if value:
+            self.data += value.encode("utf-8")
+            if self.offsets.typecode == "I" and len(self.data) > 0xFFFFFFFF:
+                self.offsets = array("Q", self.offsets)
+        self.offsets.append(len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if i < 0:
+            i += len(self)
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.data[start:end].decode("utf-8") if end > start else None
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        data = self.data
+        offsets = self.offsets
+        start = offsets[0]
+        for i in range(1, len(offsets)):
+            end = offsets[i]
+            yield data[start:end].decode("utf-8") if end > start else None
+            start = end
+
+    def present(self) -> Iterator[bool]:
+        """Whether each row has a value."""
+        offsets = self.offsets
+        return (offsets[i + 1] > offsets[i] for i in range(len(offsets) - 1))
+
+    def take(self, rows: Iterable[int]) -> "StringColumn":
+        """New column with the given rows, in order."""
+        column = StringColumn()
+        for i in rows:
+            column.append(self[i])
+        return column
+
+    def nbytes(self) -> int:
+        """Buffer bytes used by the column."""
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+    def to_parts(self) -> tuple[dict[str, Any], list[bytes]]:
+        """Header entry and buffers for :meth:`LeadTable.save`."""
+        return {"kind": "string", "offsets": self.offsets.typecode}, [self.data, self.offsets]
+
+    @classmethod
+    def from_parts(cls, header: dict[str, Any], buffers: list[memoryview]) -> "StringColumn":
+        """Rebuild a column saved with :meth:`to_parts`."""
+        column = cls()
+        column.data = bytearray(buffers[0])
+        column.offsets = array(header["offsets"])
+        column.offsets.frombytes(buffers[1])
+        return column
+
+
+class CategoricalColumn:
+    """
+    Dictionary-encoded strings.
+
+    ``categories[0]`` is None; each distinct value is stored once and rows
+    hold an index into ``categories`` (2-byte codes, widened to 4 bytes
+    past 65,535 categories). Reading a row returns the shared category
+    object, so materialized rows do not copy it either.
+    """
+
+    __slots__ = ("categories", "codes", "_index")
+
+    def __init__(self):
+        self.categories: list[Optional[str]] = [None]
+        self.codes = array("H")
+        self._index: dict[Optional[str], int] = {None: 0}
+
+    def code(self, value: Optional[str]) -> int:
+        """Code of a value, adding it as a new category if needed."""
+        code = self._index.get(value or None)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+            if code > 0xFFFF and self.codes.typecode == "H":
+                self.codes = array("I", self.codes)
+        return code
+
+    def append(self, value: Optional[str]) -> None:
+        """Append one value (None or "" for missing)."""
+        self.codes.append(self.code(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        return self.categories[self.codes[i]]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return map(self.categories.__getitem__, self.codes)
+
+    def present(self) -> Iterator[bool]:
+        """Whether each row has a value."""
+        return map(bool, self.codes)
+
+    def value_counts(self, rows: Optional[Iterable[int]] = None) -> dict[Optional[str], int]:
+        """
+        Count rows per value.
+
+        Args:
+            rows: Row indexes to count (default: every row)
+
+        Returns:
+            Mapping of value to count, in order of first appearance
+        """
+        codes = self.codes if rows is None else map(self.codes.__getitem__, rows)
+        categories = self.categories
+        return {categories[code]: count for code, count in Counter(codes).items()}
+
+    def take(self, rows: Iterable[int]) -> "CategoricalColumn":
+        """New column with the given rows, sharing this column's categories."""
+        column = CategoricalColumn()
+        column.categories = self.categories
+        column._index = self._index
+        column.codes = array(self.codes.typecode, map(self.codes.__getitem__, rows))
+        return column
+
+    def nbytes(self) -> int:
+        """Buffer bytes used by the codes (categories are shared)."""
+        return self.codes.itemsize * len(self.codes)
+
+    def to_parts(self) -> tuple[dict[str, Any], list[bytes]]:
+        """Header entry and buffers for :meth:`LeadTable.save`."""
+        header = {
+            "kind": "categorical",
+            "categories": self.categories[1:],
+            "codes": self.codes.typecode,
+        }
+        return header, [self.codes]
+
+    @classmethod
+    def from_parts(
+        cls, header: dict[str, Any], buffers: list[memoryview]
+    ) -> "CategoricalColumn":
+        """Rebuild a column saved with :meth:`to_parts`."""
+        column = cls()
+        column.categories = [None] + header["categories"]
+        column._index = {value: code for code, value in enumerate(column.categories)}
+        column.codes = array(header["codes"])
+        column.codes.frombytes(buffers[0])
+        return column
+
+
+class IdColumn:
+    """
+    Lead ids.
+
+    Canonical ``lead_<16 lowercase hex digits>`` ids (see
+    ``batch_processor.lead_id``) are stored as the 64-bit integer they
+    encode; any other id (or None) goes verbatim to a small side table
+    keyed by row, so every id reads back exactly as appended.
+    """
+
+    __slots__ = ("values", "other")
+
+    PREFIX = "lead_"
+    # Only ids that format back identically; int() alone would also take
+    # "0x", "+", "_" and uppercase digits
+    CANONICAL = re.compile(r"lead_[0-9a-f]{16}")
+
+    def __init__(self):
+        self.values = array("Q")
+        self.other: dict[int, Optional[str]] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        """Append one id."""
+        if value and self.CANONICAL.fullmatch(value):
+            self.values.append(int(value[5:], 16))
+            return
+        self.other[len(self.values)] = value
+        self.values.append(0)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if i < 0:
+            i += len(self.values)
+        if i in self.other:
+            return self.other[i]
+        return f"{self.PREFIX}{self.values[i]:016x}"
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        other = self.other
+        prefix = self.PREFIX
+        for i, value in enumerate(self.values):
+            yield other[i] if i in other else f"{prefix}{value:016x}"
+
+    def present(self) -> Iterator[bool]:
+        """Whether each row has an id."""
+        other = self.other
+        return (other.get(i, True) is not None for i in range(len(self.values)))
+
+    def take(self, rows: Iterable[int]) -> "IdColumn":
+        """New column with the given rows, in order."""
+        column = IdColumn()
+        for i in rows:
+            column.append(self[i])
+        return column
+
+    def nbytes(self) -> int:
+        """Buffer bytes used by the column."""
+        return self.values.itemsize * len(self.values)
+
+    def to_parts(self) -> tuple[dict[str, Any], list[bytes]]:
+        """Header entry and buffers for :meth:`LeadTable.save`."""
+        header = {"kind": "id", "other": [[row, value] for row, value in self.other.items()]}
+        return header, [self.values]
+
+    @classmethod
+    def from_parts(cls, header: dict[str, Any], buffers: list[memoryview]) -> "IdColumn":
+        """Rebuild a column saved with :meth:`to_parts`."""
+        column = cls()
+        column.values.frombytes(buffers[0])
+        column.other = {row: value for row, value in header["other"]}
+        return column
+
+
+Column = Union[StringColumn, CategoricalColumn, IdColumn, array]
+
+
+COLUMN_KINDS = {"string": StringColumn, "categorical": CategoricalColumn, "id": IdColumn}
+
+
+def _column_parts(column: Column) -> tuple[dict[str, Any], list[bytes]]:
+    if isinstance(column, array):
+        return {"kind": "array", "typecode": column.typecode}, [column]
+    return column.to_parts()
+
+
+def _column_from_parts(header: dict[str, Any], buffers: list[memoryview]) -> Column:
+    if header["kind"] == "array":
+        column = array(header["typecode"])
+        column.frombytes(buffers[0])
+        return column
+    return COLUMN_KINDS[header["kind"]].from_parts(header, buffers)
+
+
+def _new_column(field: str) -> Column:
+    if field == "id":
+        return IdColumn()
+    if field in CATEGORICAL_FIELDS:
+        return CategoricalColumn()
+    return StringColumn()
+
+
+class LeadTable:
+    """
+    Columnar leads.
+
+    ``columns`` maps field name to column; the lead fields (``fields``)
+    are what iterating the table and indexing a row return. Tables built
+    with :meth:`from_results` also have ``status``, ``tier`` and
+    ``best_fit`` categoricals and float score columns (NaN when a lead has
+    no scores), read through :meth:`column`.
+    """
+
+    def __init__(self, fields: Sequence[str] = LEAD_FIELDS):
+        self.fields = tuple(fields)
+        self.columns: dict[str, Column] = {field: _new_column(field) for field in self.fields}
+
+    @classmethod
+    def from_leads(cls, leads: Iterable[dict[str, Any]]) -> "LeadTable":
+        """
+        Build a table from lead dicts (e.g. the CSV/Excel loaders).
+
+        Args:
+            leads: Lead dictionaries with ``LEAD_FIELDS`` keys; other keys
+                are dropped
+
+        Returns:
+            LeadTable
+        """
+        table = cls()
+        for lead in leads:
+            table.append(lead)
+        return table
+
+    @classmethod
+    def from_results(cls, results: Iterable[Any]) -> "LeadTable":
+        """
+        Build a table from processed leads.
+
+        Args:
+            results: LeadResult records or result dicts (checkpoint
+                records, loaded batch output)
+
+        Returns:
+            LeadTable with lead fields plus result columns
+        """
+        table = cls()
+        for field in RESULT_CATEGORICALS:
+            table.columns[field] = CategoricalColumn()
+        for field in SCORE_FIELDS:
+            table.columns[field] = array("d")
+
+        columns = table.columns
+        status, tier, best_fit = (columns[field] for field in RESULT_CATEGORICALS)
+        score_columns = [columns[field] for field in SCORE_FIELDS]
+        nan = float("nan")
+        for result in results:
+            record = as_record(result)
+            table.append(record.lead)
+            status.append(record.status)
+            best_fit.append(record.icp_fit.best_fit if record.icp_fit else None)
+            scores = record.qualification
+            if scores is None:
+                tier.append(None)
+                for column in score_columns:
+                    column.append(nan)
+                continue
+            tier.append(scores.tier)
+            score_columns[0].append(scores.weighted_total)
+            for column, (category, _) in zip(score_columns[1:], SCORE_LAYOUT):
+                column.append(scores.get(category, "weighted"))
+        return table
+
+    def append(self, lead: dict[str, Any]) -> None:
+        """Append one lead dict."""
+        get = lead.get
+        columns = self.columns
+        for field in self.fields:
+            columns[field].append(get(field))
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]])
+
+    def __getitem__(self, i: int) -> dict[str, Any]:
+        columns = self.columns
+        return {field: columns[field][i] for field in self.fields}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        fields = self.fields
+        for values in zip(*(self.columns[field] for field in fields)):
+            yield dict(zip(fields, values))
+
+    def column(self, field: str) -> Column:
+        """Column for a field; iterate it for the values."""
+        return self.columns[field]
+
+    def non_null(self, field: str) -> int:
+        """Number of rows with a value in ``field``."""
+        return sum(self.columns[field].present())
+
+    def rows_where(self, field: str, value: Any) -> list[int]:
+        """Indexes of the rows whose ``field`` equals ``value``."""
+        column = self.columns[field]
+        if isinstance(column, CategoricalColumn):
+            code = column._index.get(value)
+            if code is None:
+                return []
+            return [i for i, c in enumerate(column.codes) if c == code]
+        return [i for i, v in enumerate(column) if v == value]
+
+    def take(self, rows: Iterable[int]) -> "LeadTable":
+        """New table with the given rows, in order."""
+        rows = list(rows)
+        table = LeadTable.__new__(LeadTable)
+        table.fields = self.fields
+        table.columns = {
+            field: (
+                array(column.typecode, map(column.__getitem__, rows))
+                if isinstance(column, array)
+                else column.take(rows)
+            )
+            for field, column in self.columns.items()
+        }
+        return table
+
+    def slice(self, start: int, stop: int) -> "LeadTable":
+        """Rows ``start`` to ``stop`` as a new table (e.g. a worker chunk)."""
+        return self.take(range(start, min(stop, len(self))))
+
+    def nbytes(self) -> int:
+        """Approximate bytes held by the column buffers."""
+        return sum(
+            column.itemsize * len(column) if isinstance(column, array) else column.nbytes()
+            for column in self.columns.values()
+        )
+
+    def save(self, path: str, meta: Optional[dict[str, Any]] = None) -> None:
+        """
+        Write the table to a binary file, atomically.
+
+        Args:
+            path: Destination file
+            meta: JSON-serializable data stored in the header (see
+                :func:`read_table_meta`)
+        """
+        columns = []
+        buffers: list[bytes] = []
+        for field, column in self.columns.items():
+            header, parts = _column_parts(column)
+            header["name"] = field
+            header["sizes"] = [memoryview(part).nbytes for part in parts]
+            columns.append(header)
+            buffers.extend(parts)
+        header = json.dumps(
+            {
+                "meta": meta or {},
+                "byteorder": sys.byteorder,
+                "fields": list(self.fields),
+                "columns": columns,
+            }
+        ).encode("utf-8")
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(TABLE_MAGIC)
+                f.write(struct.pack("<Q", len(header)))
+                f.write(header)
+                for buffer in buffers:
+                    f.write(buffer)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "LeadTable":
+        """
+        Read a table written by :meth:`save`.
+
+        Args:
+            path: Table file
+
+        Returns:
+            LeadTable
+
+        Raises:
+            ValueError: The file is not a table file, or was written on a
+                machine with a different byte order
+        """
+        with open(path, "rb") as f:
+            data = memoryview(f.read())
+        header, offset = _parse_header(data, path)
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written with {header['byteorder']}-endian buffers")
+
+        table = cls.__new__(cls)
+        table.fields = tuple(header["fields"])
+        table.columns = {}
+        for column in header["columns"]:
+            buffers = []
+            for size in column["sizes"]:
+                buffers.append(data[offset : offset + size])
+                offset += size
+            table.columns[column["name"]] = _column_from_parts(column, buffers)
+        return table
+
+
+def _parse_header(data: Union[bytes, memoryview], path: str) -> tuple[dict[str, Any], int]:
+    # Returns the header and the offset of the first buffer
+    start = len(TABLE_MAGIC) + 8
+    if len(data) < start or bytes(data[: len(TABLE_MAGIC)]) != TABLE_MAGIC:
+        raise ValueError(f"{path} is not a lead table file")
+    (length,) = struct.unpack("<Q", data[len(TABLE_MAGIC) : start])
+    return json.loads(bytes(data[start : start + length])), start + length
+
+
+def read_table_meta(path: str) -> dict[str, Any]:
+    """
+    Read the ``meta`` block of a saved table without loading its columns.
+
+    Args:
+        path: Table file
+
+    Returns:
+        The ``meta`` passed to :meth:`LeadTable.save`
+
+    Raises:
+        ValueError: The file is not a table file
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(len(TABLE_MAGIC) + 8)
+        if len(prefix) < len(TABLE_MAGIC) + 8 or prefix[: len(TABLE_MAGIC)] != TABLE_MAGIC:
+            raise ValueError(f"{path} is not a lead table file")
+        (length,) = struct.unpack("<Q", prefix[len(TABLE_MAGIC) :])
+        return json.loads(f.read(length))["meta"]
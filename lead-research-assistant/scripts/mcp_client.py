@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Execution
+
+Turns an enrichment plan from ``lead_enrichment.generate_enrichment_plan``
+into Bright Data MCP tool calls and merges the responses into the company
+data consumed by ``qualify_lead``.
+
+Any object with ``call_tool(tool, params)`` (sync) and/or
+``acall_tool(tool, params)`` (async) can act as the client. In production
+the calls are made through Claude's MCP integration; ``LocalMCPServer`` is
+a stand-in with injected latency for testing and benchmarking.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, AsyncContextManager, Callable, Optional
+
+from enrichment_cache import tool_cache_key
+
+# Tools whose responses describe the company itself
+COMPANY_PROFILE_TOOLS = {
+    "web_data_linkedin_company_profile",
+    "web_data_crunchbase_company",
+    "web_data_zoominfo_company_profile",
+}
+
+
+class LocalMCPServer:
+    """
+    Stand-in for the Bright Data MCP server.
+
+    Each call sleeps for ``latency`` seconds (plus up to ``jitter``) and
+    returns canned data, so throughput of the I/O-bound enrichment path can
+    be measured without network access or API cost.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                raise RuntimeError("Injected MCP tool failure")
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def call_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Blocking tool call."""
+        time.sleep(self._delay())
+        return stub_response(tool, params)
+
+    async def acall_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Non-blocking tool call."""
+        await asyncio.sleep(self._delay())
+        return stub_response(tool, params)
+
+
+class _InFlightCall:
+    """A blocking call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlightMCPClient:
+    """
+    MCP client wrapper that coalesces duplicate concurrent tool calls.
+
+    Calls are identified by tool name plus ``tool_cache_key`` (normalized
+    company identity, search query, or person plus employer). While one
+    call for a key is in flight, later callers wait for it and receive the
+    same response instead of issuing their own request; calls without a
+    key are passed straight through. Works for both ``call_tool`` (threads)
+    and ``acall_tool`` (asyncio); ``coalesced`` counts the calls saved.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[str, str], _InFlightCall] = {}
+        self._async_inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counts of calls issued to the wrapped client and calls saved."""
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
+
+    def call_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Blocking tool call, shared with identical concurrent calls."""
+        key = (tool, tool_cache_key(tool, params))
+        if key[1] is None:
+            with self._lock:
+                self.calls += 1
+            return self.client.call_tool(tool, params)
+
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InFlightCall()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self.client.call_tool(tool, params)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+    async def acall_tool(self, tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Non-blocking tool call, shared with identical concurrent calls."""
+        key = (tool, tool_cache_key(tool, params))
+        if key[1] is None:
+            with self._lock:
+                self.calls += 1
+            return await self.client.acall_tool(tool, params)
+
+        future = self._async_inflight.get(key)
+        if future is not None:
+            with self._lock:
+                self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        with self._lock:
+            self.calls += 1
+
+        try:
+            result = await self.client.acall_tool(tool, params)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an error with no waiters is not logged
+            future.exception()
+            raise
+        finally:
+            del self._async_inflight[key]
+
+
+def stub_response(tool: str, params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Canned response for a tool call.
+
+    Args:
+        tool: MCP tool name
+        params: Tool parameters
+
+    Returns:
+        Response with the fields the tool would contribute
+    """
+    if tool in COMPANY_PROFILE_TOOLS:
+        data = {
+            "employee_count": 150,
+            "revenue": 5_000_000,
+            "location": "North America",
+            "technologies": ["AWS", "React", "Python"],
+            "has_api": True,
+            "uses_cloud": True,
+        }
+        if tool == "web_data_zoominfo_company_profile":
+            data["competitive"] = {"weak_incumbent": True}
+    elif tool == "web_data_reuter_news":
+        data = {
+            "growth_signals": {"hiring_actively": True, "recent_funding": False},
+            "buying_intent": {"job_postings_relevant": True},
+        }
+    elif tool in ("web_data_linkedin_person_profile", "web_data_linkedin_people_search"):
+        data = {"deal_factors": {"authority_access": True}}
+    elif tool == "web_data_x_posts":
+        data = {"engagement": {"active_social_media": True}}
+    else:
+        data = {"results": [{"title": params.get("query", ""), "url": ""}]}
+
+    return {"tool": tool, "data": data}
+
+
+def plan_tool_calls(plan: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """
+    List the MCP tool calls an enrichment plan requires.
+
+    Args:
+        plan: Enrichment plan from generate_enrichment_plan
+
+    Returns:
+        List of (tool name, params) pairs
+    """
+    calls = []
+
+    company = plan.get("company_enrichment")
+    if company:
+        identity = {
+            "company_name": company.get("company_name"),
+            "website": company.get("website"),
+            "linkedin_url": company.get("linkedin_url"),
+        }
+        tool = company.get("recommended_mcp_tool")
+        if tool == "search_engine":
+            calls.append((tool, {"query": company.get("search_query", "")}))
+        elif tool:
+            calls.append((tool, {"url": company.get("linkedin_url"), **identity}))
+
+        for secondary in company.get("secondary_tools", []):
+            calls.append((secondary, dict(identity)))
+
+    contact = plan.get("contact_enrichment")
+    # Who the contact works for, so person calls are keyed per company
+    employer = {
+        key: value
+        for key, value in (
+            ("company", contact.get("company_name") if contact else None),
+            ("website", company.get("website") if company else None),
+        )
+        if value
+    }
+    if contact and contact.get("recommended_mcp_tool"):
+        tool = contact["recommended_mcp_tool"]
+        if tool == "search_engine":
+            params = {"query": contact.get("search_query", "")}
+        elif contact.get("search_params"):
+            params = {**contact["search_params"], **employer}
+        else:
+            params = {"url": contact.get("linkedin_url")}
+        calls.append((tool, params))
+
+    if contact:
+        for secondary in contact.get("secondary_tools", []):
+            calls.append((secondary, {"name": contact.get("contact_name"), **employer}))
+
+    return calls
+
+
+def build_enriched_data(
+    lead: dict[str, Any], responses: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Merge tool responses into the company data used for qualification.
+
+    Args:
+        lead: Original lead data
+        responses: Responses from the plan's tool calls
+
+    Returns:
+        Company data dictionary for qualify_lead
+    """
+    enriched = {
+        "company_name": lead["company_name"],
+        "industry": lead.get("industry", "Technology"),
+    }
+
+    for response in responses:
+        for key, value in response.get("data", {}).items():
+            if key == "results":
+                continue
+            if isinstance(value, dict):
+                enriched.setdefault(key, {}).update(value)
+            else:
+                enriched[key] = value
+
+    return enriched
+
+
+def execute_plan(plan: dict[str, Any], client: Any) -> list[dict[str, Any]]:
+    """
+    Run a plan's tool calls one after another with a blocking client.
+
+    Args:
+        plan: Enrichment plan
+        client: Object with ``call_tool(tool, params)``
+
+    Returns:
+        Tool responses in plan order
+    """
+    return [client.call_tool(tool, params) for tool, params in plan_tool_calls(plan)]
+
+
+async def execute_plan_async(
+    plan: dict[str, Any],
+    client: Any,
+    slot: Optional[Callable[[], AsyncContextManager]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Run a plan's tool calls concurrently with an async client.
+
+    Args:
+        plan: Enrichment plan
+        client: Object with ``acall_tool(tool, params)``
+        slot: Optional factory for an async context manager held around
+            every call, used to cap concurrency across the whole batch
+
+    Returns:
+        Tool responses in plan order
+    """
+
+    async def call(tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        if slot is None:
+            return await client.acall_tool(tool, params)
+        async with slot():
+            return await client.acall_tool(tool, params)
+
+    return list(
+        await asyncio.gather(
+            *(call(tool, params) for tool, params in plan_tool_calls(plan))
+        )
+    )
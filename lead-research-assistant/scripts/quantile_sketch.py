@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streaming Quantile Sketch
+
+KLL sketch (Karnin, Lang and Liberty, 2016) for estimating quantiles of a
+stream of scores in bounded memory. Items are kept in a hierarchy of
+compactors; when a compactor fills up it is sorted and every other item
+is promoted to the next level with double the weight. Memory stays at a
+few times ``k`` items however long the stream is, and the rank error is
+about 1.7 / k (under 1% for the default k = 256).
+
+Sketches built on separate shards combine with :meth:`KLLSketch.merge`
+and serialize to plain JSON with :meth:`KLLSketch.to_state`, so batch runs
+can be calibrated across shards without revisiting every lead.
+"""
+
+import math
+import random
+from typing import Any, Iterable, Optional
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch over floats.
+
+    Compaction chooses odd or even items with a seeded coin, so a sketch
+    fed the same stream with the same seed is reproducible.
+    """
+
+    def __init__(self, k: int = 256, seed: int = 0):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._random = random.Random(seed)
+        self._compactors: list[list[float]] = []
+        self._size = 0
+        self._max_size = 0
+        self._grow()
+
+    def _capacity(self, level: int) -> int:
+        # Lower levels shrink geometrically; the top level holds k items
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self) -> None:
+        for level in range(len(self._compactors)):
+            items = self._compactors[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 >= len(self._compactors):
+                self._grow()
+            items.sort()
+            # An odd item out stays at this level with its current weight
+            keep = len(items) % 2
+            offset = keep + self._random.randint(0, 1)
+            self._compactors[level + 1].extend(items[offset::2])
+            self._compactors[level] = items[:keep]
+            self._size = sum(len(c) for c in self._compactors)
+            if self._size < self._max_size:
+                break
+
+    def update(self, value: float) -> None:
+        """Add one value to the sketch."""
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if self.count == 0 or value > self.max:
+            self.max = value
+        self.count += 1
+        self._compactors[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update_all(self, values: Iterable[float]) -> None:
+        """Add every value from an iterable."""
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same ``k``
+
+        Returns:
+            This sketch, for chaining
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        if other.count == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = other.max if self.count == 0 else max(self.max, other.max)
+        self.count += other.count
+        self._size = sum(len(c) for c in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted_items(self) -> list[tuple[float, int]]:
+        items = [
+            (value, 1 << level)
+            for level, compactor in enumerate(self._compactors)
+            for value in compactor
+        ]
+        items.sort()
+        return items
+
+    def quantiles(self, fractions: Iterable[float]) -> list[Optional[float]]:
+        """
+        Estimate several quantiles at once.
+
+        Args:
+            fractions: Quantile fractions in [0, 1]
+
+        Returns:
+            Estimated values (None for an empty sketch); 0 and 1 return the
+            exact minimum and maximum
+        """
+        fractions = list(fractions)
+        if self.count == 0:
+            return [None] * len(fractions)
+
+        items = self._weighted_items()
+        total = sum(weight for _, weight in items)
+        results = []
+        for fraction in fractions:
+            if not 0 <= fraction <= 1:
+                raise ValueError(f"Quantile fraction must be in [0, 1], got {fraction}")
+            if fraction == 0:
+                results.append(self.min)
+                continue
+            if fraction == 1:
+                results.append(self.max)
+                continue
+            target = fraction * total
+            cumulative = 0
+            value = items[-1][0]
+            for item, weight in items:
+                cumulative += weight
+                if cumulative >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Estimate the value below which ``fraction`` of the stream falls."""
+        return self.quantiles([fraction])[0]
+
+    def rank(self, value: float) -> float:
+        """Estimate the fraction of the stream that is <= ``value``."""
+        if self.count == 0:
+            return 0.0
+        items = self._weighted_items()
+        total = sum(weight for _, weight in items)
+        below = sum(weight for item, weight in items if item <= value)
+        return below / total
+
+    def to_state(self) -> dict[str, Any]:
+        """Serialize the sketch to JSON-compatible data."""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "compactors": [list(c) for c in self._compactors],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any], seed: int = 0) -> "KLLSketch":
+        """Rebuild a sketch serialized with :meth:`to_state`."""
+        sketch = cls(state["k"], seed)
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch._compactors = [list(c) for c in state["compactors"]] or [[]]
+        sketch._max_size = sum(
+            sketch._capacity(h) for h in range(len(sketch._compactors))
+        )
+        sketch._size = sum(len(c) for c in sketch._compactors)
+        return sketch
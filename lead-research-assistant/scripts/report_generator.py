@@ -12,6 +12,10 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from lead_qualification import TIER_RECOMMENDATIONS
+from lead_table import LeadTable
+from result_writer import load_results
+
 try:
     from openpyxl import Workbook
     from openpyxl.chart import BarChart, PieChart, Reference
@@ -153,6 +157,24 @@ def create_summary_sheet(wb: Workbook, data: dict[str, Any]) -> None:
         ws.column_dimensions[column_letter].width = adjusted_width
 
 
+def lead_table(data: dict[str, Any]) -> LeadTable:
+    """
+    Leads of the report data as a results LeadTable.
+
+    Sheets read whole columns (tiers, scores, statuses) from the table;
+    lead dicts are converted once.
+    """
+    leads = data.get("leads", [])
+    if isinstance(leads, LeadTable):
+        return leads
+    return LeadTable.from_results(leads)
+
+
+def _scores(table: LeadTable, field: str) -> list[float]:
+    """Score column with missing scores (NaN) read as 0."""
+    return [0 if score != score else score for score in table.column(field)]
+
+
 def create_all_leads_sheet(wb: Workbook, data: dict[str, Any]) -> None:
     """Create detailed leads sheet."""
     ws = wb.create_sheet("All Leads")
@@ -176,23 +198,24 @@ def create_all_leads_sheet(wb: Workbook, data: dict[str, Any]) -> None:
         cell.font = Font(bold=True, color="FFFFFF")
         cell.fill = PatternFill(start_color=COLORS["header"], fill_type="solid")
 
-    # Data rows
-    leads = data.get("leads", [])
-    for row_idx, lead in enumerate(leads, 2):
-        qual = lead.get("qualification", {})
-        tier = qual.get("tier", "D")
-        score = qual.get("weighted_total", 0)
-
-        ws[f"A{row_idx}"] = lead.get("company_name", "")
-        ws[f"B{row_idx}"] = tier
-        ws[f"C{row_idx}"] = round(score, 1)
-        ws[f"D{row_idx}"] = lead.get("industry", "")
-        ws[f"E{row_idx}"] = lead.get("website", "")
-        ws[f"F{row_idx}"] = lead.get("linkedin_url", "")
-        ws[f"G{row_idx}"] = lead.get("contact_name", "")
-        ws[f"H{row_idx}"] = lead.get("contact_title", "")
-        ws[f"I{row_idx}"] = lead.get("status", "")
-        ws[f"J{row_idx}"] = lead.get("notes", "")
+    # Data rows, one column at a time
+    leads = lead_table(data)
+    columns = [
+        leads.column("company_name"),
+        (tier or "D" for tier in leads.column("tier")),
+        (round(score, 1) for score in _scores(leads, "weighted_total")),
+        leads.column("industry"),
+        leads.column("website"),
+        leads.column("linkedin_url"),
+        leads.column("contact_name"),
+        leads.column("contact_title"),
+        leads.column("status"),
+        leads.column("notes"),
+    ]
+    for row_idx, values in enumerate(zip(*columns), 2):
+        for col, value in enumerate(values, 1):
+            ws.cell(row_idx, col, value)
+        tier = values[1]
 
         # Color code tier column
         color_key = f"tier_{tier.lower()}"
@@ -246,33 +269,28 @@ def create_qualification_sheet(wb: Workbook, data: dict[str, Any]) -> None:
         cell.font = Font(bold=True, color="FFFFFF")
         cell.fill = PatternFill(start_color=COLORS["header"], fill_type="solid")
 
-    # Data rows
-    leads = data.get("leads", [])
-    for row_idx, lead in enumerate(leads, 2):
-        if lead.get("status") != "success":
-            continue
-
-        qual = lead.get("qualification", {})
-
-        ws[f"A{row_idx}"] = lead.get("company_name", "")
-        ws[f"B{row_idx}"] = qual.get("tier", "D")
-        ws[f"C{row_idx}"] = round(qual.get("weighted_total", 0), 1)
-        ws[f"D{row_idx}"] = round(
-            qual.get("firmographic", {}).get("weighted", 0), 1
-        )
-        ws[f"E{row_idx}"] = round(
-            qual.get("technographic", {}).get("weighted", 0), 1
-        )
-        ws[f"F{row_idx}"] = round(
-            qual.get("behavioral", {}).get("weighted", 0), 1
-        )
-        ws[f"G{row_idx}"] = round(
-            qual.get("strategic", {}).get("weighted", 0), 1
-        )
-        ws[f"H{row_idx}"] = qual.get("recommendation", "")
+    # Data rows (successful leads keep their row from the full list)
+    leads = lead_table(data)
+    names = leads.column("company_name")
+    tiers = leads.column("tier")
+    scores = {
+        field: _scores(leads, field)
+        for field in ("weighted_total", "firmographic", "technographic", "behavioral", "strategic")
+    }
+    for i in leads.rows_where("status", "success"):
+        row_idx = i + 2
+        tier = tiers[i] or "D"
+
+        ws[f"A{row_idx}"] = names[i]
+        ws[f"B{row_idx}"] = tier
+        ws[f"C{row_idx}"] = round(scores["weighted_total"][i], 1)
+        ws[f"D{row_idx}"] = round(scores["firmographic"][i], 1)
+        ws[f"E{row_idx}"] = round(scores["technographic"][i], 1)
+        ws[f"F{row_idx}"] = round(scores["behavioral"][i], 1)
+        ws[f"G{row_idx}"] = round(scores["strategic"][i], 1)
+        ws[f"H{row_idx}"] = TIER_RECOMMENDATIONS[tiers[i]] if tiers[i] else ""
 
         # Color code tier
-        tier = qual.get("tier", "D")
         color_key = f"tier_{tier.lower()}"
         ws[f"B{row_idx}"].fill = PatternFill(
             start_color=COLORS[color_key], fill_type="solid"
@@ -309,20 +327,18 @@ def create_outreach_sheet(wb: Workbook, data: dict[str, Any]) -> None:
         cell.fill = PatternFill(start_color=COLORS["header"], fill_type="solid")
 
     # Generate outreach recommendations based on tier and score
-    leads = data.get("leads", [])
-    successful_leads = [l for l in leads if l.get("status") == "success"]
-
-    # Sort by score
-    sorted_leads = sorted(
-        successful_leads,
-        key=lambda x: x.get("qualification", {}).get("weighted_total", 0),
-        reverse=True,
+    leads = lead_table(data)
+    names = leads.column("company_name")
+    tiers = leads.column("tier")
+    scores = _scores(leads, "weighted_total")
+
+    # Sort successful leads by score
+    sorted_rows = sorted(
+        leads.rows_where("status", "success"), key=scores.__getitem__, reverse=True
     )
 
-    for row_idx, lead in enumerate(sorted_leads, 2):
-        qual = lead.get("qualification", {})
-        tier = qual.get("tier", "D")
-        score = qual.get("weighted_total", 0)
+    for row_idx, i in enumerate(sorted_rows, 2):
+        tier = tiers[i] or "D"
 
         # Determine recommendations based on tier
         if tier == "A":
@@ -352,7 +368,7 @@ def create_outreach_sheet(wb: Workbook, data: dict[str, Any]) -> None:
             else "Add to nurture list → Monitor for signals"
         )
 
-        ws[f"A{row_idx}"] = lead.get("company_name", "")
+        ws[f"A{row_idx}"] = names[i]
         ws[f"B{row_idx}"] = tier
         ws[f"C{row_idx}"] = priority
         ws[f"D{row_idx}"] = channel
@@ -390,18 +406,15 @@ def create_insights_sheet(wb: Workbook, data: dict[str, Any]) -> None:
     row += 2
 
     # Analyze patterns
-    leads = data.get("leads", [])
-    successful = [l for l in leads if l.get("status") == "success"]
+    leads = lead_table(data)
+    successful = leads.rows_where("status", "success")
 
     # Industry distribution
     ws[f"A{row}"] = "Industry Distribution"
     ws[f"A{row}"].font = Font(size=12, bold=True)
     row += 1
 
-    industries = {}
-    for lead in successful:
-        industry = lead.get("industry", "Unknown")
-        industries[industry] = industries.get(industry, 0) + 1
+    industries = leads.column("industry").value_counts(successful)
 
     ws[f"A{row}"] = "Industry"
     ws[f"B{row}"] = "Count"
@@ -465,6 +478,9 @@ def generate_report(
             "openpyxl is required. Install with: pip install openpyxl"
         )
 
+    # Convert the leads once for all sheets
+    data = {**data, "leads": lead_table(data)}
+
     wb = Workbook()
 
     # Remove default sheet
@@ -492,7 +508,10 @@ def main():
         description="Generate Excel reports from enriched lead data"
     )
     parser.add_argument(
-        "--input", type=str, required=True, help="Path to enriched leads JSON file"
+        "--input",
+        type=str,
+        required=True,
+        help="Path to enriched leads file (.json, or .jsonl with summary sidecar)",
     )
     parser.add_argument(
         "--output",
@@ -518,8 +537,7 @@ def main():
 
     # Load enriched data
     try:
-        with open(args.input) as f:
-            data = json.load(f)
+        data = load_results(args.input, collect=LeadTable.from_results)
     except FileNotFoundError:
         print(f"Error: Input file not found: {args.input}")
         return 1
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Lead Re-scoring
+
+Re-applies ICP weights and tier thresholds to the raw sub-scores persisted
+by a batch run (see ``subscore_store.py``). No enrichment plans are
+regenerated and no lead is re-qualified: the new weighted totals are a
+weighted sum over the stored sub-score matrix, so a weight change on
+millions of leads takes seconds.
+
+Tier cutoffs can also be set by percentile (``--tier-percentiles``): the
+cutoffs are read from the KLL score sketches stored with the sub-scores,
+merged across shards, so calibrating needs no extra pass over the leads.
+
+Only weights and thresholds can change this way. Sub-scores depend on the
+rest of the ICP (size ranges, target industries, signal points); if those
+differ from the criteria the batch ran with, re-run the batch instead.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Optional, Union
+
+from lead_qualification import (
+    DEFAULT_ICP_CRITERIA,
+    TIER_RECOMMENDATIONS,
+    TIER_THRESHOLDS,
+    CompiledICP,
+    assign_tier,
+    compile_icp,
+)
+from quantile_sketch import KLLSketch
+from result_writer import ResultWriter
+from subscore_store import COLUMN_NAMES, HAS_NUMPY, load_header, load_ids, load_matrix
+
+if HAS_NUMPY:
+    import numpy as np
+
+    from vector_scoring import round_scores
+
+TIER_LABELS = tuple(tier for tier, _ in TIER_THRESHOLDS) + ("D",)
+
+
+def category_terms(
+    icp_criteria: Union[dict, CompiledICP, None],
+) -> list[tuple[float, list[tuple[int, float]]]]:
+    """
+    Express an ICP's weights over the sub-score matrix columns.
+
+    Args:
+        icp_criteria: ICP criteria dict or CompiledICP
+
+    Returns:
+        One ``(category weight, [(column index, criterion weight), ...])``
+        entry per category, in qualify_lead's summation order
+    """
+    icp = compile_icp(icp_criteria)
+    column = {name: i for i, name in enumerate(COLUMN_NAMES)}
+
+    # Firmographic criteria map to sub-scores the same way qualify_lead
+    # maps them; criteria without a matching sub-score contribute nothing
+    firm = [
+        (column[f"firmographic.{key}"], weight)
+        for key, weight in icp.firm_weights
+        if f"firmographic.{key}" in column
+    ]
+    return [
+        (icp.firm_weight, firm),
+        (
+            icp.tech_weight,
+            [
+                (column["technographic.tech_stack"], icp.tech_stack_weight),
+                (column["technographic.digital_maturity"], icp.maturity_weight),
+            ],
+        ),
+        (
+            icp.behav_weight,
+            [
+                (column["behavioral.growth_signals"], icp.growth_weight),
+                (column["behavioral.buying_intent"], icp.intent_weight),
+                (column["behavioral.engagement"], icp.engagement_weight),
+            ],
+        ),
+        (
+            icp.strat_weight,
+            [
+                (column["strategic.deal_potential"], icp.deal_weight),
+                (column["strategic.competitive"], icp.competitive_weight),
+            ],
+        ),
+    ]
+
+
+def weight_vector(icp_criteria: Union[dict, CompiledICP, None]) -> list[float]:
+    """
+    Flatten an ICP's weights to one effective weight per matrix column.
+
+    ``matrix @ weight_vector(icp)`` gives the weighted totals up to
+    floating-point summation order.
+
+    Args:
+        icp_criteria: ICP criteria dict or CompiledICP
+
+    Returns:
+        List with one weight per entry in COLUMN_NAMES
+    """
+    weights = [0.0] * len(COLUMN_NAMES)
+    for category_weight, terms in category_terms(icp_criteria):
+        for index, weight in terms:
+            weights[index] += weight * category_weight
+    return weights
+
+
+def rescore_totals(matrix: Any, icp_criteria: Union[dict, CompiledICP, None]) -> Any:
+    """
+    Compute unrounded weighted totals from a sub-score matrix.
+
+    Terms are accumulated column by column in the same order as
+    qualify_lead, so the totals (and therefore tiers) match a fresh run
+    exactly rather than to within rounding.
+
+    Args:
+        matrix: Sub-score matrix from load_matrix
+        icp_criteria: ICP whose weights to apply
+
+    Returns:
+        NumPy array of totals, or a list without NumPy
+    """
+    terms = category_terms(icp_criteria)
+
+    if HAS_NUMPY and isinstance(matrix, np.ndarray):
+        total = np.zeros(matrix.shape[0], dtype=np.float64)
+        for category_weight, columns in terms:
+            category_total = np.zeros(matrix.shape[0], dtype=np.float64)
+            for index, weight in columns:
+                category_total = category_total + matrix[:, index] * weight
+            total = total + category_total * category_weight
+        return total
+
+    totals = []
+    for row in matrix:
+        total = 0
+        for category_weight, columns in terms:
+            category_total = 0
+            for index, weight in columns:
+                category_total += row[index] * weight
+            total += category_total * category_weight
+        totals.append(total)
+    return totals
+
+
+def tier_codes(totals: Any, thresholds: tuple = TIER_THRESHOLDS) -> Any:
+    """
+    Assign tiers to unrounded totals.
+
+    Args:
+        totals: Totals from rescore_totals
+        thresholds: ``(tier, minimum)`` pairs checked in order
+
+    Returns:
+        Tier codes (indexes into TIER_LABELS)
+    """
+    if HAS_NUMPY and isinstance(totals, np.ndarray):
+        return np.select(
+            [totals >= threshold for _, threshold in thresholds],
+            np.arange(len(thresholds)),
+            default=len(thresholds),
+        ).astype(np.int8)
+
+    labels = [tier for tier, _ in thresholds] + ["D"]
+    return [labels.index(assign_tier(total, thresholds)) for total in totals]
+
+
+def _strip_weights(criteria: Any) -> Any:
+    if isinstance(criteria, dict):
+        return {k: _strip_weights(v) for k, v in criteria.items() if k != "weight"}
+    return criteria
+
+
+def criteria_changed(old: Optional[dict], new: Optional[dict]) -> bool:
+    """True when two ICPs differ in anything other than weights."""
+    return _strip_weights(old or DEFAULT_ICP_CRITERIA) != _strip_weights(
+        new or DEFAULT_ICP_CRITERIA
+    )
+
+
+def rescore(
+    output_path: str,
+    icp_criteria: Optional[dict] = None,
+    thresholds: tuple = TIER_THRESHOLDS,
+    reported: bool = False,
+) -> dict[str, Any]:
+    """
+    Re-score a batch output's stored sub-scores.
+
+    Args:
+        output_path: Batch output file with a sub-score store
+        icp_criteria: New ICP weights (default: the criteria of the batch)
+        thresholds: ``(tier, minimum)`` pairs for tier assignment
+        reported: Compare the 2-decimal reported scores rather than the
+            unrounded totals against ``thresholds`` (used for percentile
+            cutoffs, which are read off reported scores)
+
+    Returns:
+        Dictionary with ``totals`` and ``tiers`` for the new weights,
+        ``previous_tiers`` under the batch's own weights, and the header
+    """
+    header = load_header(output_path)
+    previous_icp = header.get("icp_criteria") or DEFAULT_ICP_CRITERIA
+    matrix = load_matrix(output_path, mmap=False)
+
+    totals = rescore_totals(matrix, icp_criteria or previous_icp)
+    return {
+        "header": header,
+        "totals": totals,
+        "tiers": tier_codes(_round_totals(totals) if reported else totals, thresholds),
+        "previous_tiers": tier_codes(rescore_totals(matrix, previous_icp)),
+    }
+
+
+def _round_totals(totals: Any) -> Any:
+    if HAS_NUMPY and isinstance(totals, np.ndarray):
+        return round_scores(totals)
+    return [round(total, 2) for total in totals]
+
+
+def tier_counts(codes: Any) -> dict[str, int]:
+    """Count leads per tier label."""
+    if HAS_NUMPY and isinstance(codes, np.ndarray):
+        counts = np.bincount(codes, minlength=len(TIER_LABELS)).tolist()
+    else:
+        counts = [0] * len(TIER_LABELS)
+        for code in codes:
+            counts[code] += 1
+    return dict(zip(TIER_LABELS, counts))
+
+
+def top_indices(scores: Any, k: int) -> list[int]:
+    """Row indices of the ``k`` highest scores, best first (ties by row order)."""
+    if HAS_NUMPY and isinstance(scores, np.ndarray):
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        threshold = scores[candidates].min()
+        # Include every row tied at the cut-off so ties resolve by row order
+        candidates = np.flatnonzero(scores >= threshold)
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order][:k].tolist()
+    return sorted(range(len(scores)), key=lambda i: -scores[i])[:k]
+
+
+def parse_thresholds(values: list[float]) -> tuple:
+    """Turn A/B/C minimum scores from the command line into threshold pairs."""
+    if len(values) != 3 or not values[0] >= values[1] >= values[2]:
+        raise ValueError("--tier-thresholds needs three descending values for A, B and C")
+    return tuple(zip(("A", "B", "C"), values))
+
+
+def parse_percentiles(values: list[float]) -> tuple:
+    """Turn A/B/C percentiles from the command line into (tier, percentile) pairs."""
+    if len(values) != 3 or not 100 >= values[0] >= values[1] >= values[2] >= 0:
+        raise ValueError(
+            "--tier-percentiles needs three descending values between 0 and 100 for A, B and C"
+        )
+    return tuple(zip(("A", "B", "C"), values))
+
+
+def score_sketch(
+    output_paths: list[str], icp_criteria: Union[dict, CompiledICP, None] = None
+) -> KLLSketch:
+    """
+    Merge the score distributions of one or more sub-score stores.
+
+    Args:
+        output_paths: Batch outputs (shards) with sub-score stores
+        icp_criteria: New ICP weights. When given, each store's totals are
+            recomputed under them; otherwise the sketches stored with the
+            sub-scores are merged without reading the matrices
+
+    Returns:
+        KLLSketch over every store's reported (2-decimal) weighted totals
+    """
+    sketch = KLLSketch()
+    for path in output_paths:
+        header = load_header(path)
+        if icp_criteria is None and header.get("score_sketch"):
+            sketch.merge(KLLSketch.from_state(header["score_sketch"]))
+            continue
+        totals = rescore_totals(
+            load_matrix(path, mmap=False),
+            icp_criteria or header.get("icp_criteria") or DEFAULT_ICP_CRITERIA,
+        )
+        totals = _round_totals(totals)
+        sketch.update_all(totals.tolist() if HAS_NUMPY else totals)
+    return sketch
+
+
+def percentile_thresholds(sketch: KLLSketch, percentiles: tuple) -> tuple:
+    """
+    Convert (tier, percentile) pairs into (tier, minimum score) thresholds.
+
+    Args:
+        sketch: Score distribution
+        percentiles: Pairs from parse_percentiles, e.g. A at the 90th
+            percentile puts the top 10% of leads in tier A
+
+    Returns:
+        Threshold pairs for tier assignment
+    """
+    if sketch.count == 0:
+        raise ValueError("No scores to calibrate tiers from")
+    cutoffs = sketch.quantiles([pct / 100 for _, pct in percentiles])
+    return tuple((tier, cutoff) for (tier, _), cutoff in zip(percentiles, cutoffs))
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Re-apply ICP weights and tier thresholds to stored sub-scores"
+    )
+    parser.add_argument(
+        "--input", type=str, required=True, help="Batch output file with stored sub-scores"
+    )
+    parser.add_argument(
+        "--icp-config", type=str, help="ICP criteria JSON with the new weights"
+    )
+    cutoffs = parser.add_mutually_exclusive_group()
+    cutoffs.add_argument(
+        "--tier-thresholds",
+        type=float,
+        nargs=3,
+        metavar=("A", "B", "C"),
+        help="Minimum scores for tiers A, B and C (default: 80 60 40)",
+    )
+    cutoffs.add_argument(
+        "--tier-percentiles",
+        type=float,
+        nargs=3,
+        metavar=("A", "B", "C"),
+        help="Score percentiles for tiers A, B and C, e.g. 90 70 40 puts the top 10%% in A",
+    )
+    parser.add_argument(
+        "--shards",
+        type=str,
+        nargs="+",
+        default=[],
+        help="Other batch outputs whose scores count toward --tier-percentiles",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write per-lead scores and tiers (.json, .jsonl or .parquet)",
+    )
+    parser.add_argument("--top-k", type=int, default=10, help="Top leads to show")
+
+    args = parser.parse_args()
+
+    icp_criteria = None
+    if args.icp_config:
+        try:
+            with open(args.icp_config) as f:
+                icp_criteria = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Could not load ICP config: {e}")
+            return 1
+
+    try:
+        thresholds = TIER_THRESHOLDS
+        if args.tier_thresholds:
+            thresholds = parse_thresholds(args.tier_thresholds)
+        elif args.tier_percentiles:
+            percentiles = parse_percentiles(args.tier_percentiles)
+            sketch = score_sketch([args.input] + args.shards, icp_criteria)
+            thresholds = percentile_thresholds(sketch, percentiles)
+            print(f"\n✓ Calibrated tier cutoffs from {sketch.count:,} scores:")
+            for (tier, pct), (_, cutoff) in zip(percentiles, thresholds):
+                print(f"   {tier}: >= {cutoff:.2f} ({pct:g}th percentile)")
+        start = time.perf_counter()
+        result = rescore(
+            args.input, icp_criteria, thresholds, reported=bool(args.tier_percentiles)
+        )
+        elapsed = time.perf_counter() - start
+    except FileNotFoundError as e:
+        print(f"Error: Sub-score store not found: {e.filename}")
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    header = result["header"]
+    if icp_criteria and criteria_changed(header.get("icp_criteria"), icp_criteria):
+        print(
+            "⚠️  The new ICP changes more than weights; only weights and thresholds "
+            "are applied. Re-run the batch for other criteria changes."
+        )
+
+    rows = header["rows"]
+    tiers = result["tiers"]
+    previous = result["previous_tiers"]
+    scores = _round_totals(result["totals"])
+
+    print(f"\n✓ Re-scored {rows:,} leads in {elapsed:.2f}s")
+    before, after = tier_counts(previous), tier_counts(tiers)
+    print("\n   Tier      Before     After")
+    for label in TIER_LABELS:
+        print(f"   {label:6} {before[label]:>9,} {after[label]:>9,}")
+    if HAS_NUMPY:
+        changed = int((previous != tiers).sum())
+    else:
+        changed = sum(1 for old, new in zip(previous, tiers) if old != new)
+    print(f"\n   {changed:,} leads changed tier")
+
+    ids = None
+    if args.top_k > 0 and rows:
+        ids = load_ids(args.input)
+        top = top_indices(scores, args.top_k)
+        print(f"\n   🏆 Top {len(top)} Leads:")
+        for rank, i in enumerate(top, 1):
+            tier = TIER_LABELS[tiers[i]]
+            print(f"      {rank}. {str(ids[i][1])[:35]:35} | Tier {tier} | {scores[i]:.1f}")
+
+    if args.output:
+        ids = ids or load_ids(args.input)
+        tier_list = tiers.tolist() if HAS_NUMPY else tiers
+        previous_list = previous.tolist() if HAS_NUMPY else previous
+        score_list = scores.tolist() if HAS_NUMPY else scores
+        writer = ResultWriter(args.output, atomic=True)
+        try:
+            for i, (lead_id, company_name) in enumerate(ids):
+                tier = TIER_LABELS[tier_list[i]]
+                writer.write(
+                    {
+                        "id": lead_id,
+                        "company_name": company_name,
+                        "weighted_total": score_list[i],
+                        "tier": tier,
+                        "previous_tier": TIER_LABELS[previous_list[i]],
+                        "recommendation": TIER_RECOMMENDATIONS[tier],
+                    }
+                )
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close(
+            {"tier_distribution": after},
+            {
+                "input_file": args.input,
+                "icp_config": args.icp_config,
+                "tier_thresholds": dict(thresholds),
+                "tier_percentiles": (
+                    dict(zip(("A", "B", "C"), args.tier_percentiles))
+                    if args.tier_percentiles
+                    else None
+                ),
+                "rescored_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            },
+        )
+        print(f"\n✅ Re-scored leads saved to {args.output}")
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
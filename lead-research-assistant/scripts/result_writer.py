@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Result Writer
+
+Streams processed leads to disk as they complete instead of serializing
+the whole result set at the end of a batch run. Supports three formats:
+
+- ``json``: a single JSON object whose ``leads`` array is written
+  incrementally, followed by ``summary`` and ``metadata`` as a trailer
+- ``jsonl``: one lead per line, with summary and metadata in a
+  ``<name>.summary.json`` sidecar file
+- ``parquet``: one row per lead with the qualification scores flattened
+  into typed columns (``firmographic.revenue``, ..., ``weighted_total``,
+  ``tier``), written in row groups; summary and metadata go to the same
+  sidecar as ``jsonl``. Enrichment plans are not stored (they are
+  regenerated from the lead by ``generate_enrichment_plan``). Requires
+  pyarrow.
+
+All formats load with ``load_results`` into the usual
+``{"summary", "leads", "metadata"}`` shape. Records with a ``to_dict()``
+method (see ``lead_records.py``) are serialized through it.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from lead_records import SCORE_LAYOUT, LeadResult, Scores, as_record
+from lead_table import LEAD_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+OUTPUT_FORMATS = ("json", "jsonl", "parquet")
+
+FORMAT_SUFFIXES = {".jsonl": "jsonl", ".parquet": "parquet", ".pq": "parquet"}
+
+# Flattened qualification columns of Parquet output, e.g. "firmographic.revenue"
+SCORE_COLUMNS = tuple(f"{category}.{key}" for category, keys in SCORE_LAYOUT for key in keys)
+
+# Columns a processed lead adds to its lead fields in Parquet output
+RESULT_COLUMNS = SCORE_COLUMNS + (
+    "weighted_total",
+    "tier",
+    "best_fit",
+    "icp_fit",
+    "status",
+    "error",
+    "processed_at",
+)
+
+
+def infer_format(output_path: str) -> str:
+    """Pick an output format from the file extension (default: json)."""
+    return FORMAT_SUFFIXES.get(Path(output_path).suffix.lower(), "json")
+
+
+def to_jsonable(obj: Any) -> Any:
+    """``json.dumps`` default hook for records that serialize with ``to_dict()``."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def sidecar_path(output_path: str) -> str:
+    """Path of the summary/metadata sidecar for a JSONL or Parquet output file."""
+    return str(Path(output_path).with_suffix(".summary.json"))
+
+
+def flatten_result(result: Any) -> dict[str, Any]:
+    """
+    Flatten a processed lead into one Parquet row.
+
+    Args:
+        result: LeadResult record or result dict. Dicts without a
+            ``status`` (e.g. rescore.py's flat rows) are written as-is.
+
+    Returns:
+        Row dictionary: lead fields, then ``RESULT_COLUMNS``
+    """
+    if not isinstance(result, LeadResult) and "status" not in result:
+        return result
+
+    record = as_record(result)
+    row = dict(record.lead)
+    scores = record.qualification
+    if scores is None:
+        row.update(dict.fromkeys(SCORE_COLUMNS))
+        row["weighted_total"] = row["tier"] = None
+    else:
+        row.update(zip(SCORE_COLUMNS, scores.values))
+        row["weighted_total"] = scores.weighted_total
+        row["tier"] = scores.tier
+    fit = record.icp_fit
+    row["best_fit"] = fit.best_fit if fit else None
+    row["icp_fit"] = list(zip(fit.names, fit.scores)) if fit else None
+    row["status"] = record.status
+    row["error"] = record.error
+    row["processed_at"] = record.processed_at
+    return row
+
+
+def unflatten_result(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Rebuild the result dict of a Parquet row written by ``flatten_result``.
+
+    Args:
+        row: Row dictionary
+
+    Returns:
+        Lead result in the batch output's JSON shape (without the
+        enrichment plan); rows of other tables are returned unchanged
+    """
+    if "status" not in row or SCORE_COLUMNS[0] not in row:
+        return row
+
+    result = {key: value for key, value in row.items() if key not in RESULT_COLUMNS}
+    if row["tier"] is not None:
+        values = tuple(row[column] for column in SCORE_COLUMNS)
+        result["qualification"] = Scores(values, row["weighted_total"], row["tier"]).to_dict()
+    if row.get("best_fit") is not None:
+        result["icp_fit"] = {"best_fit": row["best_fit"], "scores": dict(row["icp_fit"])}
+    result["status"] = row["status"]
+    if row.get("error") is not None:
+        result["error"] = row["error"]
+    result["processed_at"] = row.get("processed_at")
+    return result
+
+
+def parquet_schema(rows: list[dict[str, Any]]) -> "pa.Schema":
+    """
+    Schema for Parquet output.
+
+    Lead fields and the result columns have fixed types (strings, float64
+    scores, a string-to-float64 map for multi-ICP fit scores); any other
+    column's type is inferred from ``rows`` (string when all null).
+
+    Args:
+        rows: First row group; its columns, in first-seen order
+
+    Returns:
+        Arrow schema
+    """
+    names = dict.fromkeys(key for row in rows for key in row) or LEAD_FIELDS + RESULT_COLUMNS
+    fields = []
+    for name in names:
+        if name in SCORE_COLUMNS or name == "weighted_total":
+            type_ = pa.float64()
+        elif name == "icp_fit":
+            type_ = pa.map_(pa.string(), pa.float64())
+        elif name in LEAD_FIELDS or name in RESULT_COLUMNS:
+            type_ = pa.string()
+        else:
+            type_ = pa.array([row.get(name) for row in rows]).type
+            if pa.types.is_null(type_):
+                type_ = pa.string()
+        fields.append(pa.field(name, type_))
+    return pa.schema(fields)
+
+
+class ResultWriter:
+    """
+    Incremental writer for batch results.
+
+    Memory use is constant: each lead is serialized and handed to the OS
+    as soon as it is written. Call :meth:`close` with the summary and
+    metadata to finish the file.
+
+    With ``atomic=True`` output goes to a temporary file that replaces
+    ``output_path`` only on a successful close.
+
+    Parquet output buffers ``row_group_size`` flattened rows at a time;
+    the schema is fixed by the first row group.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        fmt: Optional[str] = None,
+        atomic: bool = False,
+        flush_every: int = 100,
+        row_group_size: int = 65_536,
+    ):
+        self.output_path = output_path
+        self.fmt = fmt or infer_format(output_path)
+        if self.fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {self.fmt}")
+        if self.fmt == "parquet" and not HAS_PYARROW:
+            raise ImportError(
+                "pyarrow is required for Parquet output. Install with: pip install pyarrow"
+            )
+
+        self.atomic = atomic
+        self.flush_every = max(flush_every, 1)
+        self.row_group_size = max(row_group_size, 1)
+        self.count = 0
+
+        self._path = f"{output_path}.tmp" if atomic else output_path
+        if self.fmt == "parquet":
+            self._file = open(self._path, "wb")
+            self._rows: list[dict[str, Any]] = []
+            self._parquet: Optional["pq.ParquetWriter"] = None
+            self._schema: Optional["pa.Schema"] = None
+            self._columns: frozenset[str] = frozenset()
+            return
+        self._file = open(self._path, "w", encoding="utf-8")
+        if self.fmt == "json":
+            self._file.write('{\n  "leads": [')
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Write one processed lead.
+
+        Args:
+            record: JSON-serializable lead result or record
+        """
+        if self.fmt == "parquet":
+            row = flatten_result(record)
+            if self._schema is not None and not self._columns.issuperset(row):
+                extra = sorted(set(row) - self._columns)
+                raise ValueError(f"Columns not in the Parquet schema: {', '.join(extra)}")
+            self._rows.append(row)
+            self.count += 1
+            if len(self._rows) >= self.row_group_size:
+                self._write_row_group()
+            return
+
+        if self.fmt == "json":
+            self._file.write(",\n    " if self.count else "\n    ")
+            self._file.write(json.dumps(record, default=to_jsonable))
+        else:
+            self._file.write(
+                json.dumps(record, separators=(",", ":"), default=to_jsonable) + "\n"
+            )
+
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def _write_row_group(self) -> None:
+        if self._parquet is None:
+            self._schema = parquet_schema(self._rows)
+            self._columns = frozenset(self._schema.names)
+            self._parquet = pq.ParquetWriter(self._file, self._schema)
+        if self._rows:
+            table = pa.Table.from_pylist(self._rows, schema=self._schema)
+            self._parquet.write_table(table, row_group_size=self.row_group_size)
+            self._rows = []
+
+    def close(
+        self,
+        summary: Optional[dict[str, Any]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Write the trailer (or sidecar) and close the output.
+
+        Args:
+            summary: Summary statistics for the run
+            metadata: Run metadata
+        """
+        if self._file.closed:
+            return
+
+        if self.fmt == "json":
+            self._file.write("\n  ]," if self.count else "],")
+            self._file.write(f'\n  "summary": {json.dumps(summary or {})},')
+            self._file.write(f'\n  "metadata": {json.dumps(metadata or {})}\n')
+            self._file.write("}\n")
+        else:
+            if self.fmt == "parquet":
+                self._write_row_group()
+                self._parquet.close()
+            with open(sidecar_path(self.output_path), "w", encoding="utf-8") as f:
+                json.dump({"summary": summary or {}, "metadata": metadata or {}}, f, indent=2)
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+        if self.atomic:
+            os.replace(self._path, self.output_path)
+
+    def abort(self) -> None:
+        """Close without a trailer, discarding temporary output if atomic."""
+        if not self._file.closed:
+            if self.fmt == "parquet" and self._parquet is not None:
+                self._parquet.close()
+            self._file.close()
+        if self.atomic and os.path.exists(self._path):
+            os.remove(self._path)
+
+
+def iter_result_leads(input_path: str, batch_size: int = 65_536) -> Iterator[dict[str, Any]]:
+    """
+    Stream leads from a JSONL or Parquet results file.
+
+    Args:
+        input_path: Path to ``.jsonl`` or ``.parquet`` results
+        batch_size: Parquet rows decoded at a time
+
+    Yields:
+        Lead result dictionaries
+    """
+    if infer_format(input_path) == "parquet":
+        if not HAS_PYARROW:
+            raise ImportError(
+                "pyarrow is required to read Parquet results. Install with: pip install pyarrow"
+            )
+        for batch in pq.ParquetFile(input_path, memory_map=True).iter_batches(batch_size):
+            names = batch.schema.names
+            for values in zip(*(column.to_pylist() for column in batch.columns)):
+                yield unflatten_result(dict(zip(names, values)))
+        return
+
+    with open(input_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_results(
+    input_path: str, collect: Callable[[Iterable[dict[str, Any]]], Any] = list
+) -> dict[str, Any]:
+    """
+    Load batch results written in any output format.
+
+    Args:
+        input_path: Path to ``.json``, ``.jsonl`` or ``.parquet`` results
+        collect: Builds the ``leads`` entry from the lead dicts, e.g.
+            ``LeadTable.from_results``; ``.jsonl`` and ``.parquet`` leads are
+            streamed into it
+
+    Returns:
+        Dictionary with summary, leads and metadata
+    """
+    if infer_format(input_path) == "json":
+        with open(input_path, encoding="utf-8") as f:
+            results = json.load(f)
+        if collect is not list:
+            results["leads"] = collect(results.get("leads", []))
+        return results
+
+    data: dict[str, Any] = {"summary": {}, "metadata": {}}
+    sidecar = sidecar_path(input_path)
+    if os.path.exists(sidecar):
+        with open(sidecar, encoding="utf-8") as f:
+            data.update(json.load(f))
+    data["leads"] = collect(iter_result_leads(input_path))
+    return data
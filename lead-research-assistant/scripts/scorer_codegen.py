@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Generated ICP Scorers
+
+Generates a Python scoring function specialized to one ICP config: every
+weight, range bound, target list and signal name is inlined as a constant
+and every criterion is unrolled into straight-line code, so scoring a lead
+does no criteria-dict lookups and no per-criterion function calls. The
+generated function returns exactly what ``qualify_lead`` returns for the
+same criteria.
+
+Generated modules are written to a cache directory keyed by a hash of the
+config (and of the generator version). Later runs still generate the
+source, which is cheap, but import the cached module and its bytecode
+when the file matches; a mismatched file is rewritten first.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import py_compile
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from lead_qualification import (
+    DEFAULT_ICP_CRITERIA,
+    TIER_RECOMMENDATIONS,
+    TIER_THRESHOLDS,
+    CompiledICP,
+    SubstringMatcher,
+)
+
+# Bump when the generated code changes so stale cached scorers are ignored
+GENERATOR_VERSION = 2
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "lead-research-assistant",
+    "scorers",
+)
+
+# Digital maturity indicators: (company field, indicator name), in
+# score_digital_maturity's order
+MATURITY_FIELDS = (
+    ("has_api", "has_api"),
+    ("has_mobile_app", "has_mobile_app"),
+    ("uses_cloud", "cloud_infrastructure"),
+    ("modern_stack", "modern_tech_stack"),
+)
+
+
+def config_hash(icp_criteria: Optional[dict] = None) -> str:
+    """
+    Hash an ICP config for the scorer cache.
+
+    Key order is kept: range order, criterion order and signal order all
+    affect results (first matching range, summation order).
+
+    Args:
+        icp_criteria: ICP criteria dict (default ICP if None)
+
+    Returns:
+        Hex digest identifying the generated scorer
+    """
+    payload = json.dumps(
+        [GENERATOR_VERSION, icp_criteria or DEFAULT_ICP_CRITERIA], separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _literal(value: Any) -> str:
+    """Source for an inlined constant; repr() of inf or nan is not valid Python."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"float({str(value)!r})"
+    return repr(value)
+
+
+def _range_lines(var: str, out: str, ranges: dict) -> list[str]:
+    # First matching range in definition order, as score_company_size does
+    lines = [f"    {out} = 0", f"    if {var}:"]
+    keyword = "if"
+    for data in ranges.values():
+        min_val, max_val, score = data["min"], data.get("max"), data["score"]
+        if max_val is None:
+            condition = f"{var} >= {_literal(min_val)}"
+        else:
+            condition = f"{_literal(min_val)} <= {var} <= {_literal(max_val)}"
+        lines.append(f"        {keyword} {condition}:")
+        lines.append(f"            {out} = {_literal(score)}")
+        keyword = "elif"
+    if keyword == "if":
+        lines.append("        pass")
+    return lines
+
+
+def _any_contains(targets: tuple, text: str, adjacent: bool, matcher: str) -> str:
+    """Condition true when a target occurs in ``text`` (or vice versa if adjacent)."""
+    # Long lists use the SubstringMatcher named ``matcher`` instead of a chain
+    if len(targets) > SubstringMatcher.MIN_INDEXED_PATTERNS:
+        if adjacent:
+            return f"{matcher}.found_in({text}) or {matcher}.is_substring({text})"
+        return f"{matcher}.found_in({text})"
+    if not targets:
+        return "False"
+    terms = []
+    for target in targets:
+        terms.append(f"{target!r} in {text}")
+        if adjacent:
+            terms.append(f"{text} in {target!r}")
+    return " or ".join(terms)
+
+
+def _signal_lines(source: str, out: str, signals: dict) -> list[str]:
+    lines = [f"    data = {source}", f"    {out} = 0"]
+    for signal, points in signals.items():
+        lines.append(f"    if data.get({signal!r}):")
+        lines.append(f"        {out} += {_literal(points)}")
+    lines.append(f"    {out} = min({out}, 100)")
+    return lines
+
+
+def generate_scorer_source(icp_criteria: Optional[dict] = None) -> str:
+    """
+    Generate the source of a module with a specialized ``score`` function.
+
+    Args:
+        icp_criteria: ICP criteria dict (default ICP if None)
+
+    Returns:
+        Python source code; its ``score(company_data)`` returns the same
+        dictionary as ``qualify_lead(company_data, icp_criteria)``
+    """
+    icp = icp_criteria or DEFAULT_ICP_CRITERIA
+    firm = icp["firmographic"]
+    firm_criteria = firm["criteria"]
+    industry = firm_criteria["industry_match"]
+    geography = firm_criteria["geographic_match"]
+    tech = icp["technographic"]
+    stack = tech["criteria"]["tech_stack_compatibility"]
+    maturity = tech["criteria"]["digital_maturity"]
+    behav = icp["behavioral"]
+    behav_criteria = behav["criteria"]
+    strat = icp["strategic"]
+    strat_criteria = strat["criteria"]
+
+    targets = tuple(i.lower() for i in industry["target_industries"])
+    regions = tuple(r.lower() for r in geography["target_regions"])
+    compatible = sorted({t.lower() for t in stack["compatible_technologies"]})
+
+    lines = [
+        f'"""Generated scorer for ICP config {config_hash(icp)[:12]}. Do not edit."""',
+        "",
+        "from lead_qualification import SubstringMatcher",
+        "",
+        f"TARGET_INDUSTRIES = frozenset({sorted(set(targets))!r})",
+        f"INDUSTRY_MATCHER = SubstringMatcher({targets!r})",
+        f"REGION_MATCHER = SubstringMatcher({regions!r})",
+        f"COMPATIBLE_TECHNOLOGIES = frozenset({compatible!r})",
+        "",
+        "",
+        "def score(company_data):",
+        "    get = company_data.get",
+        "",
+        "    # 1. Firmographic",
+        "    employee_count = get('employee_count')",
+    ]
+    lines += _range_lines("employee_count", "company_size", firm_criteria["company_size"]["ranges"])
+    lines.append("    revenue_value = get('revenue')")
+    lines += _range_lines("revenue_value", "revenue", firm_criteria["revenue"]["ranges"])
+
+    industry_match = _any_contains(targets, "industry_lower", True, "INDUSTRY_MATCHER")
+    lines += [
+        "    industry_value = get('industry')",
+        "    if industry_value:",
+        "        industry_lower = industry_value.lower()",
+        "        if industry_lower in TARGET_INDUSTRIES:",
+        f"            industry = {_literal(industry['score_match'])}",
+        f"        elif {industry_match}:",
+        f"            industry = {_literal(industry['score_adjacent'])}",
+        "        else:",
+        f"            industry = {_literal(industry['score_other'])}",
+        "    else:",
+        "        industry = 0",
+    ]
+    region_match = _any_contains(regions, "location_lower", False, "REGION_MATCHER")
+    lines += [
+        "    location = get('location')",
+        "    if location:",
+        "        location_lower = location.lower()",
+        f"        geography = {_literal(geography['score_match'])} if {region_match} else "
+        f"{_literal(geography['score_other'])}",
+        "    else:",
+        "        geography = 0",
+    ]
+
+    # Same criterion-name to score-key mapping as qualify_lead; criteria
+    # without a matching score contribute 0 * weight
+    firm_scores = {"company_size", "revenue", "industry", "geography"}
+    firm_terms = ["0"]
+    for name, data in firm_criteria.items():
+        key = name.replace("_match", "")
+        firm_terms.append(f"{key if key in firm_scores else '0'} * {_literal(data['weight'])}")
+    lines += [
+        f"    firm_total = {' + '.join(firm_terms)}",
+        "",
+        "    # 2. Technographic",
+        "    tech_list = get('technologies', [])",
+        "    if tech_list:",
+        "        matches = 0",
+        "        for tech in tech_list:",
+        "            if tech.lower() in COMPATIBLE_TECHNOLOGIES:",
+        "                matches += 1",
+        f"        tech_stack = min(matches * {_literal(stack['score_per_match'])}, "
+        f"{_literal(stack['max_score'])})",
+        "    else:",
+        "        tech_stack = 0",
+        "    maturity = 0",
+    ]
+    indicators = maturity["indicators"]
+    for field, indicator in MATURITY_FIELDS:
+        lines.append(f"    if get({field!r}):")
+        lines.append(f"        maturity += {_literal(indicators[indicator])}")
+    lines += [
+        "    maturity = min(maturity, 100)",
+        f"    tech_total = tech_stack * {_literal(stack['weight'])}"
+        f" + maturity * {_literal(maturity['weight'])}",
+        "",
+        "    # 3. Behavioral",
+    ]
+    lines += _signal_lines("get('growth_signals', {})", "growth", behav_criteria["growth_signals"]["signals"])
+    lines += _signal_lines("get('buying_intent', {})", "intent", behav_criteria["buying_intent"]["signals"])
+    lines += _signal_lines(
+        "get('engagement', {})", "engagement", behav_criteria["engagement_potential"]["signals"]
+    )
+    lines += [
+        "    behav_total = ("
+        f"growth * {_literal(behav_criteria['growth_signals']['weight'])}"
+        f" + intent * {_literal(behav_criteria['buying_intent']['weight'])}"
+        f" + engagement * {_literal(behav_criteria['engagement_potential']['weight'])})",
+        "",
+        "    # 4. Strategic",
+    ]
+    lines += _signal_lines("get('deal_factors', {})", "deal", strat_criteria["deal_potential"]["factors"])
+    lines += _signal_lines(
+        "get('competitive', {})", "competitive", strat_criteria["competitive_position"]["factors"]
+    )
+    lines += [
+        "    strat_total = ("
+        f"deal * {_literal(strat_criteria['deal_potential']['weight'])}"
+        f" + competitive * {_literal(strat_criteria['competitive_position']['weight'])})",
+        "",
+        "    # 5. Overall score, tier and recommendation",
+        f"    firm_weighted = firm_total * {_literal(firm['weight'])}",
+        f"    tech_weighted = tech_total * {_literal(tech['weight'])}",
+        f"    behav_weighted = behav_total * {_literal(behav['weight'])}",
+        f"    strat_weighted = strat_total * {_literal(strat['weight'])}",
+        "    total_weighted = firm_weighted + tech_weighted + behav_weighted + strat_weighted",
+    ]
+    keyword = "if"
+    for tier, threshold in TIER_THRESHOLDS:
+        lines.append(f"    {keyword} total_weighted >= {_literal(threshold)}:")
+        lines.append(f"        tier, recommendation = {tier!r}, {TIER_RECOMMENDATIONS[tier]!r}")
+        keyword = "elif"
+    lines += [
+        "    else:",
+        f"        tier, recommendation = 'D', {TIER_RECOMMENDATIONS['D']!r}",
+        "",
+        "    return {",
+        "        'firmographic': {",
+        "            'company_size': company_size,",
+        "            'revenue': revenue,",
+        "            'industry': industry,",
+        "            'geography': geography,",
+        "            'total': firm_total,",
+        "            'weighted': firm_weighted,",
+        "        },",
+        "        'technographic': {",
+        "            'tech_stack': tech_stack,",
+        "            'digital_maturity': maturity,",
+        "            'total': tech_total,",
+        "            'weighted': tech_weighted,",
+        "        },",
+        "        'behavioral': {",
+        "            'growth_signals': growth,",
+        "            'buying_intent': intent,",
+        "            'engagement': engagement,",
+        "            'total': behav_total,",
+        "            'weighted': behav_weighted,",
+        "        },",
+        "        'strategic': {",
+        "            'deal_potential': deal,",
+        "            'competitive': competitive,",
+        "            'total': strat_total,",
+        "            'weighted': strat_weighted,",
+        "        },",
+        "        'weighted_total': round(total_weighted, 2),",
+        "        'tier': tier,",
+        "        'recommendation': recommendation,",
+        "    }",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def scorer_path(icp_criteria: Optional[dict] = None, cache_dir: Optional[str] = None) -> Path:
+    """Path of the cached generated module for an ICP config."""
+    return Path(cache_dir or DEFAULT_CACHE_DIR) / f"icp_scorer_{config_hash(icp_criteria)}.py"
+
+
+def load_scorer(
+    icp_criteria: Optional[dict] = None, cache_dir: Optional[str] = None
+) -> Callable[[dict], dict[str, Any]]:
+    """
+    Load the generated scorer for an ICP config, writing it on a cache miss.
+
+    Args:
+        icp_criteria: ICP criteria dict (default ICP if None)
+        cache_dir: Directory of generated modules (default: DEFAULT_CACHE_DIR)
+
+    Returns:
+        ``score(company_data)`` function
+    """
+    path = scorer_path(icp_criteria, cache_dir)
+    source = generate_scorer_source(icp_criteria)
+    # The file name only identifies the config; a cached file that was
+    # edited, truncated or written by another generator is regenerated
+    if not path.exists() or path.read_bytes() != source.encode("utf-8"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent runs never import a partial module
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        # Bytecode checked against the source hash rather than mtime and
+        # size, which a same-size rewrite within a second would not change
+        py_compile.compile(
+            str(path), invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+        )
+
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.score
+
+
+class GeneratedICP(CompiledICP):
+    """
+    CompiledICP whose ``score`` is a generated, specialized function.
+
+    Everything else (``score_features``, the precomputed tables used by
+    vectorized scoring and re-scoring) is inherited, so a GeneratedICP can
+    be used anywhere a CompiledICP is. When pickled for worker processes
+    the function is dropped and reloaded from the disk cache.
+    """
+
+    def __init__(self, icp_criteria: Optional[dict] = None, cache_dir: Optional[str] = None):
+        super().__init__(icp_criteria)
+        self.cache_dir = cache_dir
+        self.score = load_scorer(self.criteria, cache_dir)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["score"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.score = load_scorer(self.criteria, self.cache_dir)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Generate a specialized scoring module for an ICP config"
+    )
+    parser.add_argument("--icp-config", type=str, help="ICP criteria JSON (default ICP if omitted)")
+    parser.add_argument(
+        "--cache-dir", type=str, help=f"Generated scorer cache (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--print", action="store_true", help="Print the generated source instead of caching it"
+    )
+
+    args = parser.parse_args()
+
+    icp_criteria = None
+    if args.icp_config:
+        try:
+            with open(args.icp_config) as f:
+                icp_criteria = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Could not load ICP config: {e}")
+            return 1
+
+    try:
+        if args.print:
+            print(generate_scorer_source(icp_criteria))
+            return 0
+        load_scorer(icp_criteria, args.cache_dir)
+    except (KeyError, TypeError) as e:
+        print(f"Error: Invalid ICP config: {e!r}")
+        return 1
+
+    print(f"✓ Generated scorer cached at {scorer_path(icp_criteria, args.cache_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Sub-score Store
+
+Persists each lead's raw per-criterion sub-scores (company size, revenue,
+industry, ...) next to the batch output so weights and tier thresholds can
+be re-applied later without regenerating enrichment plans or re-scoring
+(see ``rescore.py``). For an output file ``leads.json`` the store is:
+
+- ``leads.json.subscores.bin``: float64 matrix, one row per lead and one
+  column per entry in ``SUBSCORE_COLUMNS``
+- ``leads.json.subscores.ids``: one JSON ``[id, company_name]`` line per row
+- ``leads.json.subscores.json``: header with column names, row count, the
+  ICP criteria the sub-scores were computed with and a KLL sketch of the
+  weighted totals (``score_sketch``), used for percentile tier cutoffs
+  that can be merged across shards
+
+Rows are appended as results stream in, so memory use stays constant.
+"""
+
+import json
+import os
+from array import array
+from typing import Any, Iterable, Optional
+
+from lead_records import as_record
+from quantile_sketch import KLLSketch
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# (category, sub-score) pairs in qualify_lead's output, in matrix column order
+SUBSCORE_COLUMNS = (
+    ("firmographic", "company_size"),
+    ("firmographic", "revenue"),
+    ("firmographic", "industry"),
+    ("firmographic", "geography"),
+    ("technographic", "tech_stack"),
+    ("technographic", "digital_maturity"),
+    ("behavioral", "growth_signals"),
+    ("behavioral", "buying_intent"),
+    ("behavioral", "engagement"),
+    ("strategic", "deal_potential"),
+    ("strategic", "competitive"),
+)
+COLUMN_NAMES = tuple(f"{category}.{key}" for category, key in SUBSCORE_COLUMNS)
+
+
+def store_paths(output_path: str) -> dict[str, str]:
+    """Paths of the matrix, id and header files for a batch output file."""
+    prefix = f"{output_path}.subscores"
+    return {"bin": f"{prefix}.bin", "ids": f"{prefix}.ids", "header": f"{prefix}.json"}
+
+
+def subscore_row(qualification: dict[str, Any]) -> list[float]:
+    """Extract the raw sub-scores of one qualification in column order."""
+    return [float(qualification[category][key]) for category, key in SUBSCORE_COLUMNS]
+
+
+class SubscoreWriter:
+    """
+    Streaming writer for a sub-score store.
+
+    Only successful leads are stored. Rows are buffered and appended to the
+    matrix file in blocks; :meth:`close` writes the header.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        icp_criteria: Optional[dict] = None,
+        flush_every: int = 10_000,
+    ):
+        self.paths = store_paths(output_path)
+        self.icp_criteria = icp_criteria
+        self.flush_every = max(flush_every, 1)
+        self.rows = 0
+        self.score_sketch = KLLSketch()
+
+        self._bin = open(self.paths["bin"], "wb")
+        self._ids = open(self.paths["ids"], "w", encoding="utf-8")
+        self._buffer = array("d")
+
+    def write(self, result: Any) -> None:
+        """
+        Store the sub-scores of one processed lead.
+
+        Args:
+            result: Processed lead (LeadResult or serialized result dict)
+        """
+        result = as_record(result)
+        if result.status != "success":
+            return
+
+        qualification = result.qualification
+        self.write_row(
+            result.id,
+            result.company_name,
+            [float(qualification.get(category, key)) for category, key in SUBSCORE_COLUMNS],
+            qualification.weighted_total,
+        )
+
+    def write_row(
+        self,
+        lead_id: Any,
+        company_name: Any,
+        row: list[float],
+        weighted_total: Optional[float] = None,
+    ) -> None:
+        """
+        Store one row of sub-scores.
+
+        Args:
+            lead_id: Lead id
+            company_name: Company name
+            row: Sub-scores in SUBSCORE_COLUMNS order
+            weighted_total: Weighted total to add to the score sketch
+        """
+        if weighted_total is not None:
+            self.score_sketch.update(weighted_total)
+        self._buffer.extend(row)
+        self._ids.write(json.dumps([lead_id, company_name]) + "\n")
+        self.rows += 1
+        if self.rows % self.flush_every == 0:
+            self._flush()
+
+    def write_all(self, results: Iterable[Any]) -> int:
+        """Store every result from an iterable; returns rows stored."""
+        for result in results:
+            self.write(result)
+        return self.rows
+
+    def _flush(self) -> None:
+        self._buffer.tofile(self._bin)
+        self._buffer = array("d")
+
+    def close(self) -> None:
+        """Flush remaining rows and write the header."""
+        if self._bin.closed:
+            return
+        self._flush()
+        self._bin.close()
+        self._ids.close()
+
+        header = {
+            "columns": list(COLUMN_NAMES),
+            "rows": self.rows,
+            "dtype": "float64",
+            "icp_criteria": self.icp_criteria,
+            "score_sketch": self.score_sketch.to_state(),
+        }
+        with open(self.paths["header"], "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=2)
+
+    def abort(self) -> None:
+        """Close and remove partial store files."""
+        for f in (self._bin, self._ids):
+            if not f.closed:
+                f.close()
+        for path in self.paths.values():
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def load_header(output_path: str) -> dict[str, Any]:
+    """Load a sub-score store header."""
+    with open(store_paths(output_path)["header"], encoding="utf-8") as f:
+        header = json.load(f)
+    if header.get("columns") != list(COLUMN_NAMES):
+        raise ValueError(f"Unsupported sub-score columns in {output_path}")
+    return header
+
+
+def load_matrix(output_path: str, mmap: bool = True) -> Any:
+    """
+    Load the sub-score matrix.
+
+    Args:
+        output_path: Batch output file the store belongs to
+        mmap: Memory-map the matrix instead of reading it (NumPy only)
+
+    Returns:
+        ``(rows, columns)`` NumPy array, or a list of row lists without NumPy
+    """
+    header = load_header(output_path)
+    path = store_paths(output_path)["bin"]
+    shape = (header["rows"], len(COLUMN_NAMES))
+
+    if HAS_NUMPY:
+        if header["rows"] == 0:
+            return np.zeros(shape, dtype=np.float64)
+        if mmap:
+            return np.memmap(path, dtype=np.float64, mode="r", shape=shape)
+        return np.fromfile(path, dtype=np.float64).reshape(shape)
+
+    values = array("d")
+    with open(path, "rb") as f:
+        values.fromfile(f, shape[0] * shape[1])
+    width = shape[1]
+    return [values[i : i + width].tolist() for i in range(0, len(values), width)]
+
+
+def load_ids(output_path: str) -> list[tuple[Any, Any]]:
+    """Load the (id, company_name) pair of every matrix row."""
+    with open(store_paths(output_path)["ids"], encoding="utf-8") as f:
+        return [tuple(json.loads(line)) for line in f if line.strip()]
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Vectorized Lead Scoring
+
+Scores whole batches of companies with NumPy instead of one dict at a time.
+Companies are first encoded into columns:
+
+- ``employee_count`` / ``revenue``: float arrays (0 when missing)
+- ``industry_code`` / ``location_code``: integer codes into the
+  ``industry_vocab`` / ``location_vocab`` lists (dictionary encoding)
+- ``tech_matches``: number of compatible technologies per company
+- ``maturity_bits`` and one ``*_bits`` column per signal group: bitmaps
+  where bit ``i`` is set when the ICP's ``i``-th indicator/signal is present
+  (see ``SignalTable``), scored by indexing the group's lookup table
+
+``qualify_leads_batch`` then computes every sub-score, the weighted totals
+and the tier in a handful of array operations. Results match
+``qualify_lead`` exactly, including Python's rounding of the weighted total.
+"""
+
+from typing import Any, Iterable, Optional, Union
+
+from lead_qualification import (
+    TIER_RECOMMENDATIONS,
+    TIER_THRESHOLDS,
+    CompiledICP,
+    SignalTable,
+    compile_icp,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Tier labels indexed by the codes in a batch result's "tier" array
+TIER_LABELS = tuple(tier for tier, _ in TIER_THRESHOLDS) + ("D",)
+
+# (bitmap column, company field, CompiledICP attribute holding the signals)
+SIGNAL_COLUMNS = (
+    ("growth_bits", "growth_signals", "growth_signals"),
+    ("intent_bits", "buying_intent", "intent_signals"),
+    ("engagement_bits", "engagement", "engagement_signals"),
+    ("deal_bits", "deal_factors", "deal_factors"),
+    ("competitive_bits", "competitive", "competitive_factors"),
+)
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError(
+            "numpy is required for vectorized scoring. Install with: pip install numpy"
+        )
+
+
+def encode_companies(
+    companies: Iterable[dict[str, Any]],
+    icp_criteria: Union[dict, CompiledICP, None] = None,
+) -> dict[str, Any]:
+    """
+    Encode company dictionaries into the columns qualify_leads_batch takes.
+
+    Bit positions follow the ICP's signal order, so columns must be scored
+    with the same ICP they were encoded for.
+
+    Args:
+        companies: Company data dictionaries (as passed to qualify_lead)
+        icp_criteria: ICP criteria dict or CompiledICP (default ICP if None)
+
+    Returns:
+        Dictionary of NumPy arrays plus ``industry_vocab``/``location_vocab``
+    """
+    _require_numpy()
+    icp = compile_icp(icp_criteria)
+
+    industry_codes: dict[Any, int] = {}
+    location_codes: dict[Any, int] = {}
+    columns: dict[str, list] = {
+        "employee_count": [],
+        "revenue": [],
+        "industry_code": [],
+        "location_code": [],
+        "tech_matches": [],
+        "maturity_bits": [],
+    }
+    for column, _, _ in SIGNAL_COLUMNS:
+        columns[column] = []
+
+    compatible = icp.compatible_technologies
+    for company in companies:
+        columns["employee_count"].append(company.get("employee_count") or 0)
+        columns["revenue"].append(company.get("revenue") or 0)
+
+        industry = company.get("industry") or ""
+        columns["industry_code"].append(
+            industry_codes.setdefault(industry, len(industry_codes))
+        )
+        location = company.get("location") or ""
+        columns["location_code"].append(
+            location_codes.setdefault(location, len(location_codes))
+        )
+
+        tech_list = company.get("technologies", [])
+        columns["tech_matches"].append(
+            sum(1 for tech in tech_list if tech.lower() in compatible) if tech_list else 0
+        )
+
+        columns["maturity_bits"].append(icp.maturity_indicators.encode(company))
+        for column, field, attr in SIGNAL_COLUMNS:
+            columns[column].append(getattr(icp, attr).encode(company.get(field, {})))
+
+    encoded: dict[str, Any] = {
+        "employee_count": np.asarray(columns.pop("employee_count"), dtype=np.float64),
+        "revenue": np.asarray(columns.pop("revenue"), dtype=np.float64),
+    }
+    for column, values in columns.items():
+        encoded[column] = np.asarray(values, dtype=np.int64)
+    encoded["industry_vocab"] = list(industry_codes)
+    encoded["location_vocab"] = list(location_codes)
+    return encoded
+
+
+def _range_scores(values: "np.ndarray", ranges: Any) -> "np.ndarray":
+    """Vectorized _RangeTable.lookup; zero values score 0 like the scalar path."""
+    scores = np.zeros(len(values), dtype=np.float64)
+    present = values != 0
+
+    if ranges.bisectable:
+        if not ranges.sorted_ranges:
+            return scores
+        mins = np.asarray(ranges.mins, dtype=np.float64)
+        maxs = np.asarray(
+            [np.inf if r[1] is None else r[1] for r in ranges.sorted_ranges],
+            dtype=np.float64,
+        )
+        range_scores = np.asarray([r[2] for r in ranges.sorted_ranges], dtype=np.float64)
+        idx = np.searchsorted(mins, values, side="right") - 1
+        safe = np.maximum(idx, 0)
+        hit = present & (idx >= 0) & (values >= mins[safe]) & (values <= maxs[safe])
+        scores[hit] = range_scores[safe[hit]]
+        return scores
+
+    # Overlapping ranges: apply in reverse so the first matching range wins
+    for min_val, max_val, score in reversed(ranges.ordered):
+        if max_val is None:
+            hit = values >= min_val
+        else:
+            hit = (values >= min_val) & (values <= max_val)
+        scores[present & hit] = score
+    return scores
+
+
+def _signal_scores(bits: "np.ndarray", signals: SignalTable) -> "np.ndarray":
+    """Score bitmaps with the group's 2^k lookup table (one gather)."""
+    if signals.table is not None:
+        return np.asarray(signals.table, dtype=np.float64)[bits]
+
+    score = np.zeros(len(bits), dtype=np.float64)
+    for i, (_, points) in enumerate(signals.signals):
+        score += ((bits >> i) & 1) * points
+    return np.minimum(score, signals.cap)
+
+
+def round_scores(values: "np.ndarray") -> "np.ndarray":
+    """
+    Round to 2 decimals exactly as Python's ``round(x, 2)`` does.
+
+    ``np.round`` agrees with Python except at near-ties, where its scaling
+    can round the other way. Weighted totals take few distinct values, so
+    the distinct near-tie values are rounded in Python and mapped back.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        distinct, inverse = np.unique(values[near_tie], return_inverse=True)
+        exact = np.asarray([round(v, 2) for v in distinct.tolist()], dtype=np.float64)
+        rounded[near_tie] = exact[inverse]
+    return rounded
+
+
+def qualify_leads_batch(
+    columns: dict[str, Any],
+    icp_criteria: Union[dict, CompiledICP, None] = None,
+) -> dict[str, Any]:
+    """
+    Score encoded companies in one vectorized pass.
+
+    Args:
+        columns: Columns from encode_companies
+        icp_criteria: ICP criteria dict or CompiledICP used for encoding
+
+    Returns:
+        Dictionary of per-company arrays: each sub-score, the category
+        ``*_total``/``*_weighted`` values, ``total_weighted`` (unrounded),
+        ``weighted_total`` (rounded) and ``tier`` (codes into TIER_LABELS)
+    """
+    _require_numpy()
+    icp = compile_icp(icp_criteria)
+    result: dict[str, Any] = {}
+
+    # 1. Firmographic
+    firm = {
+        "company_size": _range_scores(columns["employee_count"], icp.size_ranges),
+        "revenue": _range_scores(columns["revenue"], icp.revenue_ranges),
+        "industry": np.asarray(
+            [icp.score_industry(v) if v else 0 for v in columns["industry_vocab"]],
+            dtype=np.float64,
+        )[columns["industry_code"]],
+        "geography": np.asarray(
+            [icp.score_geography(v) if v else 0 for v in columns["location_vocab"]],
+            dtype=np.float64,
+        )[columns["location_code"]],
+    }
+    firm_total = np.zeros(len(columns["employee_count"]), dtype=np.float64)
+    for key, weight in icp.firm_weights:
+        if key in firm:
+            firm_total = firm_total + firm[key] * weight
+    result.update(firm)
+    result["firmographic_total"] = firm_total
+    result["firmographic_weighted"] = firm_total * icp.firm_weight
+
+    # 2. Technographic
+    tech_stack = np.minimum(
+        columns["tech_matches"] * icp.score_per_match, icp.max_tech_score
+    ).astype(np.float64)
+    maturity = _signal_scores(columns["maturity_bits"], icp.maturity_indicators)
+    tech_total = tech_stack * icp.tech_stack_weight + maturity * icp.maturity_weight
+    result["tech_stack"] = tech_stack
+    result["digital_maturity"] = maturity
+    result["technographic_total"] = tech_total
+    result["technographic_weighted"] = tech_total * icp.tech_weight
+
+    # 3. Behavioral and 4. Strategic
+    signal_scores = {
+        field: _signal_scores(columns[column], getattr(icp, attr))
+        for column, field, attr in SIGNAL_COLUMNS
+    }
+    behav_total = (
+        signal_scores["growth_signals"] * icp.growth_weight
+        + signal_scores["buying_intent"] * icp.intent_weight
+        + signal_scores["engagement"] * icp.engagement_weight
+    )
+    strat_total = (
+        signal_scores["deal_factors"] * icp.deal_weight
+        + signal_scores["competitive"] * icp.competitive_weight
+    )
+    result.update(signal_scores)
+    result["behavioral_total"] = behav_total
+    result["behavioral_weighted"] = behav_total * icp.behav_weight
+    result["strategic_total"] = strat_total
+    result["strategic_weighted"] = strat_total * icp.strat_weight
+
+    # 5. Overall score and tier
+    total = (
+        result["firmographic_weighted"]
+        + result["technographic_weighted"]
+        + result["behavioral_weighted"]
+        + result["strategic_weighted"]
+    )
+    result["total_weighted"] = total
+    result["weighted_total"] = round_scores(total)
+    result["tier"] = np.select(
+        [total >= threshold for _, threshold in TIER_THRESHOLDS],
+        np.arange(len(TIER_THRESHOLDS)),
+        default=len(TIER_THRESHOLDS),
+    ).astype(np.int8)
+    return result
+
+
+def batch_to_qualifications(
+    batch: dict[str, Any], rows: Optional[Iterable[int]] = None
+) -> list[dict[str, Any]]:
+    """
+    Convert batch results back to qualify_lead-shaped dictionaries.
+
+    Args:
+        batch: Result of qualify_leads_batch
+        rows: Optional row indices to convert (default: all)
+
+    Returns:
+        List of qualification dictionaries
+    """
+    columns = {key: values.tolist() for key, values in batch.items()}
+    if rows is None:
+        rows = range(len(columns["tier"]))
+
+    qualifications = []
+    for i in rows:
+        tier = TIER_LABELS[columns["tier"][i]]
+        qualifications.append(
+            {
+                "firmographic": {
+                    "company_size": columns["company_size"][i],
+                    "revenue": columns["revenue"][i],
+                    "industry": columns["industry"][i],
+                    "geography": columns["geography"][i],
+                    "total": columns["firmographic_total"][i],
+                    "weighted": columns["firmographic_weighted"][i],
+                },
+                "technographic": {
+                    "tech_stack": columns["tech_stack"][i],
+                    "digital_maturity": columns["digital_maturity"][i],
+                    "total": columns["technographic_total"][i],
+                    "weighted": columns["technographic_weighted"][i],
+                },
+                "behavioral": {
+                    "growth_signals": columns["growth_signals"][i],
+                    "buying_intent": columns["buying_intent"][i],
+                    "engagement": columns["engagement"][i],
+                    "total": columns["behavioral_total"][i],
+                    "weighted": columns["behavioral_weighted"][i],
+                },
+                "strategic": {
+                    "deal_potential": columns["deal_factors"][i],
+                    "competitive": columns["competitive"][i],
+                    "total": columns["strategic_total"][i],
+                    "weighted": columns["strategic_weighted"][i],
+                },
+                "weighted_total": columns["weighted_total"][i],
+                "tier": tier,
+                "recommendation": TIER_RECOMMENDATIONS[tier],
+            }
+        )
+    return qualifications
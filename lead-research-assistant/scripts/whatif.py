@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+ICP Weight What-If Analysis
+
+Evaluates many alternative ICP weightings against the raw sub-scores stored
+by a batch run (see ``subscore_store.py``) and reports, for each weighting,
+the tier distribution, how many leads change tier and how much of the
+baseline top-K survives. Weight vectors come from a grid of sweeps over
+category weights (``firmographic``) and criterion weights
+(``firmographic.company_size``), or from random category mixes.
+
+Weightings are scored in blocks as a matrix product of the distinct
+sub-score rows and a matrix of effective weights, so thousands of
+weightings per second can be explored. Totals are accurate to
+floating-point summation order, which is enough for analysis; use
+``rescore.py`` to apply a chosen weighting exactly.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from typing import Any, Optional
+
+from lead_qualification import TIER_THRESHOLDS, compile_icp
+from subscore_store import COLUMN_NAMES, load_header, load_ids, load_matrix
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+CATEGORIES = ("firmographic", "technographic", "behavioral", "strategic")
+
+# Criterion names in ICP configs and the sub-score column each one weights
+CRITERION_COLUMNS = {
+    "technographic.tech_stack_compatibility": "technographic.tech_stack",
+    "technographic.digital_maturity": "technographic.digital_maturity",
+    "behavioral.growth_signals": "behavioral.growth_signals",
+    "behavioral.buying_intent": "behavioral.buying_intent",
+    "behavioral.engagement_potential": "behavioral.engagement",
+    "strategic.deal_potential": "strategic.deal_potential",
+    "strategic.competitive_position": "strategic.competitive",
+}
+
+
+class WeightModel:
+    """
+    Category and criterion weights of an ICP over the sub-score columns.
+
+    The effective weight of a column is its criterion weight times its
+    category weight, so a batch of weightings is two small matrices.
+    """
+
+    def __init__(self, icp_criteria: Optional[dict] = None):
+        icp = compile_icp(icp_criteria)
+        self.criteria = icp.criteria
+        self.column_category = np.asarray(
+            [CATEGORIES.index(name.split(".")[0]) for name in COLUMN_NAMES]
+        )
+        self.category_weights = np.asarray(
+            [icp.firm_weight, icp.tech_weight, icp.behav_weight, icp.strat_weight],
+            dtype=np.float64,
+        )
+
+        # Firmographic criteria map to columns the way qualify_lead maps
+        # them; criteria without a matching sub-score never contribute
+        self.criterion_columns: dict[str, Optional[int]] = {}
+        for name in icp.criteria["firmographic"]["criteria"]:
+            column = f"firmographic.{name.replace('_match', '')}"
+            self.criterion_columns[f"firmographic.{name}"] = (
+                COLUMN_NAMES.index(column) if column in COLUMN_NAMES else None
+            )
+        for name, column in CRITERION_COLUMNS.items():
+            self.criterion_columns[name] = COLUMN_NAMES.index(column)
+
+        self.criterion_weights = np.zeros(len(COLUMN_NAMES), dtype=np.float64)
+        for name, column in self.criterion_columns.items():
+            if column is not None:
+                category, criterion = name.split(".")
+                self.criterion_weights[column] += self.criteria[category]["criteria"][
+                    criterion
+                ]["weight"]
+
+    def parameters(self) -> list[str]:
+        """Names that can be swept: categories and category.criterion pairs."""
+        return list(CATEGORIES) + list(self.criterion_columns)
+
+    def grid(self, sweeps: dict[str, list[float]]) -> tuple[Any, Any, list[dict]]:
+        """
+        Build the Cartesian product of parameter sweeps.
+
+        Args:
+            sweeps: Parameter name to the values it takes
+
+        Returns:
+            Tuple of (category weight matrix, criterion weight matrix,
+            parameter assignment per row)
+        """
+        names = list(sweeps)
+        for name in names:
+            if name not in self.parameters():
+                raise ValueError(
+                    f"Unknown weight '{name}'. Choose from: {', '.join(self.parameters())}"
+                )
+
+        combos = list(itertools.product(*(sweeps[name] for name in names)))
+        categories = np.tile(self.category_weights, (len(combos), 1))
+        criteria = np.tile(self.criterion_weights, (len(combos), 1))
+        for j, name in enumerate(names):
+            values = np.asarray([combo[j] for combo in combos], dtype=np.float64)
+            if name in CATEGORIES:
+                categories[:, CATEGORIES.index(name)] = values
+            elif self.criterion_columns[name] is not None:
+                criteria[:, self.criterion_columns[name]] = values
+
+        assignments = [dict(zip(names, combo)) for combo in combos]
+        return categories, criteria, assignments
+
+    def random_categories(self, count: int, seed: int = 0) -> tuple[Any, Any, list[dict]]:
+        """
+        Sample random category mixes (summing to 1) with criterion weights fixed.
+
+        Args:
+            count: Number of weightings
+            seed: Random seed
+
+        Returns:
+            Same shape as :meth:`grid`
+        """
+        rng = np.random.default_rng(seed)
+        categories = rng.dirichlet(np.ones(len(CATEGORIES)), size=count)
+        criteria = np.tile(self.criterion_weights, (count, 1))
+        assignments = [
+            {name: round(float(w), 4) for name, w in zip(CATEGORIES, row)} for row in categories
+        ]
+        return categories, criteria, assignments
+
+    def effective(self, categories: Any, criteria: Any) -> Any:
+        """Effective per-column weights, shape (weightings, columns)."""
+        return criteria * categories[:, self.column_category]
+
+
+def distinct_rows(matrix: Any) -> tuple[Any, Any, Any]:
+    """
+    Find the distinct rows of a sub-score matrix.
+
+    Each column takes only a handful of values, so rows are packed into a
+    single integer key from per-column codes when the key fits in 63 bits;
+    otherwise this falls back to ``np.unique(axis=0)``.
+
+    Args:
+        matrix: Sub-score matrix, shape (leads, columns)
+
+    Returns:
+        Tuple of (distinct rows, distinct row index of each lead, leads per
+        distinct row)
+    """
+    keys = np.zeros(matrix.shape[0], dtype=np.int64)
+    capacity = 1
+    for j in range(matrix.shape[1]):
+        values, codes = np.unique(matrix[:, j], return_inverse=True)
+        capacity *= len(values)
+        if capacity >= 2**63:
+            distinct, inverse, counts = np.unique(
+                matrix, axis=0, return_inverse=True, return_counts=True
+            )
+            return distinct, inverse.reshape(-1), counts
+        keys = keys * len(values) + codes.reshape(-1)
+
+    _, first, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    return matrix[first], inverse.reshape(-1), counts
+
+
+def _take_top(totals: Any, counts: Any, by_row: Any, row_start: Any, top_k: int) -> Any:
+    """
+    Leads per distinct row that fall in the top-K, for each weighting.
+
+    Args:
+        totals: Totals of distinct rows, shape (rows, weightings)
+        counts: Leads sharing each distinct row
+        by_row: Lead row indices grouped by distinct row, in lead order
+            within each row
+        row_start: Offset of each distinct row's leads in ``by_row``
+        top_k: Number of leads in the top set
+
+    Returns:
+        Array of shape (rows, weightings) with how many of each row's
+        leads are in the top-K; ties go to the earliest leads, as in
+        ``rescore.top_indices``, so each row contributes its first leads
+    """
+    rows, width = totals.shape
+    taken = np.zeros((rows, width), dtype=np.int64)
+    if not top_k or not rows:
+        return taken
+
+    # Every top-K lead's total is at least the k-th largest distinct total
+    k = min(top_k, rows)
+    cutoffs = np.partition(totals, rows - k, axis=0)[rows - k]
+    for j in range(width):
+        column = totals[:, j]
+        candidates = np.flatnonzero(column >= cutoffs[j])
+        values = column[candidates]
+        order = np.argsort(-values, kind="stable")
+        candidates, values = candidates[order], values[order]
+
+        filled = np.cumsum(counts[candidates])
+        whole = int(np.searchsorted(filled, top_k, side="right"))
+        if whole == len(candidates):
+            taken[candidates, j] = counts[candidates]
+            continue
+
+        # Rows tied with the first row that does not fit share the
+        # remaining places by lead order
+        value = values[whole]
+        above = candidates[values > value]
+        tied = candidates[values == value]
+        taken[above, j] = counts[above]
+        slots = top_k - int(counts[above].sum())
+        leads = np.concatenate([by_row[row_start[r] : row_start[r] + counts[r]] for r in tied])
+        owners = np.repeat(tied, counts[tied])
+        chosen = owners[np.argsort(leads, kind="stable")[:slots]]
+        taken[:, j] += np.bincount(chosen, minlength=rows)
+    return taken
+
+
+def evaluate(
+    matrix: Any,
+    weights: Any,
+    baseline: Any,
+    top_k: int = 100,
+    thresholds: tuple = TIER_THRESHOLDS,
+    max_cells: int = 2_000_000,
+) -> dict[str, Any]:
+    """
+    Score every lead under every weighting and summarize each weighting.
+
+    Sub-scores are discrete, so many leads share the same row; weightings
+    are evaluated over the distinct rows and every statistic is weighted by
+    how many leads share each row.
+
+    Args:
+        matrix: Sub-score matrix, shape (leads, columns)
+        weights: Effective weights, shape (weightings, columns)
+        baseline: Effective weights of the reference weighting
+        top_k: Size of the top-K set compared with the baseline's
+        thresholds: ``(tier, minimum)`` pairs, highest tier first
+        max_cells: Upper bound on distinct rows x weightings scored at once
+
+    Returns:
+        Dictionary of per-weighting arrays: ``tier_counts`` (weightings x
+        tiers, A first), ``tier_changes``, ``avg_score`` and
+        ``top_k_overlap``, plus the baseline's ``baseline_tier_counts``
+        and ``baseline_top_k`` lead row indices
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    leads = matrix.shape[0]
+    top_k = max(min(top_k, leads), 0)
+    distinct, inverse, counts = distinct_rows(matrix)
+    # Leads grouped by distinct row, in lead order within each row
+    by_row = np.argsort(inverse, kind="stable")
+    row_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    minimums = np.asarray([t for _, t in thresholds], dtype=np.float64)
+    n_tiers = len(thresholds) + 1
+
+    weights_per_row = counts.astype(np.float64)
+
+    def tier_stats(totals: Any) -> tuple[Any, Any]:
+        # Levels (thresholds met: len(thresholds) for A, ..., 0 for D) and
+        # lead counts per tier, A first, from cumulative "at least" counts
+        levels = np.zeros(totals.shape, dtype=np.int8)
+        cumulative = [np.zeros(totals.shape[1:])]
+        for minimum in minimums:
+            met = totals >= minimum
+            levels += met
+            cumulative.append(weights_per_row @ met)
+        cumulative.append(np.full(totals.shape[1:], leads))
+        return levels, np.rint(np.diff(np.stack(cumulative, axis=-1), axis=-1)).astype(np.int64)
+
+    baseline_totals = distinct @ baseline
+    baseline_levels, baseline_tier_counts = tier_stats(baseline_totals)
+    baseline_taken = _take_top(baseline_totals[:, None], counts, by_row, row_start, top_k)[:, 0]
+
+    count = weights.shape[0]
+    tier_counts = np.zeros((count, n_tiers), dtype=np.int64)
+    changes = np.zeros(count, dtype=np.int64)
+    score_sums = np.zeros(count, dtype=np.float64)
+    overlap = np.zeros(count, dtype=np.int64)
+
+    block = max(1, max_cells // max(len(distinct), 1))
+    for b in range(0, count, block):
+        totals = distinct @ weights[b : b + block].T
+        end = b + totals.shape[1]
+
+        levels, tier_counts[b:end] = tier_stats(totals)
+        changes[b:end] = weights_per_row @ (levels != baseline_levels[:, None])
+        score_sums[b:end] = weights_per_row @ totals
+        taken = _take_top(totals, counts, by_row, row_start, top_k)
+        overlap[b:end] = np.minimum(taken, baseline_taken[:, None]).sum(axis=0)
+
+    # Lead rows in the baseline top-K: the first leads of each chosen row
+    baseline_top = []
+    for row in np.flatnonzero(baseline_taken):
+        start = row_start[row]
+        baseline_top.extend(by_row[start : start + baseline_taken[row]].tolist())
+    baseline_top.sort(key=lambda i: (-baseline_totals[inverse[i]], i))
+
+    return {
+        "tier_counts": tier_counts,
+        "tier_changes": changes,
+        "avg_score": score_sums / leads if leads else score_sums,
+        "top_k_overlap": overlap,
+        "baseline_tier_counts": baseline_tier_counts,
+        "baseline_top_k": baseline_top,
+        "distinct_rows": len(distinct),
+    }
+
+
+def parse_sweep(value: str) -> tuple[str, list[float]]:
+    """
+    Parse ``name=start:stop:step`` or ``name=v1,v2,...`` (stop inclusive).
+
+    Args:
+        value: Sweep specification from the command line
+
+    Returns:
+        Tuple of (parameter name, values)
+    """
+    name, sep, spec = value.partition("=")
+    if not sep or not spec:
+        raise ValueError(f"Invalid sweep (expected name=start:stop:step or name=v1,v2): {value}")
+
+    if ":" in spec:
+        start, stop, step = (float(part) for part in spec.split(":"))
+        if step <= 0:
+            raise ValueError(f"Sweep step must be positive: {value}")
+        steps = int(round((stop - start) / step))
+        values = [round(start + i * step, 10) for i in range(steps + 1)]
+    else:
+        values = [float(part) for part in spec.split(",")]
+    return name.strip(), values
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Explore how ICP weight changes move tiers and top leads"
+    )
+    parser.add_argument(
+        "--input", type=str, required=True, help="Batch output file with stored sub-scores"
+    )
+    parser.add_argument(
+        "--icp-config", type=str, help="Baseline ICP criteria (default: the batch's ICP)"
+    )
+    parser.add_argument(
+        "--sweep",
+        type=str,
+        action="append",
+        default=[],
+        help=(
+            "Weight to vary, as name=start:stop:step or name=v1,v2,... "
+            "(repeat for a grid), e.g. firmographic=0.2:0.5:0.05"
+        ),
+    )
+    parser.add_argument(
+        "--random", type=int, help="Evaluate this many random category weight mixes"
+    )
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="Rescale category weights of every weighting to sum to 1",
+    )
+    parser.add_argument("--top-k", type=int, default=100, help="Top-K set to compare")
+    parser.add_argument(
+        "--show", type=int, default=20, help="Weightings to print (most tier changes first)"
+    )
+    parser.add_argument("--output", type=str, help="Write every weighting's results (.csv or .json)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --random")
+
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        print("Error: numpy is required. Install with: pip install numpy")
+        return 1
+    if not args.sweep and not args.random:
+        print("Error: give at least one --sweep or --random")
+        return 1
+
+    try:
+        header = load_header(args.input)
+        baseline_icp = header.get("icp_criteria")
+        if args.icp_config:
+            with open(args.icp_config) as f:
+                baseline_icp = json.load(f)
+        model = WeightModel(baseline_icp)
+
+        if args.random:
+            categories, criteria, assignments = model.random_categories(args.random, args.seed)
+        else:
+            sweeps = dict(parse_sweep(value) for value in args.sweep)
+            categories, criteria, assignments = model.grid(sweeps)
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e.filename}")
+        return 1
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.normalize:
+        categories = categories / categories.sum(axis=1, keepdims=True)
+
+    matrix = load_matrix(args.input, mmap=False)
+    baseline = model.effective(model.category_weights[None, :], model.criterion_weights[None, :])[0]
+    weights = model.effective(categories, criteria)
+
+    start = time.perf_counter()
+    report = evaluate(matrix, weights, baseline, args.top_k)
+    elapsed = time.perf_counter() - start
+
+    rows = matrix.shape[0]
+    count = len(assignments)
+    rate = count / elapsed if elapsed else 0
+    print(
+        f"\n✓ Evaluated {count:,} weightings over {rows:,} leads "
+        f"({report['distinct_rows']:,} distinct sub-score rows) in {elapsed:.2f}s "
+        f"({rate:,.0f} weightings/s)"
+    )
+
+    labels = [tier for tier, _ in TIER_THRESHOLDS] + ["D"]
+    baseline_counts = report["baseline_tier_counts"].tolist()
+    print(
+        "\n   Baseline tiers: "
+        + ", ".join(f"{label}={n:,}" for label, n in zip(labels, baseline_counts))
+    )
+
+    results = []
+    for i, assignment in enumerate(assignments):
+        results.append(
+            {
+                **assignment,
+                **{
+                    f"tier_{label}": int(n)
+                    for label, n in zip(labels, report["tier_counts"][i].tolist())
+                },
+                "tier_changes": int(report["tier_changes"][i]),
+                "avg_score": round(float(report["avg_score"][i]), 2),
+                "top_k_overlap": int(report["top_k_overlap"][i]),
+            }
+        )
+
+    shown = sorted(results, key=lambda r: -r["tier_changes"])[: args.show]
+    if shown:
+        print(f"\n   Weightings with the most tier changes (top-{args.top_k} overlap vs baseline):")
+        for result in shown:
+            params = ", ".join(f"{name}={result[name]:g}" for name in assignments[0])
+            tiers = " ".join(f"{label}={result[f'tier_{label}']:,}" for label in labels)
+            print(
+                f"      {params} | {tiers} | changed {result['tier_changes']:,} | "
+                f"top-{args.top_k} kept {result['top_k_overlap']}"
+            )
+
+    if args.output:
+        if args.output.endswith(".json"):
+            ids = load_ids(args.input)
+            with open(args.output, "w") as f:
+                json.dump(
+                    {
+                        "baseline_tier_counts": dict(zip(labels, baseline_counts)),
+                        "baseline_top_k": [list(ids[i]) for i in report["baseline_top_k"]],
+                        "weightings": results,
+                    },
+                    f,
+                    indent=2,
+                )
+        else:
+            with open(args.output, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(results[0]))
+                writer.writeheader()
+                writer.writerows(results)
+        print(f"\n✅ What-if results saved to {args.output}")
+
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
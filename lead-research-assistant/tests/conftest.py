@@ -0,0 +1,87 @@
+"""Shared pytest setup: import path for ``scripts/`` and scoring fixtures."""
+
+import copy
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from lead_qualification import DEFAULT_ICP_CRITERIA  # noqa: E402
+
+_BEHAVIORAL = DEFAULT_ICP_CRITERIA["behavioral"]["criteria"]
+_STRATEGIC = DEFAULT_ICP_CRITERIA["strategic"]["criteria"]
+SIGNAL_GROUPS = {
+    "growth_signals": _BEHAVIORAL["growth_signals"]["signals"],
+    "buying_intent": _BEHAVIORAL["buying_intent"]["signals"],
+    "engagement": _BEHAVIORAL["engagement_potential"]["signals"],
+    "deal_factors": _STRATEGIC["deal_potential"]["factors"],
+    "competitive": _STRATEGIC["competitive_position"]["factors"],
+}
+
+
+def make_companies(count, seed=0):
+    """Random enriched companies, including missing fields and range edges."""
+    rng = random.Random(seed)
+    industries = ["SaaS", "saas platform", "Tech", "Fintech", "Retail", "AI", "", "Software"]
+    locations = ["San Francisco, North America", "EMEA - London", "Tokyo", "", None, "europe"]
+    technologies = ["AWS", "react", "Cobol", "Python", "Salesforce", "HubSpot"]
+    companies = []
+    for _ in range(count):
+        company = {"company_name": "Company"}
+        if rng.random() < 0.9:
+            company["employee_count"] = rng.choice(
+                [0, None, 5, 9.5, 10, 49, 50, 51, 200, 999, 1000, 5000, 10**6]
+            )
+        if rng.random() < 0.9:
+            company["revenue"] = rng.choice([0, None, 5e5, 1e6, 5e6, 1e7, 4.5e7, 1e9])
+        if rng.random() < 0.9:
+            company["industry"] = rng.choice(industries)
+        if rng.random() < 0.9:
+            company["location"] = rng.choice(locations)
+        if rng.random() < 0.9:
+            company["technologies"] = rng.sample(technologies, rng.randint(0, 4))
+        for field in ("has_api", "has_mobile_app", "uses_cloud", "modern_stack"):
+            if rng.random() < 0.5:
+                company[field] = rng.random() < 0.5
+        for field, signals in SIGNAL_GROUPS.items():
+            company[field] = {signal: rng.random() < 0.5 for signal in signals}
+        companies.append(company)
+    return companies
+
+
+def icp_variants():
+    """(name, criteria) pairs exercising the compiled scoring fallbacks."""
+    overlapping = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    ranges = overlapping["firmographic"]["criteria"]["company_size"]["ranges"]
+    ranges["smb"]["max"] = 5000
+    ranges["micro"]["max"] = 60
+
+    many_targets = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    firm = many_targets["firmographic"]["criteria"]
+    firm["industry_match"]["target_industries"] += [f"Vertical {i}" for i in range(40)]
+    firm["geographic_match"]["target_regions"] += [f"Region {i}" for i in range(40)]
+
+    reweighted = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    reweighted["firmographic"]["weight"] = 0.4
+    reweighted["behavioral"]["weight"] = 0.1
+
+    return [
+        ("default", DEFAULT_ICP_CRITERIA),
+        ("overlapping_ranges", overlapping),
+        ("many_targets", many_targets),
+        ("reweighted", reweighted),
+    ]
+
+
+@pytest.fixture(scope="session")
+def companies():
+    return make_companies(3000)
+
+
+@pytest.fixture(params=icp_variants(), ids=lambda variant: variant[0])
+def icp(request):
+    return request.param[1]
@@ -0,0 +1,121 @@
+"""Tests for the append-only checkpoint log."""
+
+import json
+import sys
+
+from batch_processor import main, process_batch
+from checkpoint_log import CheckpointLog, compact_checkpoint, iter_compacted, read_checkpoint
+from result_writer import load_results
+
+
+def write_lines(path, lines):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+def test_reopening_trims_a_torn_last_line(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    write_lines(path, ['{"id": "a", "n": 1}\n', '{"id": "b", "n": 2}\n', '{"id": "c", "n'])
+
+    with CheckpointLog(str(path)) as log:
+        log.append({"id": "d", "n": 4})
+
+    assert path.read_text().endswith('{"id":"d","n":4}\n')
+    assert [record["id"] for record in read_checkpoint(str(path))] == ["a", "b", "d"]
+
+
+def test_torn_line_longer_than_a_read_chunk_is_trimmed(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    write_lines(path, ['{"id": "a"}\n', '{"id": "b", "notes": "' + "x" * 10_000])
+
+    CheckpointLog(str(path)).close()
+
+    assert path.read_text() == '{"id": "a"}\n'
+
+
+def test_torn_only_line_empties_the_log(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    write_lines(path, ['{"id": "a", "n'])
+
+    CheckpointLog(str(path)).close()
+
+    assert path.read_text() == ""
+
+
+def test_complete_log_is_left_alone(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    lines = ['{"id": "a"}\n', '{"id": "b"}\n']
+    write_lines(path, lines)
+
+    CheckpointLog(str(path)).close()
+
+    assert path.read_text() == "".join(lines)
+
+
+def test_fresh_log_discards_existing_records(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    write_lines(path, ['{"id": "a"}\n'])
+
+    with CheckpointLog(str(path), fresh=True) as log:
+        log.append({"id": "b"})
+
+    assert [record["id"] for record in read_checkpoint(str(path))] == ["b"]
+
+
+def test_reading_skips_torn_and_invalid_lines(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    write_lines(path, ['{"id": "a"}\n', "not json\n", "\n", '{"id": "b"}\n', '{"id": "c'])
+
+    assert [record["id"] for record in read_checkpoint(str(path))] == ["a", "b"]
+
+
+def test_compaction_keeps_the_latest_record_per_lead(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    with CheckpointLog(str(path), fresh=True) as log:
+        log.append({"id": "a", "status": "error"})
+        log.append({"id": "b", "status": "success"})
+        log.append({"id": "a", "status": "success"})
+
+    compacted = list(iter_compacted(str(path)))
+
+    assert compacted == [{"id": "b", "status": "success"}, {"id": "a", "status": "success"}]
+
+
+def test_compact_checkpoint_writes_batch_output(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    output = tmp_path / "results.json"
+    with CheckpointLog(str(path), fresh=True) as log:
+        log.append({"id": "a", "status": "error"})
+        log.append({"id": "a", "status": "success"})
+        log.append({"id": "b", "status": "success"})
+
+    count = compact_checkpoint(str(path), str(output), {"total_processed": 2}, {"run": 1})
+
+    data = json.loads(output.read_text())
+    assert count == 2
+    assert data["leads"] == [{"id": "a", "status": "success"}, {"id": "b", "status": "success"}]
+    assert data["summary"] == {"total_processed": 2}
+    assert data["metadata"] == {"run": 1}
+    assert not (tmp_path / "results.json.tmp").exists()
+
+
+def test_compact_only_needs_no_input(tmp_path, monkeypatch):
+    progress = str(tmp_path / "progress.jsonl")
+    output = str(tmp_path / "results.json")
+    leads = [{"id": f"lead_{i:016x}", "company_name": f"Company {i}"} for i in range(3)]
+    process_batch(leads, parallel=1, progress_file=progress, collect_results=False)
+
+    argv = ["batch_processor.py", "--compact-only", "--progress-file", progress, "--output", output]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert main() == 0
+
+    data = load_results(output)
+    assert sorted(lead["id"] for lead in data["leads"]) == [lead["id"] for lead in leads]
+    assert data["summary"]["total_processed"] == 3
+    assert data["metadata"]["input_file"] is None
+
+
+def test_input_is_required_without_compact_only(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["batch_processor.py", "--output", str(tmp_path / "out.json")])
+    assert main() == 1
+    assert "--input is required" in capsys.readouterr().out
@@ -0,0 +1,153 @@
+"""Tests for enrichment cache keys and the cached MCP client."""
+
+import asyncio
+import threading
+
+from enrichment_cache import CachedMCPClient, EnrichmentCache, tool_cache_key
+from lead_enrichment import generate_enrichment_plan
+from mcp_client import plan_tool_calls
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def call_tool(self, tool, params):
+        self.calls.append((tool, params))
+        return {"tool": tool, "data": {"n": len(self.calls)}}
+
+
+def test_company_key_normalizes_website():
+    keys = {
+        tool_cache_key("web_data_reuter_news", {"website": website})
+        for website in ("https://www.Acme.com/about", "acme.com", "http://acme.com/")
+    }
+    assert keys == {"domain:acme.com"}
+
+
+def test_company_key_falls_back_to_linkedin_then_name():
+    linkedin = "https://www.linkedin.com/company/Acme/?trk=x"
+    assert tool_cache_key("t", {"linkedin_url": linkedin}) == "linkedin:linkedin.com/company/acme"
+    assert tool_cache_key("t", {"company_name": "Acme, Inc."}) == "name:acme"
+
+
+def test_query_key_ignores_case_and_spacing():
+    assert tool_cache_key("search_engine", {"query": "  Acme   CRM "}) == "query:acme crm"
+
+
+def test_person_key_includes_employer():
+    smith_acme = tool_cache_key("web_data_x_posts", {"name": "John Smith", "company": "Acme"})
+    smith_globex = tool_cache_key("web_data_x_posts", {"name": "John Smith", "company": "Globex"})
+    assert smith_acme != smith_globex
+
+
+def test_person_key_split_and_full_name_agree():
+    split = tool_cache_key(
+        "web_data_linkedin_people_search",
+        {"first_name": "John", "last_name": "Smith", "company": "Acme Inc"},
+    )
+    full = tool_cache_key("web_data_x_posts", {"name": " john  SMITH", "company": "acme"})
+    assert split == full
+
+
+def test_ambiguous_person_calls_have_no_key():
+    assert tool_cache_key("web_data_x_posts", {"name": None}) is None
+    assert tool_cache_key("web_data_x_posts", {"name": "John Smith"}) is None
+    assert tool_cache_key("web_data_x_posts", {"name": "", "company": "Acme"}) is None
+
+
+def test_plan_person_calls_carry_employer():
+    plan = generate_enrichment_plan(
+        {
+            "id": "lead_1",
+            "company_name": "Acme",
+            "website": "https://acme.com",
+            "contact_name": "John Smith",
+        }
+    )
+    person_calls = [params for tool, params in plan_tool_calls(plan) if tool == "web_data_x_posts"]
+    assert person_calls == [{"name": "John Smith", "company": "Acme", "website": "https://acme.com"}]
+    assert tool_cache_key("web_data_x_posts", person_calls[0]) == "person:john smith|domain:acme.com"
+
+
+def test_cached_client_serves_repeat_calls(tmp_path):
+    cache = EnrichmentCache(str(tmp_path / "cache.db"))
+    client = RecordingClient()
+    cached = CachedMCPClient(client, cache)
+
+    first = cached.call_tool("web_data_reuter_news", {"website": "acme.com"})
+    second = cached.call_tool("web_data_reuter_news", {"website": "https://www.acme.com"})
+
+    assert first == second
+    assert len(client.calls) == 1
+    cache.close()
+
+
+def test_cached_client_keeps_same_name_contacts_apart(tmp_path):
+    cache = EnrichmentCache(str(tmp_path / "cache.db"))
+    client = RecordingClient()
+    cached = CachedMCPClient(client, cache)
+
+    acme = cached.call_tool("web_data_x_posts", {"name": "John Smith", "company": "Acme"})
+    globex = cached.call_tool("web_data_x_posts", {"name": "John Smith", "company": "Globex"})
+
+    assert acme != globex
+    assert len(client.calls) == 2
+    cache.close()
+
+
+def test_cached_client_never_caches_ambiguous_person(tmp_path):
+    cache = EnrichmentCache(str(tmp_path / "cache.db"))
+    client = RecordingClient()
+    cached = CachedMCPClient(client, cache)
+
+    cached.call_tool("web_data_x_posts", {"name": "John Smith"})
+    cached.call_tool("web_data_x_posts", {"name": "John Smith"})
+
+    assert len(client.calls) == 2
+    assert cache.stats()["entries"] == 0
+    cache.close()
+
+
+class AsyncRecordingClient(RecordingClient):
+    async def acall_tool(self, tool, params):
+        return self.call_tool(tool, params)
+
+
+class ThreadRecordingCache(EnrichmentCache):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, tool, key):
+        self.threads.append(threading.get_ident())
+        return super().get(tool, key)
+
+    def set(self, tool, key, response):
+        self.threads.append(threading.get_ident())
+        super().set(tool, key, response)
+
+
+def test_async_cached_client_keeps_sqlite_off_the_event_loop(tmp_path):
+    cache = ThreadRecordingCache(str(tmp_path / "cache.db"))
+    client = AsyncRecordingClient()
+    cached = CachedMCPClient(client, cache)
+
+    async def run():
+        first = await cached.acall_tool("web_data_reuter_news", {"website": "acme.com"})
+        rest = await asyncio.gather(
+            cached.acall_tool("web_data_reuter_news", {"website": "https://www.acme.com"}),
+            cached.acall_tool("web_data_reuter_news", {"website": "globex.com"}),
+        )
+        return threading.get_ident(), first, rest
+
+    loop_thread, first, (repeat, other) = asyncio.run(run())
+
+    assert repeat == first
+    assert other != first
+    assert len(client.calls) == 2
+    assert cache.stats()["hits"] == 1
+    # Two misses each read then write; the hit only reads
+    assert len(cache.threads) == 5
+    assert loop_thread not in cache.threads
+    cache.close()
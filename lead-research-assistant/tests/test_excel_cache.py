@@ -0,0 +1,150 @@
+"""Tests for the columnar .leadtable cache kept next to Excel input."""
+
+import os
+import sys
+
+import pytest
+
+import batch_processor
+from batch_processor import EXCEL_CACHE_VERSION, excel_cache_path, load_leads_excel
+from lead_table import LeadTable, read_table_meta
+
+openpyxl = pytest.importorskip("openpyxl")
+
+COLUMNS = ("company_name", "website", "industry", "contact_name")
+
+
+def write_workbook(path, count, start=0):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(COLUMNS)
+    for i in range(start, start + count):
+        sheet.append([f"Company {i}", f"company{i}.com", "SaaS" if i % 2 else "Retail", None])
+    workbook.save(path)
+
+
+class Calls:
+    """Counts workbook parses and content hashes during a load."""
+
+    def __init__(self, monkeypatch):
+        self.parses = 0
+        self.digests = 0
+        parse, digest = batch_processor.iter_leads_excel, batch_processor.file_digest
+
+        def counting_parse(path):
+            self.parses += 1
+            return parse(path)
+
+        def counting_digest(path):
+            self.digests += 1
+            return digest(path)
+
+        monkeypatch.setattr(batch_processor, "iter_leads_excel", counting_parse)
+        monkeypatch.setattr(batch_processor, "file_digest", counting_digest)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "leads.xlsx"
+    write_workbook(path, 30)
+    return str(path)
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    return Calls(monkeypatch)
+
+
+def touch(path, seconds=60):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+def test_second_load_reads_the_cache(workbook, calls):
+    first = list(load_leads_excel(workbook))
+    assert calls.parses == 1
+    meta = read_table_meta(excel_cache_path(workbook))
+    stat = os.stat(workbook)
+    assert meta["version"] == EXCEL_CACHE_VERSION
+    assert (meta["mtime_ns"], meta["size"]) == (stat.st_mtime_ns, stat.st_size)
+
+    second = load_leads_excel(workbook)
+    assert isinstance(second, LeadTable)
+    assert list(second) == first
+    assert (calls.parses, calls.digests) == (1, 1)
+
+
+def test_changed_workbook_is_parsed_again(workbook, calls):
+    load_leads_excel(workbook)
+    write_workbook(workbook, 45, start=100)
+    touch(workbook)
+
+    leads = list(load_leads_excel(workbook))
+
+    assert calls.parses == 2
+    assert [lead["company_name"] for lead in leads] == [f"Company {i}" for i in range(100, 145)]
+    assert read_table_meta(excel_cache_path(workbook))["size"] == os.path.getsize(workbook)
+
+
+def test_touched_but_unchanged_workbook_is_matched_by_hash(workbook, calls):
+    first = list(load_leads_excel(workbook))
+    touch(workbook)
+
+    assert list(load_leads_excel(workbook)) == first
+    assert (calls.parses, calls.digests) == (1, 2)
+
+    # The cache now records the new mtime, so the next load skips hashing
+    assert read_table_meta(excel_cache_path(workbook))["mtime_ns"] == os.stat(workbook).st_mtime_ns
+    assert list(load_leads_excel(workbook)) == first
+    assert (calls.parses, calls.digests) == (1, 2)
+
+
+def test_same_size_with_a_different_hash_is_parsed_again(workbook, calls):
+    load_leads_excel(workbook)
+    cache_path = excel_cache_path(workbook)
+    # Stands in for a same-size edit: the recorded hash no longer matches
+    meta = read_table_meta(cache_path)
+    stale = LeadTable.load(cache_path)
+    stale.save(cache_path, {**meta, "sha256": "0" * 64})
+    touch(workbook)
+
+    load_leads_excel(workbook)
+
+    assert (calls.parses, calls.digests) == (2, 2)
+    assert read_table_meta(cache_path)["sha256"] == batch_processor.file_digest(workbook)
+
+
+def test_unreadable_cache_is_replaced(workbook, calls, capsys):
+    first = list(load_leads_excel(workbook))
+    with open(excel_cache_path(workbook), "wb") as f:
+        f.write(b"not a lead table")
+
+    assert list(load_leads_excel(workbook)) == first
+    assert calls.parses == 2
+    assert "Ignoring unreadable Excel cache" in capsys.readouterr().out
+    assert list(load_leads_excel(workbook)) == first
+    assert calls.parses == 2
+
+
+def test_cache_can_be_bypassed(workbook, calls):
+    load_leads_excel(workbook, use_cache=False)
+    assert not os.path.exists(excel_cache_path(workbook))
+
+    load_leads_excel(workbook)
+    write_workbook(workbook, 10, start=500)
+    touch(workbook)
+    # A bypassed load neither reads nor refreshes the stale cache
+    leads = list(load_leads_excel(workbook, use_cache=False))
+    assert leads[0]["company_name"] == "Company 500"
+    assert read_table_meta(excel_cache_path(workbook))["size"] != os.path.getsize(workbook)
+    assert calls.parses == 3
+
+
+@pytest.mark.parametrize("flag", [[], ["--no-excel-cache"]], ids=["cached", "no_cache"])
+def test_cli_excel_cache_flag(workbook, tmp_path, monkeypatch, flag):
+    output = str(tmp_path / "results.json")
+    argv = ["batch_processor.py", "--input", workbook, "--output", output, "--parallel", "1"]
+    monkeypatch.setattr(sys, "argv", argv + flag)
+
+    assert batch_processor.main() == 0
+    assert os.path.exists(excel_cache_path(workbook)) == (not flag)
@@ -0,0 +1,83 @@
+"""Tests that every executor gives the thread executor's results."""
+
+import pytest
+
+from batch_processor import process_batch
+from conftest import icp_variants
+from lead_table import LeadTable
+from mcp_client import LocalMCPServer
+
+INDUSTRIES = ["SaaS", "Retail", "Fintech", None, "Software", "Healthcare", "AI"]
+
+
+def make_leads(count):
+    return [
+        {
+            "id": f"lead_{i:016x}",
+            "company_name": f"Company {i}",
+            "website": f"company{i % 40}.com" if i % 3 else None,
+            "industry": INDUSTRIES[i % len(INDUSTRIES)],
+            "contact_name": f"Contact {i % 11}" if i % 2 else None,
+            "contact_title": "CTO" if i % 5 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def in_input_order(results, leads):
+    # Executors yield in completion order; processed_at is a wall-clock time
+    by_id = {}
+    for result in results:
+        record = result.to_dict()
+        del record["processed_at"]
+        by_id[record["id"]] = record
+    assert len(by_id) == len(results) == len(leads)
+    return [by_id[lead["id"]] for lead in leads]
+
+
+@pytest.fixture(scope="module")
+def leads():
+    return make_leads(150)
+
+
+@pytest.fixture(scope="module")
+def thread_results(leads):
+    return in_input_order(process_batch(list(leads), parallel=3), leads)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 64])
+def test_process_executor_matches_threads(leads, thread_results, chunk_size):
+    results = process_batch(list(leads), parallel=2, executor="process", chunk_size=chunk_size)
+    assert in_input_order(results, leads) == thread_results
+
+
+def test_process_executor_ships_lead_table_slices(leads):
+    table = LeadTable.from_leads(dict(lead) for lead in leads)
+    threads = process_batch(table, parallel=2)
+    processes = process_batch(table, parallel=2, executor="process", chunk_size=16)
+    assert in_input_order(processes, leads) == in_input_order(threads, leads)
+
+
+def test_process_workers_receive_the_batch_icp(leads):
+    icp = dict(icp_variants())["reweighted"]
+    threads = process_batch(list(leads), parallel=2, icp_criteria=icp)
+    processes = process_batch(list(leads), parallel=2, icp_criteria=icp, executor="process")
+
+    assert in_input_order(processes, leads) == in_input_order(threads, leads)
+    assert in_input_order(processes, leads) != in_input_order(process_batch(list(leads)), leads)
+
+
+@pytest.mark.parametrize("concurrency", [1, 7, 100])
+def test_async_executor_matches_threads(leads, thread_results, concurrency):
+    results = process_batch(list(leads), parallel=concurrency, executor="async")
+    assert in_input_order(results, leads) == thread_results
+
+
+def test_async_executor_with_an_mcp_client_matches_threads(leads):
+    threads = process_batch(list(leads), parallel=3, mcp_client=LocalMCPServer(latency=0))
+    # Jittered latency makes coroutines finish out of order
+    server = LocalMCPServer(latency=0.001, jitter=0.004, seed=1)
+    coroutines = process_batch(list(leads), parallel=50, executor="async", mcp_client=server)
+
+    assert in_input_order(coroutines, leads) == in_input_order(threads, leads)
+    assert [result.id for result in coroutines] != [lead["id"] for lead in leads]
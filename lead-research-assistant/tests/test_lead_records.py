@@ -0,0 +1,120 @@
+"""Tests that compact lead records round-trip to the output JSON shape."""
+
+import json
+
+import pytest
+
+from batch_processor import process_batch, process_single_lead
+from conftest import icp_variants, make_companies
+from lead_enrichment import generate_enrichment_plan
+from lead_qualification import MultiICPScorer, qualify_lead
+from lead_records import EnrichmentPlan, ICPFit, LeadResult, Scores, as_record
+
+LEADS = [
+    {"id": "lead_a", "company_name": "Acme", "website": "acme.com", "industry": "SaaS"},
+    {
+        "id": "lead_b",
+        "company_name": "Globex",
+        "linkedin_url": "https://www.linkedin.com/company/globex",
+        "contact_name": "Jane Doe",
+        "contact_title": "CTO",
+    },
+    {"id": "lead_c", "company_name": "Initech", "notes": "met at a conference"},
+    {"id": "lead_d", "company_name": "Hooli", "website": "hooli.com", "contact_name": "Gavin"},
+]
+
+
+def same(actual, expected):
+    # Key order is part of the output JSON shape
+    return json.dumps(actual) == json.dumps(expected)
+
+
+def test_scores_round_trip(companies, icp):
+    for company in companies[:500]:
+        qualification = qualify_lead(company, icp)
+        scores = Scores.from_dict(qualification)
+        assert same(scores.to_dict(), qualification)
+        assert scores.tier == qualification["tier"]
+        assert scores.weighted_total == qualification["weighted_total"]
+        assert scores.get("firmographic", "revenue") == qualification["firmographic"]["revenue"]
+
+
+def test_icp_fit_round_trip():
+    scorer = MultiICPScorer(dict(icp_variants()))
+    for company in make_companies(200, seed=9):
+        _, fit = scorer.qualify(company)
+        shared = ICPFit.from_dict(fit, scorer.names)
+        assert same(shared.to_dict(), fit)
+        assert shared.names is scorer.names
+        assert same(ICPFit.from_dict(fit).to_dict(), fit)
+
+
+def test_enrichment_plan_round_trip():
+    plans = [EnrichmentPlan.from_dict(generate_enrichment_plan(lead)) for lead in LEADS]
+    for lead, plan in zip(LEADS, plans):
+        assert same(plan.to_dict(), generate_enrichment_plan(lead))
+
+    # Plans of the same shape share one layout
+    again = EnrichmentPlan.from_dict(generate_enrichment_plan(dict(LEADS[0])))
+    assert again.layout is plans[0].layout
+
+
+def test_lead_result_round_trips_through_json():
+    icp = dict(icp_variants())
+    records = [process_single_lead(dict(lead)) for lead in LEADS]
+    records += [process_single_lead(dict(lead), MultiICPScorer(icp)) for lead in LEADS[:2]]
+    records.append(LeadResult(dict(LEADS[0]), status="error", error="lookup failed"))
+
+    for record in records:
+        data = json.loads(json.dumps(record.to_dict()))
+        restored = LeadResult.from_dict(data)
+        assert same(restored.to_dict(), record.to_dict())
+        assert restored.lead == {key: value for key, value in data.items() if key in record.lead}
+        assert as_record(data).to_dict() == record.to_dict()
+        assert as_record(record) is record
+
+
+def test_lead_result_reads_like_the_result_dict():
+    scorer = MultiICPScorer(dict(icp_variants()))
+    records = [process_single_lead(dict(LEADS[0]), scorer)]
+    records.append(LeadResult(dict(LEADS[1]), status="error", error="lookup failed"))
+
+    for record in records:
+        expected = record.to_dict()
+        assert list(record) == list(record.keys()) == list(expected)
+        assert len(record) == len(expected)
+        assert same({key: record[key] for key in record}, expected)
+        assert record.as_dict() == expected
+        for key in expected:
+            assert key in record
+            assert record.get(key) == expected[key]
+
+    success, error = records
+    assert success["status"] == "success"
+    assert success["qualification"]["tier"] == success.qualification.tier
+    assert success["icp_fit"]["best_fit"] == success.icp_fit.best_fit
+    assert success["company_name"] == "Acme"
+    assert "error" not in success
+    assert success.get("error") is None
+    with pytest.raises(KeyError):
+        success["error"]
+    assert error["error"] == "lookup failed"
+    assert "qualification" not in error
+    assert error.get("enrichment_plan", "none") == "none"
+
+
+def test_result_fields_override_lead_fields_as_in_to_dict():
+    lead = {"id": "lead_x", "company_name": "Acme", "status": "prospect", "error": "stale"}
+    record = LeadResult(lead, status="success")
+    expected = record.to_dict()
+    assert list(record) == list(expected)
+    assert record["status"] == expected["status"] == "success"
+    # An unset result field leaves the lead's value in place
+    assert record["error"] == expected["error"] == "stale"
+
+
+def test_batch_results_support_dict_access():
+    results = process_batch([dict(lead) for lead in LEADS], parallel=2)
+    assert sorted(result["id"] for result in results) == sorted(lead["id"] for lead in LEADS)
+    assert all(result["status"] == "success" for result in results)
+    json.dumps([result.as_dict() for result in results])
@@ -0,0 +1,52 @@
+"""Tests for columnar lead storage."""
+
+import pytest
+
+from lead_table import IdColumn, LeadTable
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "lead_0123456789abcdef",
+        "lead_0x23456789abcdef",
+        "lead_+123456789abcdef",
+        "lead_0123_56789abcdef",
+        "lead_0123456789ABCDEF",
+        "lead_0123456789abcde",
+        "lead_0123456789abcdef\n",
+        "row-17",
+        "",
+        None,
+    ],
+)
+def test_id_column_returns_ids_verbatim(value):
+    column = IdColumn()
+    column.append(value)
+    assert column[0] == value
+    assert list(column) == [value]
+
+
+def test_only_canonical_ids_are_packed():
+    column = IdColumn()
+    for value in ("lead_0123456789abcdef", "lead_0123456789ABCDEF", "lead_0x23456789abcdef"):
+        column.append(value)
+    assert set(column.other) == {1, 2}
+
+
+def test_take_and_save_keep_ids(tmp_path):
+    leads = [
+        {"id": "lead_00000000000000ff", "company_name": "Acme"},
+        {"id": "lead_00000000000000FF", "company_name": "Globex"},
+        {"id": "custom-id", "company_name": "Initech"},
+    ]
+    table = LeadTable.from_leads(leads)
+    assert list(table.take([2, 1, 0]).column("id")) == [
+        "custom-id",
+        "lead_00000000000000FF",
+        "lead_00000000000000ff",
+    ]
+
+    path = str(tmp_path / "leads.leadtable")
+    table.save(path)
+    assert list(LeadTable.load(path).column("id")) == [lead["id"] for lead in leads]
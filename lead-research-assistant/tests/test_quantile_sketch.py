@@ -0,0 +1,147 @@
+"""Tests that KLLSketch quantiles stay within its rank error bound."""
+
+import bisect
+import json
+import math
+import random
+
+import pytest
+
+from quantile_sketch import KLLSketch
+
+FRACTIONS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+# About 1.7 / k for the default k = 256, with room for an unlucky seed
+MAX_RANK_ERROR = 0.015
+
+
+def stream(count, seed=0, distinct=None):
+    rng = random.Random(seed)
+    if distinct:
+        # Scores take few values, so many items tie
+        return [float(rng.randrange(distinct)) for _ in range(count)]
+    return [rng.gauss(50, 15) for _ in range(count)]
+
+
+def rank_error(sorted_values, value, fraction):
+    # Distance from the target fraction to the value's rank interval (ties)
+    low = bisect.bisect_left(sorted_values, value) / len(sorted_values)
+    high = bisect.bisect_right(sorted_values, value) / len(sorted_values)
+    return max(low - fraction, fraction - high, 0)
+
+
+def sketch_of(values, k=256, seed=0):
+    sketch = KLLSketch(k, seed)
+    sketch.update_all(values)
+    return sketch
+
+
+@pytest.mark.parametrize("count", [1, 50, 1000, 20_000, 200_000])
+@pytest.mark.parametrize("distinct", [None, 40], ids=["continuous", "ties"])
+def test_quantiles_are_within_rank_error(count, distinct):
+    values = stream(count, seed=count, distinct=distinct)
+    sketch = sketch_of(values)
+    ordered = sorted(values)
+
+    for fraction, value in zip(FRACTIONS, sketch.quantiles(FRACTIONS)):
+        assert rank_error(ordered, value, fraction) <= MAX_RANK_ERROR, fraction
+    assert sketch.quantiles([0, 1]) == [ordered[0], ordered[-1]]
+    assert sketch.count == count
+    # Memory stays bounded however long the stream is
+    assert sketch._size <= 4 * sketch.k
+
+
+def test_rank_estimates_match_sorted_data():
+    values = stream(50_000, seed=1)
+    sketch = sketch_of(values)
+    ordered = sorted(values)
+    for probe in (ordered[0], ordered[500], ordered[25_000], ordered[49_000], ordered[-1]):
+        true_rank = bisect.bisect_right(ordered, probe) / len(ordered)
+        assert sketch.rank(probe) == pytest.approx(true_rank, abs=MAX_RANK_ERROR)
+
+
+def test_short_streams_are_exact():
+    values = stream(100, seed=2)
+    sketch = sketch_of(values)
+    ordered = sorted(values)
+    # Nothing was compacted, so each quantile is the item at its rank
+    for fraction, value in zip(FRACTIONS, sketch.quantiles(FRACTIONS)):
+        assert value == ordered[math.ceil(fraction * len(ordered)) - 1]
+
+
+@pytest.mark.parametrize("shards", [2, 5, 17])
+def test_merged_shards_match_one_sketch_over_the_union(shards):
+    values = stream(60_000, seed=shards)
+    bounds = sorted(random.Random(shards).sample(range(1, len(values)), shards - 1))
+    bounds = [0] + bounds + [len(values)]
+
+    merged = KLLSketch()
+    for seed, (a, b) in enumerate(zip(bounds, bounds[1:])):
+        merged.merge(sketch_of(values[a:b], seed=seed))
+    single = sketch_of(values)
+    ordered = sorted(values)
+
+    assert (merged.count, merged.min, merged.max) == (single.count, single.min, single.max)
+    for fraction, value, expected in zip(
+        FRACTIONS, merged.quantiles(FRACTIONS), single.quantiles(FRACTIONS)
+    ):
+        assert rank_error(ordered, value, fraction) <= MAX_RANK_ERROR, fraction
+        # Both estimates sit close together in rank, not only near the truth
+        assert abs(bisect.bisect_left(ordered, value) - bisect.bisect_left(ordered, expected)) <= (
+            2 * MAX_RANK_ERROR * len(ordered)
+        )
+    assert merged._size <= 4 * merged.k
+
+
+def test_merge_with_empty_sketches():
+    values = stream(5000, seed=3)
+    sketch = sketch_of(values)
+    before = sketch.to_state()
+
+    assert sketch.merge(KLLSketch()).to_state() == before
+    empty = KLLSketch().merge(sketch_of(values))
+    assert empty.to_state() == before
+
+
+def test_merge_rejects_a_different_k():
+    with pytest.raises(ValueError, match="k=256 and k=128"):
+        KLLSketch().merge(sketch_of([1.0], k=128))
+
+
+def test_state_round_trips_through_json():
+    values = stream(30_000, seed=4)
+    sketch = sketch_of(values)
+
+    restored = KLLSketch.from_state(json.loads(json.dumps(sketch.to_state())))
+
+    assert restored.to_state() == sketch.to_state()
+    assert restored.quantiles(FRACTIONS) == sketch.quantiles(FRACTIONS)
+    assert restored.rank(50.0) == sketch.rank(50.0)
+
+    # A restored sketch keeps accepting values within its bounds
+    more = stream(30_000, seed=5)
+    restored.update_all(more)
+    ordered = sorted(values + more)
+    for fraction, value in zip(FRACTIONS, restored.quantiles(FRACTIONS)):
+        assert rank_error(ordered, value, fraction) <= MAX_RANK_ERROR, fraction
+    assert restored._size <= 4 * restored.k
+
+
+def test_empty_state_round_trips():
+    restored = KLLSketch.from_state(KLLSketch(k=64).to_state())
+    assert restored.k == 64
+    assert restored.quantiles([0, 0.5]) == [None, None]
+    assert restored.rank(1.0) == 0.0
+    restored.update(3.0)
+    assert restored.quantile(0.5) == 3.0
+
+
+def test_same_seed_is_reproducible():
+    values = stream(20_000, seed=6)
+    assert sketch_of(values, seed=9).to_state() == sketch_of(values, seed=9).to_state()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+    with pytest.raises(ValueError):
+        sketch_of([1.0, 2.0]).quantiles([1.5])
@@ -0,0 +1,125 @@
+"""Tests that re-scoring stored sub-scores matches a fresh qualification run."""
+
+import copy
+
+import pytest
+
+from batch_processor import process_batch
+from conftest import make_companies
+from lead_qualification import DEFAULT_ICP_CRITERIA, TIER_THRESHOLDS, assign_tier, qualify_lead
+from lead_records import LeadResult, Scores
+from rescore import TIER_LABELS, rescore, rescore_totals
+from result_writer import ResultWriter
+from subscore_store import SubscoreWriter, load_ids, load_matrix
+
+CATEGORIES = ("firmographic", "technographic", "behavioral", "strategic")
+
+
+def as_list(values):
+    # NumPy arrays become Python floats/ints, so round() is Python's
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def reweighted_icps():
+    categories = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    for category, weight in zip(categories, (0.1, 0.2, 0.3, 0.4)):
+        categories[category]["weight"] = weight
+
+    criteria = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    firm = criteria["firmographic"]["criteria"]
+    firm["company_size"]["weight"] = 0.05
+    firm["industry_match"]["weight"] = 0.55
+    behavioral = criteria["behavioral"]["criteria"]
+    behavioral["buying_intent"]["weight"] = 0.7
+    behavioral["growth_signals"]["weight"] = 0.1
+    return [("categories", categories), ("criteria", criteria)]
+
+
+def store_subscores(output_path, companies):
+    writer = SubscoreWriter(output_path, DEFAULT_ICP_CRITERIA)
+    for i, company in enumerate(companies):
+        lead = {"id": f"lead_{i:016x}", "company_name": company["company_name"]}
+        qualification = Scores.from_dict(qualify_lead(company))
+        writer.write(LeadResult(lead, qualification=qualification, status="success"))
+    writer.close()
+
+
+@pytest.mark.parametrize("new_icp", reweighted_icps(), ids=lambda variant: variant[0])
+def test_rescore_matches_fresh_qualification(tmp_path, new_icp):
+    new_icp = new_icp[1]
+    companies = make_companies(2000, seed=3)
+    output = str(tmp_path / "results.jsonl")
+    store_subscores(output, companies)
+
+    rescored = rescore(output, new_icp)
+
+    fresh = [qualify_lead(company, new_icp) for company in companies]
+    previous = [qualify_lead(company) for company in companies]
+    assert [round(total, 2) for total in as_list(rescored["totals"])] == [
+        result["weighted_total"] for result in fresh
+    ]
+    assert [TIER_LABELS[code] for code in as_list(rescored["tiers"])] == [
+        result["tier"] for result in fresh
+    ]
+    assert [TIER_LABELS[code] for code in as_list(rescored["previous_tiers"])] == [
+        result["tier"] for result in previous
+    ]
+
+
+def test_rescore_without_numpy_matches_numpy(tmp_path):
+    np = pytest.importorskip("numpy")
+    companies = make_companies(500, seed=4)
+    output = str(tmp_path / "results.jsonl")
+    store_subscores(output, companies)
+    icp = reweighted_icps()[1][1]
+
+    matrix = load_matrix(output, mmap=False)
+    rows = matrix.tolist()
+
+    assert rescore_totals(rows, icp) == rescore_totals(matrix, icp).tolist()
+    assert isinstance(rescore_totals(matrix, icp), np.ndarray)
+
+
+def test_custom_thresholds(tmp_path):
+    companies = make_companies(300, seed=5)
+    output = str(tmp_path / "results.jsonl")
+    store_subscores(output, companies)
+    thresholds = (("A", 60), ("B", 45), ("C", 30))
+    assert len(thresholds) == len(TIER_THRESHOLDS)
+
+    rescored = rescore(output, None, thresholds)
+
+    expected = []
+    for company in companies:
+        result = qualify_lead(company)
+        # Tiers are assigned from the unrounded total
+        total = sum(result[category]["weighted"] for category in CATEGORIES)
+        expected.append(assign_tier(total, thresholds))
+    assert [TIER_LABELS[code] for code in as_list(rescored["tiers"])] == expected
+
+
+def test_batch_run_stores_subscores_for_rescoring(tmp_path):
+    leads = [
+        {"id": f"lead_{i:016x}", "company_name": f"Company {i}", "industry": industry}
+        for i, industry in enumerate(["SaaS", "Retail", "Fintech", None, "Software"])
+    ]
+    output = str(tmp_path / "results.jsonl")
+    new_icp = reweighted_icps()[0][1]
+
+    writer = ResultWriter(output)
+    subscores = SubscoreWriter(output, DEFAULT_ICP_CRITERIA)
+    process_batch(leads, parallel=1, result_writer=writer, subscore_writer=subscores)
+    writer.close()
+    subscores.close()
+
+    fresh = {
+        result.id: result.qualification
+        for result in process_batch(leads, parallel=1, icp_criteria=new_icp)
+    }
+    rescored = rescore(output, new_icp)
+
+    ids = [lead_id for lead_id, _ in load_ids(output)]
+    assert sorted(ids) == sorted(fresh)
+    for lead_id, total, code in zip(ids, as_list(rescored["totals"]), as_list(rescored["tiers"])):
+        assert round(total, 2) == fresh[lead_id].weighted_total
+        assert TIER_LABELS[code] == fresh[lead_id].tier
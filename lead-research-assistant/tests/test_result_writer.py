@@ -0,0 +1,175 @@
+"""Tests for streaming batch results to disk and loading them back."""
+
+import json
+
+import pytest
+
+from batch_processor import process_batch, process_single_lead
+from checkpoint_log import read_checkpoint
+from lead_table import LeadTable
+from result_writer import ResultWriter, load_results, sidecar_path
+
+SUMMARY = {"total_processed": 3, "tiers": {"A": 1}}
+METADATA = {"input_file": "leads.csv", "parallel_workers": 2}
+
+LEADS = [
+    {"id": "lead_0000000000000001", "company_name": "Acme", "industry": "SaaS"},
+    {"id": "lead_0000000000000002", "company_name": "Globex", "contact_title": "CTO"},
+    {"id": "lead_0000000000000003", "company_name": "Initech", "website": "initech.com"},
+]
+
+
+def sample_results():
+    return [process_single_lead(dict(lead)) for lead in LEADS]
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_round_trip_keeps_leads_summary_and_metadata(tmp_path, suffix):
+    path = str(tmp_path / f"results{suffix}")
+    results = sample_results()
+
+    writer = ResultWriter(path)
+    for result in results:
+        writer.write(result)
+    writer.close(SUMMARY, METADATA)
+
+    data = load_results(path)
+    assert data["leads"] == [result.to_dict() for result in results]
+    assert data["summary"] == SUMMARY
+    assert data["metadata"] == METADATA
+
+
+def test_json_trailer_follows_the_leads(tmp_path):
+    path = tmp_path / "results.json"
+    writer = ResultWriter(str(path))
+    writer.write({"id": "a"})
+    writer.close(SUMMARY, METADATA)
+
+    assert list(json.loads(path.read_text())) == ["leads", "summary", "metadata"]
+
+
+def test_jsonl_summary_goes_to_sidecar(tmp_path):
+    path = tmp_path / "results.jsonl"
+    writer = ResultWriter(str(path))
+    writer.write({"id": "a"})
+    writer.write({"id": "b"})
+    writer.close(SUMMARY, METADATA)
+
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [
+        {"id": "a"},
+        {"id": "b"},
+    ]
+    with open(sidecar_path(str(path)), encoding="utf-8") as f:
+        assert json.load(f) == {"summary": SUMMARY, "metadata": METADATA}
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_empty_output_is_valid(tmp_path, suffix):
+    path = str(tmp_path / f"results{suffix}")
+    ResultWriter(path).close(SUMMARY, METADATA)
+
+    assert load_results(path) == {"leads": [], "summary": SUMMARY, "metadata": METADATA}
+
+
+def test_atomic_output_appears_only_on_close(tmp_path):
+    path = tmp_path / "results.json"
+    writer = ResultWriter(str(path), atomic=True)
+    writer.write({"id": "a"})
+    assert not path.exists()
+
+    writer.close(SUMMARY, METADATA)
+    assert load_results(str(path))["leads"] == [{"id": "a"}]
+    assert not (tmp_path / "results.json.tmp").exists()
+
+
+def test_abort_discards_atomic_output(tmp_path):
+    path = tmp_path / "results.json"
+    writer = ResultWriter(str(path), atomic=True)
+    writer.write({"id": "a"})
+    writer.abort()
+
+    assert not path.exists()
+    assert not (tmp_path / "results.json.tmp").exists()
+
+
+def test_load_results_collects_into_a_table(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    results = sample_results()
+    writer = ResultWriter(path)
+    for result in results:
+        writer.write(result)
+    writer.close(SUMMARY, METADATA)
+
+    table = load_results(path, collect=LeadTable.from_results)["leads"]
+
+    assert [lead["id"] for lead in table] == [result.id for result in results]
+    assert list(table.column("tier")) == [result.qualification.tier for result in results]
+    assert list(table.column("weighted_total")) == [
+        result.qualification.weighted_total for result in results
+    ]
+
+
+def test_streamed_batch_keeps_no_results_in_memory(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+
+    writer = ResultWriter(path)
+    assert process_batch([dict(lead) for lead in LEADS], parallel=1, result_writer=writer) == []
+    writer.close()
+
+    written = sorted(lead["id"] for lead in load_results(path)["leads"])
+    assert written == [lead["id"] for lead in LEADS]
+
+
+def test_checkpointed_batch_can_skip_collecting_results(tmp_path):
+    progress = str(tmp_path / "progress.jsonl")
+
+    leads = [dict(lead) for lead in LEADS]
+    assert process_batch(leads, parallel=1, progress_file=progress, collect_results=False) == []
+    assert len(list(read_checkpoint(progress))) == len(LEADS)
+    assert len(process_batch([dict(lead) for lead in LEADS], parallel=1)) == len(LEADS)
+
+
+def test_parquet_round_trip_keeps_scores_and_sidecar(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "results.parquet")
+    # Rows of a CSV batch share its columns
+    results = [
+        process_single_lead({"id": result.id, "company_name": result.company_name, "website": ""})
+        for result in sample_results()
+    ]
+
+    writer = ResultWriter(path, row_group_size=2)
+    for result in results:
+        writer.write(result)
+    writer.close(SUMMARY, METADATA)
+
+    data = load_results(path)
+    assert data["summary"] == SUMMARY
+    assert data["metadata"] == METADATA
+
+    # Enrichment plans are not stored; everything else round-trips
+    expected = [result.to_dict() for result in results]
+    for lead in expected:
+        del lead["enrichment_plan"]
+    assert data["leads"] == expected
+    assert [lead["qualification"]["weighted_total"] for lead in data["leads"]] == [
+        float(result.qualification.weighted_total) for result in results
+    ]
+
+
+def test_empty_parquet_output_is_valid(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "results.parquet")
+    ResultWriter(path).close(SUMMARY, METADATA)
+
+    assert load_results(path) == {"summary": SUMMARY, "metadata": METADATA, "leads": []}
+
+
+def test_parquet_rejects_columns_outside_the_first_row_group(tmp_path):
+    pytest.importorskip("pyarrow")
+    writer = ResultWriter(str(tmp_path / "results.parquet"), row_group_size=1)
+    writer.write({"id": "a"})
+
+    with pytest.raises(ValueError, match="website"):
+        writer.write({"id": "b", "website": "b.com"})
+    writer.abort()
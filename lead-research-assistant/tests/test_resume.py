@@ -0,0 +1,141 @@
+"""Tests for content-hash lead ids and resuming a batch from its checkpoint."""
+
+import csv
+import sys
+
+import pytest
+
+from batch_processor import (
+    LeadIds,
+    lead_id,
+    load_completed_ids,
+    load_leads_csv,
+    main,
+    process_batch,
+)
+from checkpoint_log import CheckpointLog, iter_compacted, read_checkpoint
+from result_writer import load_results
+
+FIELDS = ("company_name", "website", "industry", "contact_name", "contact_title")
+
+ROWS = [
+    ("Acme", "acme.com", "SaaS", "Ann Lee", "CTO"),
+    ("Globex", "globex.com", "Fintech", "Bo Chan", "VP Sales"),
+    ("Initech", "initech.com", "Technology", "", "Director"),
+    ("Umbrella", "", "Healthcare", "Cy Park", ""),
+]
+
+
+# Same lead repeated: two rows differ only in notes, one is an exact copy
+DUPLICATE_ROWS = [
+    ROWS[0] + ("call Monday",),
+    ROWS[1] + ("",),
+    ROWS[0] + ("call Friday",),
+    ROWS[0] + ("call Monday",),
+]
+
+
+def write_csv(path, rows, fields=FIELDS):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(rows)
+
+
+def test_lead_id_ignores_case_and_surrounding_whitespace():
+    lead = {"company_name": "Acme", "website": "acme.com"}
+    variant = {"company_name": "  ACME ", "website": "Acme.com", "notes": "ignored"}
+    assert lead_id(lead) == lead_id(variant)
+    assert lead_id(lead) != lead_id({"company_name": "Acme", "website": "acme.io"})
+
+
+def test_repeated_rows_get_their_own_ids():
+    ids = LeadIds()
+    leads = [{"company_name": "Acme", "notes": notes} for notes in ("a", "b", None)]
+    assigned = [ids.assign(lead) for lead in leads]
+
+    assert assigned[0] == lead_id(leads[0])
+    assert len(set(assigned)) == 3
+    assert [lead["id"] for lead in leads] == assigned
+
+
+def test_loaded_duplicates_keep_distinct_ids(tmp_path):
+    path = tmp_path / "leads.csv"
+    write_csv(path, DUPLICATE_ROWS, FIELDS + ("notes",))
+
+    leads = list(load_leads_csv(str(path)))
+
+    assert len(leads) == len(DUPLICATE_ROWS)
+    assert len({lead["id"] for lead in leads}) == len(DUPLICATE_ROWS)
+    assert leads[1]["id"] == lead_id(leads[1])
+
+
+def test_ids_survive_reordering_and_inserted_rows(tmp_path):
+    original = tmp_path / "leads.csv"
+    edited = tmp_path / "edited.csv"
+    write_csv(original, ROWS)
+    write_csv(edited, [ROWS[3], ("New Co", "new.co", "SaaS", "", ""), ROWS[1], ROWS[0], ROWS[2]])
+
+    before = {lead["company_name"]: lead["id"] for lead in load_leads_csv(str(original))}
+    after = {lead["company_name"]: lead["id"] for lead in load_leads_csv(str(edited))}
+
+    assert all(after[name] == old_id for name, old_id in before.items())
+
+
+def test_latest_record_decides_completion(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    with CheckpointLog(str(path), fresh=True) as log:
+        log.append({"id": "a", "status": "error"})
+        log.append({"id": "a", "status": "success"})
+        log.append({"id": "b", "status": "success"})
+        log.append({"id": "b", "status": "error"})
+
+    assert load_completed_ids(str(path)) == {"a"}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_resume_skips_leads_already_completed(tmp_path, streaming):
+    first = tmp_path / "first.csv"
+    edited = tmp_path / "edited.csv"
+    progress = tmp_path / "progress.jsonl"
+    write_csv(first, ROWS[:2])
+    # Completed rows move around and a new row is inserted between them
+    write_csv(edited, [ROWS[2], ROWS[1], ROWS[3], ROWS[0]])
+
+    process_batch(load_leads_csv(str(first)), parallel=1, progress_file=str(progress))
+    done = load_completed_ids(str(progress))
+    assert len(done) == 2
+
+    leads = load_leads_csv(str(edited))
+    if streaming:
+        leads = iter(list(leads))
+    results = process_batch(leads, parallel=1, progress_file=str(progress), resume=True)
+
+    assert sorted(result.company_name for result in results) == ["Initech", "Umbrella"]
+    assert not done & {result.id for result in results}
+    assert len(load_completed_ids(str(progress))) == 4
+    assert len(list(read_checkpoint(str(progress)))) == 4
+
+
+def test_resume_keeps_duplicate_rows(tmp_path, monkeypatch):
+    fields = FIELDS + ("notes",)
+    first = tmp_path / "first.csv"
+    full = tmp_path / "leads.csv"
+    progress = tmp_path / "progress.jsonl"
+    output = tmp_path / "results.json"
+    write_csv(first, DUPLICATE_ROWS[:2], fields)
+    write_csv(full, DUPLICATE_ROWS, fields)
+
+    # An interrupted run got through the first two rows
+    process_batch(load_leads_csv(str(first)), parallel=1, progress_file=str(progress))
+
+    argv = ["batch_processor.py", "--input", str(full), "--output", str(output)]
+    argv += ["--progress-file", str(progress), "--resume", "--parallel", "1"]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert main() == 0
+
+    data = load_results(str(output))
+    assert len(list(read_checkpoint(str(progress)))) == len(DUPLICATE_ROWS)
+    assert len(list(iter_compacted(str(progress)))) == len(DUPLICATE_ROWS)
+    assert len(data["leads"]) == len(DUPLICATE_ROWS)
+    assert data["summary"]["total_processed"] == len(DUPLICATE_ROWS)
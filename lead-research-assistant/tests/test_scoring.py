@@ -0,0 +1,229 @@
+"""Tests that the fast scoring paths match qualify_lead exactly."""
+
+import copy
+import json
+import pickle
+import random
+
+import pytest
+
+from conftest import icp_variants, make_companies
+from lead_qualification import (
+    DEFAULT_ICP_CRITERIA,
+    CompiledICP,
+    MemoizedICP,
+    MultiICPScorer,
+    SignalTable,
+    compile_icp,
+    extract_features,
+    qualify_lead,
+)
+from scorer_codegen import GeneratedICP, scorer_path
+from vector_scoring import (
+    batch_to_qualifications,
+    encode_companies,
+    qualify_leads_batch,
+    round_scores,
+)
+
+
+def same(actual, expected):
+    # Key order is part of the output JSON shape
+    return json.dumps(actual) == json.dumps(expected)
+
+
+def test_compiled_icp_matches_qualify_lead(companies, icp):
+    compiled = CompiledICP(icp)
+    for company in companies:
+        assert same(compiled.score(company), qualify_lead(company, icp)), company
+
+
+def walk_signals(data, signals, cap=100):
+    # The summation the score_* functions did before using SignalTable
+    score = 0
+    for signal, points in signals.items():
+        if data.get(signal):
+            score += points
+    return min(score, cap)
+
+
+@pytest.mark.parametrize("width", [1, 5, SignalTable.MAX_TABLE_BITS, SignalTable.MAX_TABLE_BITS + 3])
+def test_signal_table_matches_walking_the_signals(width):
+    rng = random.Random(width)
+    signals = {f"signal_{i}": rng.choice([0.5, 3, 7.25, 15, 40]) for i in range(width)}
+    table = SignalTable(signals)
+    assert (table.table is None) == (width > SignalTable.MAX_TABLE_BITS)
+
+    for _ in range(300):
+        data = {name: rng.choice([True, False, 0, 1, None, "yes"]) for name in signals}
+        assert table.score(data) == walk_signals(data, signals)
+        assert table.score_bits(table.encode(data)) == walk_signals(data, signals)
+    assert table.score({}) == 0
+
+
+def test_score_features_matches_score(companies, icp):
+    compiled = CompiledICP(icp)
+    for company in companies[:500]:
+        assert same(compiled.score_features(extract_features(company)), compiled.score(company))
+
+
+def test_qualify_lead_accepts_a_compiled_icp(companies):
+    compiled = CompiledICP()
+    for company in companies[:200]:
+        assert same(qualify_lead(company, compiled), qualify_lead(company))
+
+
+def test_compiled_scorers_for_other_icps_share_features(icp):
+    companies = make_companies(300, seed=1)
+    scorer = MultiICPScorer({"default": None, "variant": icp})
+    for company in companies:
+        default, variant = scorer.score_all(company)
+        assert same(default, qualify_lead(company))
+        assert same(variant, qualify_lead(company, icp))
+
+
+def test_vectorized_scoring_matches_qualify_lead(companies, icp):
+    np = pytest.importorskip("numpy")
+    batch = qualify_leads_batch(encode_companies(companies, icp), icp)
+
+    # Sub-scores come back as floats; values must be equal, not identical types
+    assert batch_to_qualifications(batch) == [qualify_lead(company, icp) for company in companies]
+    assert batch["weighted_total"].dtype == np.float64
+
+
+def test_vectorized_rounding_matches_python_round():
+    np = pytest.importorskip("numpy")
+    totals = [0.125, 0.135, 2.675, 44.995, 59.994999, 74.985, 1e-9]
+    assert round_scores(np.asarray(totals)).tolist() == [round(total, 2) for total in totals]
+
+
+def test_vectorized_rows_subset(companies):
+    pytest.importorskip("numpy")
+    batch = qualify_leads_batch(encode_companies(companies[:50]))
+    rows = [3, 0, 49]
+    assert batch_to_qualifications(batch, rows) == [qualify_lead(companies[i]) for i in rows]
+
+
+def test_generated_icp_matches_qualify_lead(companies, icp, tmp_path):
+    generated = GeneratedICP(icp, str(tmp_path))
+    for company in companies:
+        assert same(generated.score(company), qualify_lead(company, icp)), company
+
+
+def test_generated_scorer_is_cached_per_config(tmp_path):
+    cache_dir = str(tmp_path)
+    path = scorer_path(None, cache_dir)
+    GeneratedICP(None, cache_dir)
+    assert path.exists()
+
+    # A second load imports the cached module instead of rewriting it
+    written = path.stat().st_mtime_ns
+    GeneratedICP(None, cache_dir)
+    assert path.stat().st_mtime_ns == written
+
+    behavioral = {**DEFAULT_ICP_CRITERIA["behavioral"], "weight": 0.3}
+    other = {**DEFAULT_ICP_CRITERIA, "behavioral": behavioral}
+    assert scorer_path(other, cache_dir) != path
+
+
+def test_edited_cached_scorer_is_regenerated(tmp_path):
+    cache_dir = str(tmp_path)
+    path = scorer_path(None, cache_dir)
+    GeneratedICP(None, cache_dir)
+    original = path.read_text()
+
+    # Same size, so only the contents tell the files apart
+    path.write_text(original.replace("'tier': tier", "'tier': 'A' "))
+    company = make_companies(1, seed=2)[0]
+    assert same(GeneratedICP(None, cache_dir).score(company), qualify_lead(company))
+    assert path.read_text() == original
+
+
+def test_generated_icp_inlines_non_finite_constants(companies, tmp_path):
+    icp = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    firm = icp["firmographic"]["criteria"]
+    firm["company_size"]["ranges"]["enterprise"]["max"] = float("inf")
+    firm["revenue"]["ranges"]["small"]["min"] = float("-inf")
+    firm["industry_match"]["score_other"] = float("nan")
+    generated = GeneratedICP(icp, str(tmp_path))
+    for company in companies[:500]:
+        assert same(generated.score(company), qualify_lead(company, icp)), company
+
+
+def test_generated_icp_survives_pickling(tmp_path):
+    generated = GeneratedICP(None, str(tmp_path))
+    restored = pickle.loads(pickle.dumps(generated))
+    company = make_companies(1, seed=2)[0]
+    assert same(restored.score(company), qualify_lead(company))
+
+
+def test_memoized_icp_matches_qualify_lead(companies, icp, tmp_path):
+    for wrapped in (icp, GeneratedICP(icp, str(tmp_path))):
+        memo = MemoizedICP(wrapped)
+        # Repeats are served from the memo
+        for company in companies + companies[::5]:
+            assert same(memo.score(company), qualify_lead(company, icp)), company
+        assert memo.stats()["hits"] >= len(companies[::5])
+
+
+def test_memoized_icp_counts_hits_and_misses(companies):
+    memo = MemoizedICP()
+    distinct = {memo.fingerprint(company) for company in companies[:300]}
+
+    for company in companies[:300] * 3:
+        memo.score(company)
+
+    stats = memo.stats()
+    assert stats["misses"] == stats["entries"] == len(distinct)
+    assert stats["hits"] == 900 - len(distinct)
+    assert stats["hit_rate"] == pytest.approx(stats["hits"] / 900)
+    assert stats["evictions"] == 0
+
+
+def test_memoized_icp_evicts_least_recently_used():
+    memo = MemoizedICP(max_entries=2)
+    a, b, c = ({"company_name": name, "industry": name} for name in ("SaaS", "Retail", "AI"))
+
+    for company in (a, b, a, c):
+        memo.score(company)
+    assert memo.stats() == {"entries": 2, "hits": 1, "misses": 3, "hit_rate": 0.25, "evictions": 1}
+
+    # b was least recently used when c arrived; a was refreshed by its hit
+    memo.score(a)
+    assert memo.stats()["hits"] == 2
+    memo.score(b)
+    assert memo.stats()["misses"] == 4
+    assert memo.stats()["evictions"] == 2
+
+
+def test_memoized_results_are_independent_copies(companies):
+    memo = MemoizedICP()
+    first = memo.score(companies[0])
+    first["tier"] = "edited"
+    first["firmographic"]["total"] = -1
+
+    second = memo.score(companies[0])
+    assert memo.stats()["hits"] == 1
+    assert same(second, qualify_lead(companies[0]))
+    assert second["behavioral"] is not memo.score(companies[0])["behavioral"]
+
+
+def test_memoized_icp_is_accepted_as_icp_criteria(companies):
+    icp = dict(icp_variants())["reweighted"]
+    memo = MemoizedICP(icp)
+    assert compile_icp(memo) is memo
+    assert memo.criteria is icp
+    assert MemoizedICP(memo).icp is memo.icp
+    for company in companies[:100]:
+        assert same(qualify_lead(company, memo), qualify_lead(company, icp))
+
+
+def test_memoized_icp_pickles_with_an_empty_memo(companies):
+    memo = MemoizedICP()
+    for company in companies[:50]:
+        memo.score(company)
+
+    restored = pickle.loads(pickle.dumps(memo))
+    assert restored.stats()["entries"] == 0
+    assert restored.max_entries == memo.max_entries
+    assert same(restored.score(companies[0]), qualify_lead(companies[0]))
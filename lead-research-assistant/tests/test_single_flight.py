@@ -0,0 +1,118 @@
+"""Tests for coalescing concurrent MCP calls with SingleFlightMCPClient."""
+
+import asyncio
+import threading
+
+from lead_enrichment import generate_enrichment_plan
+from mcp_client import SingleFlightMCPClient, execute_plan_async
+
+
+class GatedClient:
+    """Client whose calls block until released, so callers overlap."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def call_tool(self, tool, params):
+        with self.lock:
+            self.calls.append(params)
+        self.release.wait(timeout=5)
+        return {"tool": tool, "data": dict(params)}
+
+    async def acall_tool(self, tool, params):
+        self.calls.append(params)
+        await asyncio.sleep(0.05)
+        return {"tool": tool, "data": dict(params)}
+
+
+def call_concurrently(client, calls):
+    results = [None] * len(calls)
+
+    def run(i, tool, params):
+        results[i] = client.call_tool(tool, params)
+
+    threads = [
+        threading.Thread(target=run, args=(i, tool, params)) for i, (tool, params) in enumerate(calls)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def finish(gated, threads, expected_calls):
+    # Let every caller reach the client (or start waiting) before releasing
+    for _ in range(100):
+        with gated.lock:
+            if len(gated.calls) >= expected_calls:
+                break
+        threading.Event().wait(0.01)
+    threading.Event().wait(0.05)
+    gated.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_duplicate_company_calls_are_coalesced():
+    gated = GatedClient()
+    client = SingleFlightMCPClient(gated)
+    params = [{"website": "https://acme.com"}, {"website": "www.acme.com"}]
+
+    threads, results = call_concurrently(client, [("web_data_reuter_news", p) for p in params])
+    finish(gated, threads, 1)
+
+    assert len(gated.calls) == 1
+    assert results[0] is results[1]
+    assert client.stats() == {"calls": 1, "coalesced": 1}
+
+
+def test_same_name_contacts_at_different_companies_are_not_merged():
+    gated = GatedClient()
+    client = SingleFlightMCPClient(gated)
+    acme = {"name": "John Smith", "company": "Acme", "website": "acme.com"}
+    globex = {"name": "John Smith", "company": "Globex", "website": "globex.com"}
+
+    threads, results = call_concurrently(
+        client, [("web_data_x_posts", acme), ("web_data_x_posts", globex)]
+    )
+    finish(gated, threads, 2)
+
+    assert len(gated.calls) == 2
+    assert results[0]["data"]["company"] == "Acme"
+    assert results[1]["data"]["company"] == "Globex"
+    assert client.stats()["coalesced"] == 0
+
+
+def test_contacts_without_employer_are_passed_through():
+    gated = GatedClient()
+    client = SingleFlightMCPClient(gated)
+
+    threads, _ = call_concurrently(
+        client, [("web_data_x_posts", {"name": "John Smith"})] * 2
+    )
+    finish(gated, threads, 2)
+
+    assert len(gated.calls) == 2
+    assert client.stats() == {"calls": 2, "coalesced": 0}
+
+
+def test_async_plans_for_same_name_contacts_are_not_merged():
+    gated = GatedClient()
+    client = SingleFlightMCPClient(gated)
+    leads = [
+        {"id": "lead_1", "company_name": "Acme", "contact_name": "John Smith"},
+        {"id": "lead_2", "company_name": "Globex", "contact_name": "John Smith"},
+    ]
+
+    async def run():
+        return await asyncio.gather(
+            *(execute_plan_async(generate_enrichment_plan(lead), client) for lead in leads)
+        )
+
+    responses = asyncio.run(run())
+
+    for lead, lead_responses in zip(leads, responses):
+        posts = [r for r in lead_responses if r["tool"] == "web_data_x_posts"]
+        assert [r["data"]["company"] for r in posts] == [lead["company_name"]]
+    assert client.stats()["coalesced"] == 0
@@ -0,0 +1,135 @@
+"""Tests that streaming modes give the same output as non-streaming runs."""
+
+import csv
+import json
+import sys
+from datetime import date
+
+import pytest
+
+import batch_processor
+import lead_qualification
+from conftest import make_companies
+from lead_qualification import qualification_record, run_stream
+from result_writer import load_results
+
+LEAD_COLUMNS = ("company_name", "website", "industry", "contact_name", "contact_title", "notes")
+
+
+def write_jsonl(path, companies):
+    lines = [json.dumps(company) for company in companies]
+    # Blank lines are skipped; bad records yield an error line in place
+    lines[3:3] = ["", "not json", "[1, 2]"]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def expected_lines(path):
+    today = date.today().isoformat()
+    lines = []
+    for number, text in enumerate(path.read_text().splitlines(), 1):
+        if not text.strip():
+            continue
+        try:
+            company = json.loads(text)
+            if not isinstance(company, dict):
+                raise ValueError("record is not a JSON object")
+            lines.append(json.dumps(qualification_record(company, None, today)))
+        except ValueError as e:
+            lines.append(json.dumps({"line": number, "error": str(e)}))
+    return lines
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_jsonl_stream_matches_scoring_each_record(tmp_path, workers):
+    source = tmp_path / "companies.jsonl"
+    output = tmp_path / "scores.jsonl"
+    write_jsonl(source, make_companies(700, seed=6))
+
+    stats = run_stream(str(source), str(output), None, workers, chunk_size=64)
+
+    assert output.read_text().splitlines() == expected_lines(source)
+    assert stats["records"] == 702
+    assert stats["errors"] == 2
+
+
+def test_qualification_cli_streams_jsonl(tmp_path, monkeypatch):
+    source = tmp_path / "companies.jsonl"
+    output = tmp_path / "scores.jsonl"
+    write_jsonl(source, make_companies(300, seed=7))
+
+    argv = ["lead_qualification.py", "--input", str(source), "--output", str(output)]
+    monkeypatch.setattr(sys, "argv", argv + ["--chunk-size", "50"])
+    assert lead_qualification.main() == 0
+
+    assert output.read_text().splitlines() == expected_lines(source)
+
+
+def lead_rows(count):
+    industries = ["SaaS", "Retail", "Fintech", "", "Software", "Healthcare"]
+    return [
+        (
+            f"Company {i}",
+            f"company{i}.com" if i % 3 else "",
+            industries[i % len(industries)],
+            f"Contact {i}" if i % 2 else "",
+            "CTO" if i % 5 else "",
+            "repeat" if i % 13 == 0 else "",
+        )
+        for i in range(count)
+    ]
+
+
+def write_leads(path, rows):
+    if path.suffix == ".csv":
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(LEAD_COLUMNS)
+            writer.writerows(rows)
+    elif path.suffix == ".xlsx":
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(LEAD_COLUMNS)
+        for row in rows:
+            sheet.append([value or None for value in row])
+        workbook.save(path)
+    else:
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        columns = {name: [row[i] or None for row in rows] for i, name in enumerate(LEAD_COLUMNS)}
+        pq.write_table(pa.table(columns), path)
+
+
+def run_batch(monkeypatch, source, output, *extra):
+    argv = ["batch_processor.py", "--input", str(source), "--output", str(output)]
+    monkeypatch.setattr(sys, "argv", argv + ["--parallel", "2", "--no-subscores", *extra])
+    assert batch_processor.main() == 0
+    data = load_results(str(output))
+    for lead in data["leads"]:
+        del lead["processed_at"]
+    return data
+
+
+def by_id(leads):
+    return sorted(leads, key=lambda lead: lead["id"])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".xlsx", ".parquet"])
+def test_batch_stream_matches_loading_the_input(tmp_path, monkeypatch, suffix):
+    source = tmp_path / f"leads{suffix}"
+    rows = lead_rows(120)
+    # A repeated row must be kept in both modes
+    write_leads(source, rows + rows[:1])
+
+    loaded = run_batch(monkeypatch, source, tmp_path / "loaded.json", "--no-excel-cache")
+    streamed = run_batch(monkeypatch, source, tmp_path / "streamed.json", "--stream")
+
+    # Results arrive in completion order
+    assert by_id(streamed["leads"]) == by_id(loaded["leads"])
+    assert len(streamed["leads"]) == len(rows) + 1
+
+    # Leads with tied scores may swap places in top_leads
+    summary, expected = streamed["summary"], loaded["summary"]
+    top, expected_top = summary.pop("top_leads"), expected.pop("top_leads")
+    assert summary == expected
+    assert [lead["score"] for lead in top] == [lead["score"] for lead in expected_top]
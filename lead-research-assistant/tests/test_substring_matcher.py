@@ -0,0 +1,64 @@
+"""Tests that SubstringMatcher agrees with a linear substring scan."""
+
+import random
+
+import pytest
+
+from lead_qualification import SubstringMatcher
+
+
+def random_words(rng, count, alphabet="abcde ", max_len=8):
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, max_len))) for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("pattern_count", [3, 32, 33, 200])
+def test_matches_linear_scan(pattern_count):
+    rng = random.Random(pattern_count)
+    patterns = random_words(rng, pattern_count)
+    matcher = SubstringMatcher(patterns)
+    assert matcher.indexed == (pattern_count > SubstringMatcher.MIN_INDEXED_PATTERNS)
+
+    texts = random_words(rng, 2000, max_len=12) + patterns + [""]
+    for text in texts:
+        assert matcher.found_in(text) == any(p in text for p in patterns), text
+        assert matcher.is_substring(text) == any(text in p for p in patterns), text
+
+
+def test_industry_names():
+    industries = [f"vertical {i}" for i in range(40)] + ["saas", "fintech", "health tech"]
+    matcher = SubstringMatcher(industries)
+    assert matcher.indexed
+
+    assert matcher.found_in("b2b saas platform")
+    assert matcher.found_in("digital health technology")
+    assert not matcher.found_in("retail")
+    assert matcher.is_substring("tech")
+    assert matcher.is_substring("vertical 3")
+    assert not matcher.is_substring("saas platform")
+
+
+def test_text_spanning_two_patterns_is_not_a_substring():
+    patterns = [f"p{i:02d}" for i in range(40)]
+    matcher = SubstringMatcher(patterns)
+    # "01p02" only occurs across the boundary of the joined patterns
+    assert not matcher.is_substring("01p02")
+    assert not matcher.is_substring("01" + SubstringMatcher.SEPARATOR + "p02")
+
+
+def test_empty_pattern_matches_everything():
+    patterns = [""] + [f"p{i:02d}" for i in range(40)]
+    matcher = SubstringMatcher(patterns)
+    assert matcher.found_in("anything")
+    assert matcher.found_in("")
+    assert matcher.is_substring("")
+
+
+def test_non_ascii_text():
+    patterns = [f"région {i}" for i in range(40)] + ["österreich", "東京"]
+    matcher = SubstringMatcher(patterns)
+    assert matcher.found_in("wien, österreich")
+    assert matcher.found_in("東京都")
+    assert matcher.is_substring("gion 1")
+    assert not matcher.found_in("osterreich")
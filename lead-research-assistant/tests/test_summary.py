@@ -0,0 +1,76 @@
+"""Tests that merged shard summaries agree with a single pass."""
+
+import bisect
+
+import pytest
+
+from batch_processor import SUMMARY_PERCENTILES, SummaryAccumulator
+from conftest import make_companies
+from lead_qualification import qualify_lead
+from lead_records import LeadResult, Scores
+from lead_table import LeadTable
+
+EXACT_FIELDS = ("total_processed", "successful", "errors", "tier_distribution", "top_leads")
+
+
+def sample_results(count, seed=0):
+    results = []
+    for i, company in enumerate(make_companies(count, seed)):
+        lead = {"id": f"lead_{i:016x}", "company_name": f"Company {i}"}
+        if i % 17 == 0:
+            results.append(LeadResult(lead, status="error", error="lookup failed"))
+        else:
+            scores = Scores.from_dict(qualify_lead(company))
+            results.append(LeadResult(lead, qualification=scores, status="success"))
+    return results
+
+
+def accumulate(results):
+    acc = SummaryAccumulator()
+    for result in results:
+        acc.add(result)
+    return acc
+
+
+def rank_error(sorted_scores, value, fraction):
+    # Distance from the target fraction to the value's rank interval (ties)
+    low = bisect.bisect_left(sorted_scores, value) / len(sorted_scores)
+    high = bisect.bisect_right(sorted_scores, value) / len(sorted_scores)
+    return max(low - fraction, fraction - high, 0)
+
+
+@pytest.mark.parametrize("cuts", [(1000,), (1, 2500, 2501, 4000), (700, 1400, 2100, 2800, 3500)])
+def test_merged_shards_match_a_single_pass(cuts):
+    results = sample_results(4000)
+    bounds = (0,) + cuts + (len(results),)
+    shards = [accumulate(results[a:b]) for a, b in zip(bounds, bounds[1:])]
+    # Shards also travel between workers as serialized state
+    shards[-1] = SummaryAccumulator.from_state(shards[-1].to_state())
+
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    single = accumulate(results)
+
+    expected, actual = single.to_summary(), merged.to_summary()
+    for field in EXACT_FIELDS:
+        assert actual[field] == expected[field], field
+    assert actual["avg_score"] == pytest.approx(expected["avg_score"], abs=0.01)
+
+    scores = sorted(r.qualification.weighted_total for r in results if r.status == "success")
+    fractions = [pct / 100 for pct in SUMMARY_PERCENTILES]
+    for fraction, value in zip(fractions, merged.score_sketch.quantiles(fractions)):
+        assert rank_error(scores, value, fraction) <= 0.02, fraction
+
+
+def test_add_table_matches_adding_rows():
+    results = sample_results(1500, seed=1)
+    table = LeadTable.from_results(result.to_dict() for result in results[500:])
+
+    by_table = accumulate(results[:500])
+    by_table.add_table(table)
+    by_row = accumulate(results)
+
+    expected, actual = by_row.to_summary(), by_table.to_summary()
+    for field in EXACT_FIELDS:
+        assert actual[field] == expected[field], field
@@ -0,0 +1,158 @@
+"""Tests that what-if weightings agree with qualifying under those weights."""
+
+import copy
+
+import pytest
+
+from conftest import make_companies
+from lead_qualification import DEFAULT_ICP_CRITERIA, TIER_THRESHOLDS, qualify_lead
+from rescore import top_indices
+from subscore_store import subscore_row
+
+np = pytest.importorskip("numpy")
+
+from whatif import WeightModel, _take_top, distinct_rows, evaluate, parse_sweep  # noqa: E402
+
+CATEGORIES = ("firmographic", "technographic", "behavioral", "strategic")
+TIERS = [tier for tier, _ in TIER_THRESHOLDS] + ["D"]
+SWEEPS = {
+    "firmographic": [0.2, 0.35, 0.5],
+    "behavioral.buying_intent": [0.1, 0.6],
+    "firmographic.industry_match": [0.05, 0.25],
+}
+
+
+def weighted_icp(assignment):
+    icp = copy.deepcopy(DEFAULT_ICP_CRITERIA)
+    for name, value in assignment.items():
+        category, _, criterion = name.partition(".")
+        if criterion:
+            icp[category]["criteria"][criterion]["weight"] = value
+        else:
+            icp[category]["weight"] = value
+    return icp
+
+
+def qualify_all(companies, icp):
+    # Unrounded totals and tiers, as the matrix product computes them
+    totals, tiers = [], []
+    for company in companies:
+        result = qualify_lead(company, icp)
+        totals.append(sum(result[category]["weighted"] for category in CATEGORIES))
+        tiers.append(result["tier"])
+    return np.asarray(totals), tiers
+
+
+@pytest.fixture(scope="module")
+def companies():
+    return make_companies(1500, seed=8)
+
+
+@pytest.fixture(scope="module")
+def matrix(companies):
+    return np.asarray([subscore_row(qualify_lead(company)) for company in companies])
+
+
+def test_evaluate_matches_qualifying_with_each_weighting(companies, matrix):
+    model = WeightModel()
+    categories, criteria, assignments = model.grid(SWEEPS)
+    weights = model.effective(categories, criteria)
+    baseline = model.effective(model.category_weights[None, :], model.criterion_weights[None, :])[0]
+    top_k = 50
+
+    report = evaluate(matrix, weights, baseline, top_k)
+
+    baseline_totals, baseline_tiers = qualify_all(companies, None)
+    assert report["baseline_tier_counts"].tolist() == [baseline_tiers.count(t) for t in TIERS]
+    assert report["baseline_top_k"] == top_indices(baseline_totals, top_k)
+    assert len(assignments) == 12
+
+    for i, assignment in enumerate(assignments):
+        totals, tiers = qualify_all(companies, weighted_icp(assignment))
+        assert report["tier_counts"][i].tolist() == [tiers.count(t) for t in TIERS], assignment
+        changed = sum(tier != before for tier, before in zip(tiers, baseline_tiers))
+        assert report["tier_changes"][i] == changed, assignment
+        assert report["avg_score"][i] == pytest.approx(totals.mean())
+        overlap = set(top_indices(totals, top_k)) & set(report["baseline_top_k"])
+        assert report["top_k_overlap"][i] == len(overlap), assignment
+
+
+def test_evaluate_blocks_and_duplicates_match_scoring_each_lead(matrix):
+    model = WeightModel()
+    categories, criteria, _ = model.random_categories(40, seed=3)
+    weights = model.effective(categories, criteria)
+    baseline = weights[0]
+    # Repeated rows share a distinct row but still count once per lead
+    leads = np.concatenate([matrix, matrix[::7]])
+
+    report = evaluate(leads, weights, baseline, top_k=25, max_cells=1000)
+
+    totals = leads @ weights.T
+    base = leads @ baseline
+    minimums = np.asarray([minimum for _, minimum in TIER_THRESHOLDS])
+    levels = (totals[:, :, None] >= minimums).sum(axis=2)
+    base_levels = (base[:, None] >= minimums).sum(axis=1)
+    assert report["distinct_rows"] < len(leads)
+    for i in range(len(weights)):
+        counts = np.bincount(len(minimums) - levels[:, i], minlength=len(TIERS))
+        assert report["tier_counts"][i].tolist() == counts.tolist()
+        assert report["tier_changes"][i] == (levels[:, i] != base_levels).sum()
+        assert report["avg_score"][i] == pytest.approx(totals[:, i].mean())
+        overlap = set(top_indices(totals[:, i], 25)) & set(report["baseline_top_k"])
+        assert report["top_k_overlap"][i] == len(overlap)
+    assert report["baseline_top_k"] == top_indices(base, 25)
+
+
+@pytest.mark.parametrize("packed", [True, False], ids=["packed_keys", "unique_rows"])
+def test_distinct_rows_reconstruct_the_matrix(matrix, packed):
+    if not packed:
+        # Too many distinct values per column to pack a row into 63 bits
+        rng = np.random.default_rng(0)
+        matrix = np.concatenate([matrix, rng.random(matrix.shape)])
+
+    distinct, inverse, counts = distinct_rows(matrix)
+
+    assert len({tuple(row) for row in distinct.tolist()}) == len(distinct)
+    assert (distinct[inverse] == matrix).all()
+    assert counts.tolist() == np.bincount(inverse, minlength=len(distinct)).tolist()
+
+
+@pytest.mark.parametrize("top_k", [0, 1, 7, 60, 500])
+def test_take_top_matches_ranking_every_lead(top_k):
+    rng = np.random.default_rng(top_k)
+    rows, width = 40, 6
+    # Few total values, so ties across rows are common
+    totals = rng.integers(0, 6, size=(rows, width)).astype(np.float64)
+    inverse = rng.integers(0, rows, size=150)
+    inverse[:rows] = np.arange(rows)
+    rng.shuffle(inverse)
+    counts = np.bincount(inverse, minlength=rows)
+    by_row = np.argsort(inverse, kind="stable")
+    row_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    taken = _take_top(totals, counts, by_row, row_start, top_k)
+
+    for j in range(width):
+        top = top_indices(totals[inverse, j], top_k)
+        expected = np.bincount(inverse[top], minlength=rows)
+        assert taken[:, j].tolist() == expected.tolist(), j
+
+
+def test_parse_sweep_ranges_and_lists():
+    assert parse_sweep("firmographic=0.2:0.5:0.05") == (
+        "firmographic",
+        [0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5],
+    )
+    assert parse_sweep(" strategic =0.1,0.3") == ("strategic", [0.1, 0.3])
+    assert parse_sweep("behavioral=0.3:0.3:0.1") == ("behavioral", [0.3])
+
+
+@pytest.mark.parametrize("value", ["firmographic", "firmographic=", "firmographic=0.1:0.5:0"])
+def test_parse_sweep_rejects_bad_specs(value):
+    with pytest.raises(ValueError):
+        parse_sweep(value)
+
+
+def test_grid_rejects_unknown_weights():
+    with pytest.raises(ValueError, match="Unknown weight"):
+        WeightModel().grid({"firmographic.headcount": [0.1]})